@@ -46,6 +46,9 @@ from .blob import (
     BlobSummaryResult,
     StorageType,
 )
+from .blob_cache import BlobCache, blob_cache
+from .blob_file import BlobFile
+from .blob_sync import BlobSyncResult, sync_blobs
 from .event_api_destination import (
     EventApiDestination,
     EventApiDestinationCollection,
@@ -82,6 +85,8 @@ from .image_upload import (
     OverviewResampler,
 )
 from .image_collection import ImageCollection
+from .image_index import ImageIndex
+from .image_store import ImageStore, sync_images
 from .search import (
     AggregateDateField,
     GeoSearch,
@@ -89,13 +94,22 @@ from .search import (
     Search,
     SummarySearchMixin,
 )
+from .bulk import (
+    BulkSaveError,
+    BulkSaveResult,
+    BulkUploadResult,
+    bulk_save,
+    bulk_upload,
+)
 from .catalog_base import (
     AuthCatalogObject,
     CatalogClient,
     CatalogObject,
     DeletedObjectError,
+    GetManyError,
     UnsavedObjectError,
 )
+from .metadata_cache import MetadataCache, metadata_cache
 from .named_catalog_base import NamedCatalogObject
 from .attributes import (
     AttributeValidationError,
@@ -118,10 +132,19 @@ __all__ = [
     "BandCollection",
     "BandType",
     "Blob",
+    "blob_cache",
+    "BlobCache",
     "BlobCollection",
     "BlobDeletionTaskStatus",
+    "BlobFile",
     "BlobSearch",
     "BlobSummaryResult",
+    "BlobSyncResult",
+    "bulk_save",
+    "BulkSaveError",
+    "BulkSaveResult",
+    "bulk_upload",
+    "BulkUploadResult",
     "CatalogClient",
     "CatalogObject",
     "ClassBand",
@@ -154,9 +177,12 @@ __all__ = [
     "File",
     "GenericBand",
     "GeoSearch",
+    "GetManyError",
     "Image",
     "ImageCollection",
+    "ImageIndex",
     "ImageSearch",
+    "ImageStore",
     "ImageUpload",
     "ImageUploadEvent",
     "ImageUploadEventSeverity",
@@ -167,6 +193,8 @@ __all__ = [
     "ImageSummaryResult",
     "Interval",
     "MaskBand",
+    "metadata_cache",
+    "MetadataCache",
     "MicrowaveBand",
     "NamedCatalogObject",
     "NewImageEventSubscription",
@@ -188,6 +216,8 @@ __all__ = [
     "StorageState",
     "StorageType",
     "SummarySearchMixin",
+    "sync_blobs",
+    "sync_images",
     "TaskState",
     "UnsavedObjectError",
 ]
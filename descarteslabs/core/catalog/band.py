@@ -19,6 +19,7 @@ from strenum import StrEnum
 from ..common.collection import Collection
 from ..common.property_filtering import Properties
 from .catalog_base import _new_abstract_class
+from .metadata_cache import BANDS_BY_PRODUCT, metadata_cache
 from .named_catalog_base import NamedCatalogObject
 from .attributes import (
     Attribute,
@@ -534,6 +535,7 @@ class Band(NamedCatalogObject):
     _url = "/bands"
     _derived_type_switch = "type"
     _default_includes = ["product"]
+    _cache_metadata = True
     # _collection_type set below due to circular problems
 
     description = Attribute(doc="str, optional: " + _DOC_DESCRIPTION)
@@ -663,6 +665,12 @@ class Band(NamedCatalogObject):
             search = search.filter(properties.type == cls._derived_type)
         return search
 
+    @classmethod
+    def _invalidate_cached_metadata(cls, id):
+        super(Band, cls)._invalidate_cached_metadata(id)
+        # band ids are prefixed with the product id
+        metadata_cache.invalidate(BANDS_BY_PRODUCT, id.rpartition(":")[0])
+
 
 class BandCollection(Collection):
     _item_type = Band
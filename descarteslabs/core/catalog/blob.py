@@ -12,11 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import hashlib
 import io
+import itertools
+import os
+import tempfile
+import threading
 
+import requests.exceptions
 from strenum import StrEnum
 
-from descarteslabs.exceptions import NotFoundError
+from descarteslabs.exceptions import ForbiddenError, NotFoundError
 
 from ..client.services.service import ThirdPartyService
 from ..common.collection import Collection
@@ -30,7 +37,9 @@ from .attributes import (
     TypedAttribute,
     parse_iso_datetime,
 )
+from .blob_cache import blob_cache
 from .blob_download import BlobDownload
+from .blob_file import BlobFile
 from .catalog_base import (
     AuthCatalogObject,
     CatalogClient,
@@ -41,10 +50,64 @@ from .catalog_base import (
 )
 from .search import AggregateDateField, GeoSearch, SummarySearchMixin
 from .task import TaskStatus
+from .transfer import DOWNLOAD_EXCEPTIONS, call_with_retries, md5_file
 
 properties = Properties()
 
 
+class _UploadSource(object):
+    """The binary source of a blob upload, hashed as it is read.
+
+    The source is read in large parts rather than in the small blocks requested
+    by the HTTP connection, and the MD5 hash of the data is computed in the same
+    pass.  A seekable source can be rewound to where the upload started, so
+    that the upload can be retried.
+    """
+
+    # the size of the parts in which the source is read
+    _PART_SIZE = 1024 * 1024
+
+    def __init__(self, src):
+        if isinstance(src, bytes):
+            src = io.BytesIO(src)
+        self._src = src
+        self._md5 = hashlib.md5()
+        self._count = 0
+        try:
+            self._start = src.tell()
+            self._size = src.seek(0, io.SEEK_END) - self._start
+            src.seek(self._start)
+        except (OSError, ValueError):
+            self._start = self._size = None
+
+    @property
+    def len(self):
+        # the content length used by requests, None if the source is not seekable
+        return self._size
+
+    def read(self, size=-1):
+        data = self._src.read(max(size, self._PART_SIZE) if size >= 0 else size)
+        self._md5.update(data)
+        self._count += len(data)
+        return data
+
+    @property
+    def rewindable(self):
+        """bool: Whether the source can be read again."""
+        return self._start is not None
+
+    def rewind(self):
+        """Return to where the upload started, if anything was read."""
+        if self._count:
+            self._src.seek(self._start)
+            self._md5 = hashlib.md5()
+            self._count = 0
+
+    def hexdigest(self):
+        """The MD5 hash of the data read."""
+        return self._md5.hexdigest()
+
+
 class StorageType(StrEnum):
     """The storage type for a blob.
 
@@ -449,7 +512,7 @@ class Blob(AuthCatalogObject):
         )
 
     @check_deleted
-    def upload(self, file):
+    def upload(self, file, retries=3):
         """Uploads storage blob from a file.
 
         Uploads data from a file and creates the Blob.
@@ -458,7 +521,8 @@ class Blob(AuthCatalogObject):
         The `storage_state`, `storage_type`, `namespace`, and the `name` attributes,
         must all be set. If either the `size_bytes` and the `hash` attributes are set,
         they must agree with the actual file to be uploaded, and will be validated
-        during the upload process.
+        during the upload process. The MD5 hash of the file is computed as it is
+        uploaded, and is used as the `hash` if that attribute is not set.
 
         On return, the Blob object will be updated to reflect the full state of the
         new blob.
@@ -470,6 +534,9 @@ class Blob(AuthCatalogObject):
             local filesystem, or a file-like object (``io.IOBase``). If a file like
             object and already open, must be binary mode and readable. Open file-like
             objects remain open on return and must be closed by the caller.
+        retries : int, optional
+            The number of times the transfer is retried after a transient failure.
+            A file-like object is only retried if it is seekable.  Defaults to 3.
 
         Returns
         -------
@@ -501,23 +568,26 @@ class Blob(AuthCatalogObject):
         if isinstance(file, str):
             file = io.open(file, "rb")
             close = True
-        elif isinstance(file, io.IOBase):
+        elif isinstance(file, (io.IOBase, tempfile.SpooledTemporaryFile)):
+            # a SpooledTemporaryFile is only an IOBase as of Python 3.11
             close = file.closed
             if close:
                 file = io.open(file.name, "rb")
-            elif not file.readable() or "b" not in file.mode:
+            elif "b" not in file.mode or not (
+                isinstance(file, tempfile.SpooledTemporaryFile) or file.readable()
+            ):
                 raise ValueError("Invalid file is open but not readable or binary mode")
         else:
             raise ValueError("Invalid file value: must be string or IOBase")
 
         try:
-            return self._do_upload(file)
+            return self._do_upload(file, retries=retries)
         finally:
             if close:
                 file.close()
 
     @check_deleted
-    def upload_data(self, data):
+    def upload_data(self, data, retries=3):
         """Uploads storage blob from a bytes or str.
 
         Uploads data from a string or bytes and creates the Blob.
@@ -526,7 +596,8 @@ class Blob(AuthCatalogObject):
         The `storage_state`, `storage_type`, `namespace`, and the `name` attributes,
         must all be set. If either the `size_bytes` and the `hash` attributes are set,
         they must agree with the actual data to be uploaded, and will be validated
-        during the upload process.
+        during the upload process. The MD5 hash of the data is computed as it is
+        uploaded, and is used as the `hash` if that attribute is not set.
 
         On return, the Blob object will be updated to reflect the full state of the
         new blob.
@@ -535,6 +606,9 @@ class Blob(AuthCatalogObject):
         ----------
         data : str or bytes
             Data to be uploaded. A str will be default encoded to bytes.
+        retries : int, optional
+            The number of times the transfer is retried after a transient failure.
+            Defaults to 3.
 
         Returns
         -------
@@ -568,10 +642,10 @@ class Blob(AuthCatalogObject):
         elif not isinstance(data, bytes):
             raise ValueError("Invalid data value: must be string or bytes")
 
-        return self._do_upload(data)
+        return self._do_upload(data, retries=retries)
 
     # the upload implementation is broken out so it can be used from multiple methods
-    def _do_upload(self, src):
+    def _do_upload(self, src, retries=0):
         # import here for circular dependency
         from .blob_upload import BlobUpload
 
@@ -593,8 +667,28 @@ class Blob(AuthCatalogObject):
         # if upload.storage.hash:
         #     headers["content-md5"] = upload.storage.hash
 
-        # do the upload
-        self._url_client.session.put(upload.resumable_url, data=src, headers=headers)
+        # do the upload, hashing the data as it is sent
+        source = _UploadSource(src)
+
+        def put():
+            # a retry sends the whole source again
+            source.rewind()
+            self._url_client.session.put(
+                upload.resumable_url, data=source, headers=headers
+            )
+
+        call_with_retries(put, retries if source.rewindable else 0)
+
+        digest = source.hexdigest()
+        if upload.storage.hash:
+            if upload.storage.hash.lower() != digest:
+                raise ValueError(
+                    "Blob {} hash {} does not match the hash {} of the uploaded data".format(
+                        self.id, upload.storage.hash, digest
+                    )
+                )
+        else:
+            upload.storage.hash = digest
 
         # save the blob
         upload.storage.save(request_params={"upload_signature": upload.signature})
@@ -609,7 +703,7 @@ class Blob(AuthCatalogObject):
         return self
 
     @check_deleted
-    def download(self, file, range=None):
+    def download(self, file, range=None, parallel=None, part_size=None, retries=3):
         """Downloads storage blob to a file.
 
         Downloads data from the blob to a file.
@@ -630,40 +724,77 @@ class Blob(AuthCatalogObject):
             (e.g. ``((0, 99), (200-299))``). A list or tuple of one integer implies
             no upper bound; in this case the integer can be negative, indicating the
             count back from the end of the blob.
+        parallel : int, optional
+            The number of parts of the blob downloaded concurrently, each with its
+            own HTTP range request, and written to the file at its offset.  The file
+            must be seekable.  Ignored if `range` is given.  Defaults to
+            downloading the blob as a single stream.
+        part_size : int, optional
+            The size in bytes of the parts of the blob when `parallel` is given.
+            Defaults to a size giving each download several parts, of at least
+            8 MiB.
+        retries : int, optional
+            The number of times the download of a part is retried after a transient
+            failure when `parallel` is given.  Defaults to 3.
 
         Returns
         -------
         str
-            The name of the downloaded file.
+            The name of the downloaded file, or ``None`` for a file object without
+            a name, such as an `io.BytesIO`.
 
         Raises
         ------
         ValueError
-            If any improper arguments are supplied.
+            If any improper arguments are supplied, or if the downloaded data does
+            not match the `hash` of the blob when `parallel` is given.
         DeletedObjectError
             If this blob was deleted.
+
+        Example
+        -------
+        >>> from descarteslabs.catalog import Blob
+        >>> blob = Blob.get(name="model.bin", namespace="my-namespace") # doctest: +SKIP
+        >>> blob.download("model.bin", parallel=8) # doctest: +SKIP
+        'model.bin'
         """
         if self.state != DocumentState.SAVED:
             raise ValueError("Blob {} has not been saved".format(self.id))
 
+        close = False
         if isinstance(file, str):
             file = io.open(file, "wb")
+            close = True
         elif isinstance(file, io.IOBase):
             close = file.closed
             if close:
                 file = io.open(file.name, "wb")
-            elif not file.writable() or "b" not in file.mode:
+            elif not file.writable() or isinstance(file, io.TextIOBase):
                 raise ValueError("Invalid file is open but not writable or binary mode")
         else:
             raise ValueError("Invalid file value: must be string or IOBase")
 
-        return self._do_download(dest=file, range=range)
+        try:
+            if (
+                parallel
+                and parallel > 1
+                and range is None
+                and self.size_bytes
+                and file.seekable()
+            ):
+                return self._do_parallel_download(file, parallel, part_size, retries)
+            return self._do_download(dest=file, range=range)
+        finally:
+            if close:
+                file.close()
 
     @check_deleted
     def data(self, range=None):
         """Downloads storage blob data.
 
-        Downloads data from the blob and returns as a bytes object.
+        Downloads data from the blob and returns as a bytes object.  When the
+        :py:class:`~descarteslabs.catalog.BlobCache` is configured and no `range`
+        is given, the data is read through the local cache.
 
         The Blob must be in the state `~descarteslabs.catalog.DocumentState.SAVED`.
 
@@ -692,6 +823,9 @@ class Blob(AuthCatalogObject):
         if self.state != DocumentState.SAVED:
             raise ValueError("Blob {} has not been saved".format(self.id))
 
+        if range is None and self.hash and blob_cache.active:
+            return blob_cache.get_data(self, revalidate=True)
+
         return self._do_download(range=range)
 
     @check_deleted
@@ -740,6 +874,65 @@ class Blob(AuthCatalogObject):
 
         return self._do_download(dest=generator, range=range)
 
+    @check_deleted
+    def open(self, mode="rb", block_size=None, cache_blocks=32, prefetch=4, retries=3):
+        """Opens the storage blob data as a read-only file.
+
+        Parts of the blob are downloaded as they are read, using HTTP range requests,
+        so that large files such as Parquet, COG or Zarr files can be read without
+        downloading them whole.  The data is read in blocks which are cached in
+        memory, and the following blocks are requested ahead of sequential reads.
+        See :py:class:`~descarteslabs.catalog.BlobFile`.
+
+        The Blob must be in the state `~descarteslabs.catalog.DocumentState.SAVED`.
+
+        Parameters
+        ----------
+        mode : str, optional
+            The mode in which the file is opened.  Only ``"rb"`` is supported.
+        block_size : int, optional
+            The size in bytes of the blocks.  Defaults to 2 MiB.
+        cache_blocks : int, optional
+            The maximum number of blocks kept in memory.  Defaults to 32.
+        prefetch : int, optional
+            The number of blocks requested ahead of sequential reads.  Defaults to 4.
+        retries : int, optional
+            The number of times the request of a block is retried after a transient
+            failure.  Defaults to 3.
+
+        Returns
+        -------
+        BlobFile
+            The seekable binary file, which should be closed after use.
+
+        Raises
+        ------
+        ValueError
+            If any improper arguments are supplied.
+        DeletedObjectError
+            If this blob was deleted.
+
+        Example
+        -------
+        >>> import pyarrow.parquet as pq
+        >>> from descarteslabs.catalog import Blob
+        >>> blob = Blob.get(name="table.parquet", namespace="my-namespace") # doctest: +SKIP
+        >>> with blob.open() as f: # doctest: +SKIP
+        ...     table = pq.read_table(f, columns=["id"])
+        """
+        if self.state != DocumentState.SAVED:
+            raise ValueError("Blob {} has not been saved".format(self.id))
+        if mode != "rb":
+            raise ValueError("Invalid mode {!r}: blobs can only be read".format(mode))
+
+        return BlobFile(
+            self,
+            block_size=block_size,
+            cache_blocks=cache_blocks,
+            prefetch=prefetch,
+            retries=retries,
+        )
+
     @check_deleted
     def iter_lines(self, decode_unicode=False, delimiter=None):
         """Downloads storage blob data.
@@ -805,7 +998,10 @@ class Blob(AuthCatalogObject):
     ):
         """Downloads storage blob data.
 
-        Downloads data for a given blob id and returns as a bytes object.
+        Downloads data for a given blob id and returns as a bytes object.  When the
+        :py:class:`~descarteslabs.catalog.BlobCache` is configured and neither `range`
+        nor `stream` is given, the current hash of the blob is retrieved and the data
+        is read through the local cache.
 
         Parameters
         ----------
@@ -856,6 +1052,14 @@ class Blob(AuthCatalogObject):
         if not id:
             id = f"{storage_type}/{cls.namespace_id(namespace)}/{name}"
 
+        if range is None and not stream and blob_cache.active:
+            # the current hash identifies the cached data
+            blob = cls.get(id, client=client)
+            if blob is None:
+                raise NotFoundError("Blob {} does not exist".format(id))
+            if blob.hash:
+                return blob_cache.get_data(blob)
+
         dest = None
         if stream:
 
@@ -869,6 +1073,100 @@ class Blob(AuthCatalogObject):
 
         return cls(id=id, client=client)._do_download(dest=dest, range=range)
 
+    @classmethod
+    def get_many_data(cls, ids, max_workers=16, retries=3, client=None):
+        """Downloads the data of many blobs concurrently.
+
+        The download URL of each blob is retrieved and its data downloaded by a pool
+        of workers, each of which reuses its connections from one blob to the next.
+        The data is yielded as each download completes, so the order of the
+        results differs from the order of `ids`.  Only a bounded number of ids are
+        read from `ids` ahead of the completed downloads, so it can be a generator
+        of any length.
+
+        This is meant for many small blobs whose data fits comfortably in memory.
+        Use :py:meth:`download` for large blobs.
+
+        Parameters
+        ----------
+        ids : iterable(str)
+            The ids of the blobs to download.
+        max_workers : int, optional
+            The maximum number of blobs downloaded concurrently.  Defaults to 16.
+        retries : int, optional
+            The number of times the download of a blob is retried after a transient
+            failure.  Defaults to 3.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for requests to the Descartes Labs
+            catalog.  The
+            :py:meth:`~descarteslabs.catalog.CatalogClient.get_default_client` will
+            be used if not set.
+
+        Returns
+        -------
+        generator(tuple(str, bytes or Exception))
+            The id of each blob with its data as they complete.  If a blob could not
+            be downloaded, the exception is given in place of its data, e.g. a
+            `~descarteslabs.exceptions.NotFoundError` if the blob does not exist.
+            Errors for one blob do not affect the others.
+
+        Example
+        -------
+        >>> from descarteslabs.catalog import Blob
+        >>> for id, data in Blob.get_many_data(ids): # doctest: +SKIP
+        ...     if isinstance(data, Exception):
+        ...         print("failed", id, data)
+        ...     else:
+        ...         process(id, data)
+        """
+        if client is None:
+            client = CatalogClient.get_default_client()
+
+        def get_data(id):
+            download = BlobDownload.get(id=id, client=client)
+
+            # BlobDownload.get() returns None if the blob does not exist
+            # raise a NotFoundError in this case
+            if not download:
+                raise NotFoundError("Blob {} does not exist".format(id))
+
+            r = cls._url_client.session.get(download.resumable_url)
+            r.raise_for_status()
+            return r.content
+
+        def get_data_retrying(id):
+            return call_with_retries(
+                lambda: get_data(id), retries, exceptions=DOWNLOAD_EXCEPTIONS
+            )
+
+        ids = iter(ids)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+
+            def submit():
+                # keep the workers busy without reading all ids up front
+                for id in itertools.islice(ids, 2 * max_workers - len(futures)):
+                    futures[executor.submit(get_data_retrying, id)] = id
+
+            try:
+                submit()
+                while futures:
+                    done, _ = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        id = futures.pop(future)
+                        try:
+                            data = future.result()
+                        except Exception as e:
+                            data = e
+                        yield id, data
+                    submit()
+            finally:
+                # don't start downloads nobody will receive if the caller stops early
+                for future in futures:
+                    future.cancel()
+
     @classmethod
     def delete_many(
         cls, ids, raise_on_missing=False, wait_for_completion=False, client=None
@@ -919,7 +1217,7 @@ class Blob(AuthCatalogObject):
 
         return task_status.ids
 
-    def _do_download(self, dest=None, range=None):
+    def _download_url(self):
         download = BlobDownload.get(id=self.id, client=self._client)
 
         # BlobDownload.get() returns None if the blob does not exist
@@ -927,6 +1225,12 @@ class Blob(AuthCatalogObject):
         if not download:
             raise NotFoundError("Blob {} does not exist".format(self.id))
 
+        return download.resumable_url
+
+    def _do_download(self, dest=None, range=None, url=None):
+        if url is None:
+            url = self._download_url()
+
         headers = {}
         if self.hash:
             headers["if-match"] = self.hash
@@ -947,9 +1251,7 @@ class Blob(AuthCatalogObject):
 
             headers["range"] = range_str
 
-        r = self._url_client.session.get(
-            download.resumable_url, headers=headers, stream=True
-        )
+        r = self._url_client.session.get(url, headers=headers, stream=True)
         r.raise_for_status()
         if callable(dest):
             # generator will close response
@@ -961,10 +1263,136 @@ class Blob(AuthCatalogObject):
                 else:
                     for chunk in r.iter_content(1048576):
                         dest.write(chunk)
-                    return dest.name
+                    return getattr(dest, "name", None)
+            finally:
+                r.close()
+
+    # the smallest part of a parallel download
+    _MIN_PART_SIZE = 8 * 1024 * 1024
+
+    def _do_parallel_download(self, dest, parallel, part_size, retries):
+        url = self._download_url()
+
+        size = self.size_bytes
+        if not part_size:
+            # several parts per worker, so that slow parts don't hold up the others
+            part_size = max(-(-size // (4 * parallel)), self._MIN_PART_SIZE)
+
+        dest.flush()
+        base = dest.tell()
+        dest.truncate(base + size)
+
+        try:
+            fd = dest.fileno() if hasattr(os, "pwrite") else None
+        except (OSError, ValueError):
+            fd = None
+
+        if fd is not None:
+
+            def write(data, offset):
+                data = memoryview(data)
+                while data:
+                    n = os.pwrite(fd, data, offset)
+                    data = data[n:]
+                    offset += n
+
+        else:
+            lock = threading.Lock()
+
+            def write(data, offset):
+                with lock:
+                    dest.seek(offset)
+                    dest.write(data)
+
+        headers = {}
+        if self.hash:
+            headers["if-match"] = self.hash
+
+        # the download url, which is renewed when it expires
+        urls = [url]
+        urls_lock = threading.Lock()
+
+        def download_part(start, end):
+            # a retry downloads the whole part again, over the same bytes
+            url = urls[0]
+            try:
+                r = self._url_client.session.get(
+                    url,
+                    headers=dict(headers, range=f"bytes={start}-{end}"),
+                    stream=True,
+                )
+            except ForbiddenError:
+                # the download url has expired, get a new one for the retry
+                with urls_lock:
+                    if urls[0] == url:
+                        urls[0] = self._download_url()
+                raise
+            try:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise IOError(
+                        "Blob {} download does not support range requests".format(
+                            self.id
+                        )
+                    )
+                offset = base + start
+                for chunk in r.iter_content(1048576):
+                    write(chunk, offset)
+                    offset += len(chunk)
             finally:
                 r.close()
 
+            if offset != base + end + 1:
+                raise requests.exceptions.ChunkedEncodingError(
+                    "Incomplete download of bytes {}-{} of blob {}".format(
+                        start, end, self.id
+                    )
+                )
+
+        def download_part_retrying(start):
+            end = min(start + part_size, size) - 1
+            call_with_retries(
+                lambda: download_part(start, end),
+                retries,
+                exceptions=DOWNLOAD_EXCEPTIONS,
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+            # raise the first failure, once all parts have completed
+            for _ in executor.map(download_part_retrying, range(0, size, part_size)):
+                pass
+
+        if self.hash and len(self.hash) == 32:
+            self._verify_download(dest, base, size)
+
+        # leave the file at the end of the blob, as when downloading a single stream
+        dest.seek(base + size)
+
+        return getattr(dest, "name", None)
+
+    def _verify_download(self, dest, base, size):
+        dest.flush()
+        if dest.readable():
+            dest.seek(base)
+            f = dest
+        else:
+            # a file opened for writing only is read back by name
+            f = io.open(dest.name, "rb")
+            f.seek(base)
+
+        try:
+            digest = md5_file(f, size=size)
+        finally:
+            if f is not dest:
+                f.close()
+
+        if digest != self.hash.lower():
+            raise ValueError(
+                "Blob {} downloaded data does not match its hash {}".format(
+                    self.id, self.hash
+                )
+            )
+
     @hybridmethod
     @check_derived
     def delete(cls, id, client=None):
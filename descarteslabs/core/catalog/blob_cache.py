@@ -0,0 +1,370 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import glob
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+import threading
+import time
+
+from descarteslabs.exceptions import ClientError
+
+from .transfer import md5_file
+
+# Temporary files of fills which are older than this were abandoned by a process
+# which died, and are removed on eviction
+_STALE_TMP_SECONDS = 24 * 3600
+
+
+def _digest(value):
+    return hashlib.sha1(str(value).encode("utf-8")).hexdigest()
+
+
+class BlobCache(object):
+    """A local read-through cache of blob data.
+
+    Once a ``path`` is configured, the data retrieved with
+    :py:meth:`Blob.data <descarteslabs.catalog.Blob.data>` and
+    :py:meth:`Blob.get_data <descarteslabs.catalog.Blob.get_data>` without a
+    ``range`` is stored as one file per blob in that directory, keyed by the
+    catalog environment, the blob id and its ``hash``.  A blob which is
+    replaced has a new hash, so its previous entry is never used again and is
+    eventually evicted.  Entries are written atomically and can be shared by any
+    number of processes, and are checked against the MD5 hash of the blob when
+    they are written.
+
+    When the total size of the entries exceeds ``max_bytes``, the least recently
+    used entries are removed.
+
+    :py:meth:`Blob.get_data <descarteslabs.catalog.Blob.get_data>` retrieves the
+    current hash of the blob from the catalog before using the cache.  For
+    :py:meth:`Blob.data <descarteslabs.catalog.Blob.data>`, whose hash may be
+    out of date, a cached entry is revalidated with a single byte ``if-match``
+    request unless ``revalidate`` is ``False``.  As without the cache, a
+    `~descarteslabs.exceptions.ClientError` with a ``status`` of 412 is raised
+    if the blob has been replaced since it was retrieved.
+
+    There is a single instance of this class, available as
+    :py:data:`~descarteslabs.catalog.blob_cache`, which can be reconfigured
+    using :py:meth:`configure`.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory in which blob data is cached.  Nothing is cached if not
+        set, which is the default.
+    max_bytes : int, optional
+        The maximum total size of the cached data in bytes.  Defaults to 10 GiB.
+    revalidate : bool, optional
+        Whether entries used by :py:meth:`Blob.data
+        <descarteslabs.catalog.Blob.data>` are revalidated.  Defaults to ``True``.
+    enabled : bool, optional
+        Whether blob data is cached at all.  Defaults to ``True``.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import Blob, blob_cache
+    >>> blob_cache.configure(path="/tmp/dl-blobs", max_bytes=2**30)
+    >>> weights = Blob.get_data(name="weights.bin", namespace="my-project") # doctest: +SKIP
+    >>> blob = Blob.get(name="lookup.bin", namespace="my-project") # doctest: +SKIP
+    >>> table = blob_cache.mmap(blob) # doctest: +SKIP
+    """
+
+    def __init__(self, path=None, max_bytes=10 * 2**30, revalidate=True, enabled=True):
+        self._lock = threading.RLock()
+        self.configure(
+            path=path, max_bytes=max_bytes, revalidate=revalidate, enabled=enabled
+        )
+
+    def configure(self, path=None, max_bytes=10 * 2**30, revalidate=True, enabled=True):
+        """Reconfigure the cache.
+
+        The statistics are reset.  Entries in ``path`` are retained.
+
+        Parameters
+        ----------
+        path : str, optional
+            The directory in which blob data is cached.  Nothing is cached if not
+            set.
+        max_bytes : int, optional
+            The maximum total size of the cached data in bytes.  Defaults to 10 GiB.
+        revalidate : bool, optional
+            Whether entries used by :py:meth:`Blob.data
+            <descarteslabs.catalog.Blob.data>` are revalidated.  Defaults to
+            ``True``.
+        enabled : bool, optional
+            Whether blob data is cached at all.  Defaults to ``True``.
+        """
+        with self._lock:
+            if path is not None:
+                os.makedirs(path, exist_ok=True)
+
+            self.path = path
+            self.max_bytes = max_bytes
+            self.revalidate = revalidate
+            self.enabled = enabled
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def active(self):
+        """bool: Whether blob data is being cached."""
+        return self.enabled and self.path is not None
+
+    @property
+    def hit_rate(self):
+        """float: The fraction of reads that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Return the cache statistics.
+
+        Returns
+        -------
+        dict
+            The number of ``hits`` and ``misses`` and the ``hit_rate`` of this
+            process, and the number of ``entries`` and their total size in
+            ``bytes``.
+        """
+        entries = self._entries()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+            }
+
+    def filename(self, blob, revalidate=False):
+        """Return the name of the cached file with the data of a blob.
+
+        The data is downloaded into the cache first if necessary.  The file must
+        not be modified, and may be removed by eviction at any time: open it
+        right away.  An open file remains readable after it is removed.
+
+        Parameters
+        ----------
+        blob : Blob
+            A saved blob, with a ``hash``.
+        revalidate : bool, optional
+            Whether to check that a cached entry is still current if the cache is
+            configured to do so.  Defaults to ``False``.
+
+        Returns
+        -------
+        str
+            The name of the cached file.
+
+        Raises
+        ------
+        ValueError
+            If the cache is not configured or the blob has no hash, or if the
+            downloaded data does not match the hash.
+        """
+        if not self.active:
+            raise ValueError("The blob cache is not configured")
+        if not blob.hash:
+            raise ValueError("Blob {} has no hash and cannot be cached".format(blob.id))
+
+        filename = self._filename(blob)
+        try:
+            # mark the entry as recently used
+            os.utime(filename)
+        except FileNotFoundError:
+            pass
+        else:
+            if revalidate and self.revalidate:
+                self._revalidate(blob)
+            with self._lock:
+                self.hits += 1
+            return filename
+
+        with self._lock:
+            self.misses += 1
+
+        self._fill(blob, filename)
+        self._evict(keep=filename)
+        return filename
+
+    def get_data(self, blob, revalidate=False):
+        """Return the data of a blob, from the cache if possible.
+
+        Parameters
+        ----------
+        blob : Blob
+            A saved blob, with a ``hash``.
+        revalidate : bool, optional
+            Whether to check that a cached entry is still current if the cache is
+            configured to do so.  Defaults to ``False``.
+
+        Returns
+        -------
+        bytes
+            The data of the blob.
+        """
+        while True:
+            filename = self.filename(blob, revalidate=revalidate)
+            try:
+                with io.open(filename, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                # evicted by another process in the meantime
+                pass
+
+    def mmap(self, blob):
+        """Return the data of a blob as a read-only memory-mapped file.
+
+        All processes which map the same blob share a single copy of its data in
+        the page cache.  The mapping remains valid after the entry is evicted,
+        until it is closed.
+
+        Parameters
+        ----------
+        blob : Blob
+            A saved, non-empty blob, with a ``hash``.
+
+        Returns
+        -------
+        mmap.mmap
+            The read-only mapping of the cached file.
+
+        Raises
+        ------
+        ValueError
+            If the cache is not configured, or if the blob has no hash or is
+            empty.
+        """
+        while True:
+            filename = self.filename(blob)
+            try:
+                with io.open(filename, "rb") as f:
+                    if not os.fstat(f.fileno()).st_size:
+                        raise ValueError(
+                            "Blob {} is empty and cannot be mapped".format(blob.id)
+                        )
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except FileNotFoundError:
+                # evicted by another process in the meantime
+                pass
+
+    def invalidate(self, id=None):
+        """Remove entries from the cache.
+
+        Parameters
+        ----------
+        id : str, optional
+            Only remove the entries of the blob with this id.  All entries are
+            removed if not set.
+        """
+        if self.path is None:
+            return
+
+        pattern = "{}-*.blob".format(_digest(id) if id is not None else "*")
+        for filename in glob.glob(os.path.join(self.path, pattern)):
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """Remove all entries from the cache and reset the statistics."""
+        self.invalidate()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _filename(self, blob):
+        key = "{}|{}".format(blob._client.base_url, blob.hash)
+        return os.path.join(
+            self.path, "{}-{}.blob".format(_digest(blob.id), _digest(key))
+        )
+
+    def _revalidate(self, blob):
+        # a conditional request for a single byte fails if the hash is stale
+        try:
+            blob._do_download(range=(0, 0))
+        except ClientError as e:
+            # an empty blob has no byte to return
+            if getattr(e, "status", None) != 416:
+                raise
+
+    def _fill(self, blob, filename):
+        # download next to the entry and move it in place atomically, so
+        # concurrent processes never see a partial entry
+        fd, tmp_name = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        os.close(fd)
+        try:
+            blob.download(tmp_name)
+            if len(blob.hash) == 32 and md5_file(tmp_name) != blob.hash.lower():
+                raise ValueError(
+                    "Blob {} downloaded data does not match its hash {}".format(
+                        blob.id, blob.hash
+                    )
+                )
+            os.replace(tmp_name, filename)
+        except BaseException:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    def _entries(self):
+        if self.path is None:
+            return []
+
+        entries = []
+        for filename in glob.glob(os.path.join(self.path, "*.blob")):
+            try:
+                stat = os.stat(filename)
+            except FileNotFoundError:
+                continue
+            entries.append((filename, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self, keep=None):
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            for filename, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                if filename == keep:
+                    continue
+                try:
+                    os.remove(filename)
+                except FileNotFoundError:
+                    # already evicted by another process
+                    pass
+                except OSError:
+                    # in use on Windows
+                    continue
+                total -= size
+
+            expired = time.time() - _STALE_TMP_SECONDS
+            for filename in glob.glob(os.path.join(self.path, "*.tmp")):
+                try:
+                    if os.path.getmtime(filename) < expired:
+                        os.remove(filename)
+                except OSError:
+                    pass
+
+
+#: The :py:class:`BlobCache` used by the catalog.
+blob_cache = BlobCache()
@@ -0,0 +1,202 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import io
+import threading
+
+import cachetools
+import requests.exceptions
+
+from descarteslabs.exceptions import ForbiddenError
+
+from .transfer import DOWNLOAD_EXCEPTIONS, call_with_retries
+
+
+class BlobFile(io.RawIOBase):
+    """A read-only, seekable binary file over the data of a blob.
+
+    The data is read in blocks with HTTP range requests, which are kept in a
+    least recently used cache so that repeated reads of the same parts of the
+    blob, such as the headers of a COG or the footer of a Parquet file, are
+    served from memory.  When the file is read sequentially, the following
+    blocks are requested concurrently ahead of the reads.  A read spanning
+    several blocks requests them all concurrently.
+
+    Use :py:meth:`Blob.open <descarteslabs.catalog.Blob.open>` rather than
+    instantiating this class directly.
+
+    Parameters
+    ----------
+    blob : Blob
+        The saved blob to read.
+    block_size : int, optional
+        The size in bytes of the blocks.  Defaults to 2 MiB.
+    cache_blocks : int, optional
+        The maximum number of blocks kept in memory.  Defaults to 32.
+    prefetch : int, optional
+        The number of blocks requested ahead of sequential reads.  Defaults to 4.
+        Use 0 to disable readahead.
+    retries : int, optional
+        The number of times the request of a block is retried after a transient
+        failure.  Defaults to 3.
+    """
+
+    DEFAULT_BLOCK_SIZE = 2 * 1024 * 1024
+
+    def __init__(self, blob, block_size=None, cache_blocks=32, prefetch=4, retries=3):
+        if blob.size_bytes is None:
+            raise ValueError("Blob {} has no size".format(blob.id))
+
+        self.name = blob.id
+        self.mode = "rb"
+        self.size = blob.size_bytes
+        self.block_size = block_size or self.DEFAULT_BLOCK_SIZE
+        self.prefetch = prefetch
+        self.retries = retries
+
+        self._blob = blob
+        self._url = None
+        self._position = 0
+        self._last_block = None
+        self._lock = threading.Lock()
+        self._blocks = cachetools.LRUCache(maxsize=max(cache_blocks, 1))
+        self._requests = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(prefetch, 1) + 1
+        )
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        self._checkClosed()
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError("Invalid whence ({!r})".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {}".format(position))
+        self._position = position
+        return position
+
+    def readinto(self, buffer):
+        self._checkClosed()
+        start = self._position
+        end = min(start + len(buffer), self.size)
+        if start >= end:
+            return 0
+
+        first = start // self.block_size
+        last = (end - 1) // self.block_size
+
+        # request all the blocks of the read at once, and the following blocks
+        # if the file is being read sequentially
+        wanted = list(range(first, last + 1))
+        if self._last_block is not None and first in (
+            self._last_block,
+            self._last_block + 1,
+        ):
+            wanted.extend(range(last + 1, last + 1 + self.prefetch))
+        futures = [self._request(index) for index in wanted]
+        self._last_block = last
+
+        view = memoryview(buffer)
+        n = 0
+        for index, future in zip(range(first, last + 1), futures):
+            block = future.result()
+            offset = start + n - index * self.block_size
+            length = min(len(block) - offset, end - start - n)
+            view[n : n + length] = block[offset : offset + length]
+            n += length
+
+        self._position += n
+        return n
+
+    def readall(self):
+        return self.read(max(self.size - self.tell(), 0))
+
+    def close(self):
+        if not self.closed:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            with self._lock:
+                self._blocks.clear()
+                self._requests.clear()
+        super().close()
+
+    def _request(self, index):
+        # the future of a block, from the cache, in flight, or newly requested
+        with self._lock:
+            if index * self.block_size >= self.size:
+                future = concurrent.futures.Future()
+                future.set_result(b"")
+                return future
+
+            block = self._blocks.get(index)
+            if block is not None:
+                future = concurrent.futures.Future()
+                future.set_result(block)
+                return future
+
+            future = self._requests.get(index)
+            if future is None:
+                future = self._executor.submit(self._fetch, index)
+                self._requests[index] = future
+            return future
+
+    def _fetch(self, index):
+        start = index * self.block_size
+        end = min(start + self.block_size, self.size) - 1
+        try:
+            block = call_with_retries(
+                lambda: self._read_range(start, end),
+                self.retries,
+                exceptions=DOWNLOAD_EXCEPTIONS,
+            )
+            with self._lock:
+                self._blocks[index] = block
+            return block
+        finally:
+            with self._lock:
+                self._requests.pop(index, None)
+
+    def _read_range(self, start, end):
+        url = self._url
+        if url is None:
+            url = self._url = self._blob._download_url()
+        try:
+            block = self._blob._do_download(range=(start, end), url=url)
+        except ForbiddenError:
+            # the download url has expired, get a new one
+            self._url = self._blob._download_url()
+            block = self._blob._do_download(range=(start, end), url=self._url)
+
+        if len(block) != end - start + 1:
+            raise requests.exceptions.ChunkedEncodingError(
+                "Incomplete read of bytes {}-{} of blob {}".format(
+                    start, end, self._blob.id
+                )
+            )
+        return block
@@ -0,0 +1,194 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+try:
+    import fsspec
+    from fsspec.spec import AbstractFileSystem
+except ImportError:
+    raise ImportError(
+        "The fsspec support in the `descarteslabs.catalog` Python package"
+        " requires the `fsspec` extra to be installed."
+        " Please run `pip install descarteslabs[fsspec]` and try again."
+        " Alternatively you can install the `fsspec` package directly."
+    )
+
+from ..common.property_filtering import Properties
+from .blob import Blob, StorageType
+from .catalog_base import CatalogClient
+
+properties = Properties()
+
+
+class BlobFileSystem(AbstractFileSystem):
+    """A read-only fsspec filesystem over the data blobs of the catalog.
+
+    The paths of the filesystem are ``namespace/name``, where ``namespace`` is the
+    full namespace of a blob (e.g. ``myorg:myproject``) and ``name`` its name, so
+    that the ``/`` separated parts of blob names are treated as directories.  The
+    protocol is ``dlblob``, which is registered with fsspec when the
+    ``descarteslabs`` package is installed along with ``fsspec``, or when this
+    module is imported.
+
+    Files are opened with :py:meth:`Blob.open
+    <descarteslabs.catalog.Blob.open>`, so that only the parts of a blob which
+    are read are downloaded.  Listings are retrieved with :py:meth:`Blob.search
+    <descarteslabs.catalog.Blob.search>` and cached, see
+    :py:meth:`~fsspec.spec.AbstractFileSystem.invalidate_cache`.
+
+    Parameters
+    ----------
+    client : CatalogClient, optional
+        A `CatalogClient` instance to use for requests to the Descartes Labs
+        catalog.  The
+        :py:meth:`~descarteslabs.catalog.CatalogClient.get_default_client` will
+        be used if not set.
+    **kwargs
+        Any other parameters of :py:class:`~fsspec.spec.AbstractFileSystem`.
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> df = pd.read_parquet("dlblob://myorg:myproject/tables/t.parquet") # doctest: +SKIP
+    >>> import fsspec
+    >>> fs = fsspec.filesystem("dlblob") # doctest: +SKIP
+    >>> fs.ls("myorg:myproject/tables", detail=False) # doctest: +SKIP
+    ['myorg:myproject/tables/t.parquet']
+    """
+
+    protocol = "dlblob"
+    root_marker = ""
+
+    def __init__(self, client=None, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client or CatalogClient.get_default_client()
+
+    def ls(self, path, detail=True, refresh=False, **kwargs):
+        path = self._strip_protocol(path)
+        if not refresh and path in self.dircache:
+            entries = self.dircache[path]
+        else:
+            entries = self._list(path)
+            if not entries:
+                # a file is listed as itself
+                blob = self._get_blob(path)
+                if blob is None:
+                    raise FileNotFoundError(path)
+                return [self._file_info(blob)] if detail else [path]
+            self.dircache[path] = entries
+
+        return entries if detail else [entry["name"] for entry in entries]
+
+    def info(self, path, **kwargs):
+        path = self._strip_protocol(path)
+        if not path:
+            return {"name": "", "size": 0, "type": "directory"}
+
+        blob = self._get_blob(path)
+        if blob is not None:
+            return self._file_info(blob)
+
+        parent = self._parent(path)
+        for entry in self.dircache.get(parent, ()):
+            if entry["name"] == path:
+                return entry
+
+        if self._list(path):
+            return {"name": path, "size": 0, "type": "directory"}
+
+        raise FileNotFoundError(path)
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        blob = self._get_blob(self._strip_protocol(path))
+        if blob is None:
+            raise FileNotFoundError(path)
+        if start is None and end is None:
+            return blob.data()
+
+        size = blob.size_bytes
+        start = start or 0
+        if start < 0:
+            start = max(start + size, 0)
+        if end is None or end > size:
+            end = size
+        elif end < 0:
+            end += size
+        if start >= end:
+            return b""
+        return blob.data(range=(start, end - 1))
+
+    def _open(
+        self,
+        path,
+        mode="rb",
+        block_size=None,
+        autocommit=True,
+        cache_options=None,
+        **kwargs,
+    ):
+        if mode != "rb":
+            raise NotImplementedError("The dlblob filesystem is read-only")
+
+        blob = self._get_blob(self._strip_protocol(path))
+        if blob is None:
+            raise FileNotFoundError(path)
+        return blob.open(block_size=block_size, **(cache_options or {}))
+
+    def _get_blob(self, path):
+        namespace, _, name = path.partition("/")
+        if not name:
+            return None
+        return Blob.get(
+            "{}/{}/{}".format(StorageType.DATA, namespace, name), client=self.client
+        )
+
+    def _list(self, path):
+        namespace, _, prefix = path.partition("/")
+        if prefix:
+            prefix += "/"
+
+        search = Blob.search(client=self.client).filter(
+            properties.storage_type == StorageType.DATA
+        )
+        if namespace:
+            search = search.filter(properties.namespace == namespace)
+        if prefix:
+            search = search.filter(properties.name.startswith(prefix))
+
+        entries = {}
+        for blob in search:
+            if not namespace:
+                name = blob.namespace
+            else:
+                name = "{}/{}{}".format(
+                    namespace, prefix, blob.name[len(prefix) :].split("/")[0]
+                )
+            if not namespace or "/" in blob.name[len(prefix) :]:
+                entries[name] = {"name": name, "size": 0, "type": "directory"}
+            else:
+                entries[name] = self._file_info(blob)
+
+        return [entries[name] for name in sorted(entries)]
+
+    def _file_info(self, blob):
+        return {
+            "name": "{}/{}".format(blob.namespace, blob.name),
+            "size": blob.size_bytes,
+            "type": "file",
+            "hash": blob.hash,
+            "created": blob.created,
+            "modified": blob.modified,
+        }
+
+
+fsspec.register_implementation(BlobFileSystem.protocol, BlobFileSystem, clobber=True)
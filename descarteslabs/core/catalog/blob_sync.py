@@ -0,0 +1,282 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import os
+
+from ..common.property_filtering import Properties
+from .blob import Blob, StorageType
+from .catalog_base import CatalogClient
+from .transfer import md5_file
+
+properties = Properties()
+
+# Attributes of a blob which are kept when it is replaced by a newer file
+_PRESERVED_ATTRIBUTES = (
+    "description",
+    "expires",
+    "extra_properties",
+    "geometry",
+    "owners",
+    "readers",
+    "tags",
+    "writers",
+)
+
+
+def _format_bytes(n):
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if n < 1024 or unit == "TiB":
+            break
+        n /= 1024
+    return "{:.1f} {}".format(n, unit) if unit != "B" else "{} B".format(n)
+
+
+class BlobSyncResult(object):
+    """The result of :py:func:`sync_blobs`.
+
+    Attributes
+    ----------
+    transferred : list(str)
+        The names of the blobs that were uploaded or downloaded, relative to the
+        prefix.
+    unchanged : list(str)
+        The names of the blobs that were already identical on both sides.
+    deleted : list(str)
+        The names of the extraneous blobs or files that were deleted.
+    errors : list(tuple(str, Exception))
+        The names of the blobs that could not be synchronized, with the
+        exception raised.
+    bytes_transferred : int
+        The number of bytes uploaded or downloaded.
+    bytes_skipped : int
+        The number of bytes that did not need to be transferred because they
+        were unchanged.
+    dry_run : bool
+        Whether the changes were only determined and not made.
+    """
+
+    def __init__(self, dry_run=False):
+        self.transferred = []
+        self.unchanged = []
+        self.deleted = []
+        self.errors = []
+        self.bytes_transferred = 0
+        self.bytes_skipped = 0
+        self.dry_run = dry_run
+
+    def __str__(self):
+        text = "{}{} transferred ({}), {} unchanged ({} saved), {} deleted".format(
+            "Dry run: " if self.dry_run else "",
+            len(self.transferred),
+            _format_bytes(self.bytes_transferred),
+            len(self.unchanged),
+            _format_bytes(self.bytes_skipped),
+            len(self.deleted),
+        )
+        if self.errors:
+            text += ", {} failed".format(len(self.errors))
+        return text
+
+    def __repr__(self):
+        return "BlobSyncResult({})".format(self)
+
+
+def sync_blobs(
+    local_dir,
+    namespace=None,
+    prefix="",
+    direction="upload",
+    delete=False,
+    max_workers=8,
+    dry_run=False,
+    client=None,
+):
+    """Synchronize a local directory with blobs in the Descartes Labs catalog.
+
+    The files of the local directory and its subdirectories are mirrored as data
+    blobs whose names are the paths of the files relative to `local_dir`, using
+    ``/`` as separator, prepended with `prefix`.  Both sides are listed, and a
+    file and a blob with the same name are considered identical when their sizes
+    and MD5 hashes are the same.  Only the files and blobs which are missing or
+    differ on the destination are transferred, concurrently.
+
+    A blob which is replaced by a newer file is deleted and uploaded again,
+    keeping its description, tags, access control and other attributes.  The
+    file is read before the blob is deleted, but if the upload fails the blob
+    remains deleted and the failure is reported in the errors of the result;
+    the blob is uploaded by the next sync.
+
+    Parameters
+    ----------
+    local_dir : str
+        The local directory.  It is created when downloading if it does not exist.
+    namespace : str, optional
+        The namespace of the blobs.  Defaults to the user's namespace, see
+        :py:meth:`Blob.namespace_id <descarteslabs.catalog.Blob.namespace_id>`.
+    prefix : str, optional
+        The prefix of the names of the blobs, treated as a directory: a ``/`` is
+        appended if it does not end with one.  Defaults to all blobs in the
+        namespace.
+    direction : str, optional
+        ``"upload"`` (the default) to make the blobs match the local files, or
+        ``"download"`` to make the local files match the blobs.
+    delete : bool, optional
+        If True, delete the blobs (when uploading) or the files (when
+        downloading) which do not exist on the source side.  Defaults to False.
+    max_workers : int, optional
+        The maximum number of files transferred concurrently.  Defaults to 8.
+    dry_run : bool, optional
+        If True, only determine what would be transferred and deleted, without
+        making any changes.  Defaults to False.
+    client : CatalogClient, optional
+        A `CatalogClient` instance to use for requests to the Descartes Labs
+        catalog.  The
+        :py:meth:`~descarteslabs.catalog.CatalogClient.get_default_client` will
+        be used if not set.
+
+    Returns
+    -------
+    BlobSyncResult
+        The names of the blobs transferred, unchanged and deleted, with any
+        errors and the number of bytes transferred and saved.
+
+    Raises
+    ------
+    ValueError
+        If `direction` is not one of the allowed values, or `local_dir` is not
+        a directory when uploading.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import sync_blobs
+    >>> result = sync_blobs("models", "my-project", prefix="models") # doctest: +SKIP
+    >>> print(result) # doctest: +SKIP
+    2 transferred (1.2 GiB), 40 unchanged (18.5 GiB saved), 0 deleted
+    """
+    if direction not in ("upload", "download"):
+        raise ValueError("direction must be 'upload' or 'download'")
+    upload = direction == "upload"
+    if upload and not os.path.isdir(local_dir):
+        raise ValueError("{} is not a directory".format(local_dir))
+
+    if client is None:
+        client = CatalogClient.get_default_client()
+    namespace = Blob.namespace_id(namespace, client=client)
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+
+    # the local files and the blobs, by name relative to the prefix
+    files = {}
+    if os.path.isdir(local_dir):
+        for root, _, filenames in os.walk(local_dir):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, local_dir).replace(os.sep, "/")
+                files[name] = path
+
+    search = (
+        Blob.search(client=client)
+        .filter(properties.storage_type == StorageType.DATA)
+        .filter(properties.namespace == namespace)
+    )
+    if prefix:
+        search = search.filter(properties.name.startswith(prefix))
+    blobs = {blob.name[len(prefix) :]: blob for blob in search}
+
+    result = BlobSyncResult(dry_run=dry_run)
+
+    def is_unchanged(name):
+        blob = blobs.get(name)
+        path = files.get(name)
+        if blob is None or path is None or blob.size_bytes != os.path.getsize(path):
+            return False
+        # only read files whose size matches
+        return bool(blob.hash) and blob.hash.lower() == md5_file(path)
+
+    def transfer(name):
+        blob = blobs.get(name)
+        if upload:
+            # make sure the file can be read before deleting the blob it replaces,
+            # the upload checks that the file is unchanged against the hash
+            hash = md5_file(files[name])
+            if blob is not None:
+                status = Blob.delete(blob.id, client=client)
+                if status is not None:
+                    status.wait_for_completion()
+            new_blob = Blob(
+                namespace=namespace,
+                name=prefix + name,
+                storage_type=StorageType.DATA,
+                hash=hash,
+                client=client,
+            )
+            if blob is not None:
+                for attribute in _PRESERVED_ATTRIBUTES:
+                    value = getattr(blob, attribute, None)
+                    if value is not None:
+                        setattr(new_blob, attribute, value)
+            new_blob.upload(files[name])
+            return new_blob.size_bytes or os.path.getsize(files[name])
+        else:
+            path = os.path.join(local_dir, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            blob.download(path)
+            return blob.size_bytes or os.path.getsize(path)
+
+    def sync(name):
+        if is_unchanged(name):
+            return False, blobs[name].size_bytes or 0
+        if dry_run:
+            source = files[name] if upload else blobs[name]
+            size = os.path.getsize(source) if upload else source.size_bytes
+            return True, size or 0
+        return True, transfer(name)
+
+    names = sorted(files if upload else blobs)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(sync, name): name for name in names}
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                transferred, size = future.result()
+            except Exception as e:
+                result.errors.append((name, e))
+                continue
+            if transferred:
+                result.transferred.append(name)
+                result.bytes_transferred += size
+            else:
+                result.unchanged.append(name)
+                result.bytes_skipped += size
+
+    result.transferred.sort()
+    result.unchanged.sort()
+    result.errors.sort(key=lambda error: error[0])
+
+    if delete:
+        extraneous = sorted(set(blobs if upload else files) - set(names))
+        if not dry_run and extraneous:
+            if upload:
+                Blob.delete_many(
+                    [blobs[name].id for name in extraneous],
+                    wait_for_completion=True,
+                    client=client,
+                )
+            else:
+                for name in extraneous:
+                    os.remove(files[name])
+        result.deleted.extend(extraneous)
+
+    return result
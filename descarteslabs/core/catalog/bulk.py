@@ -0,0 +1,362 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import functools
+import itertools
+import threading
+import time
+import warnings
+
+from ..common.property_filtering import Properties
+from .transfer import TRANSIENT_EXCEPTIONS, call_with_retries
+
+properties = Properties()
+
+
+class BulkSaveError(object):
+    """An error that occurred while saving an object with :py:func:`bulk_save`."""
+
+    def __init__(self, obj, exception):
+        self.object = obj
+        self.exception = exception
+
+    def __str__(self):
+        return f"{self.object.id}: {self.exception}"
+
+    def __repr__(self):
+        return (
+            f"BulkSaveError("
+            f"object={self.object.__class__.__name__}(id={self.object.id!r}), "
+            f"exception={repr(self.exception)})"
+        )
+
+
+class BulkSaveResult(list):
+    """The result of :py:func:`bulk_save`.
+
+    This is a list of the objects that were saved, or that did not need saving,
+    with the errors for the objects that could not be saved in :py:attr:`errors`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.errors = []
+
+    def append_error(self, error):
+        """Append an error to the result."""
+        self.errors.append(error)
+
+
+def bulk_save(objects, max_workers=8, on_error="continue", retries=3, headers=None):
+    """Save many catalog objects concurrently.
+
+    Each object is saved with :py:meth:`~descarteslabs.catalog.CatalogObject.save`,
+    so new objects are created and only the modified attributes of existing
+    objects are sent.  Objects which are not modified are not sent at all.
+    Transient failures are retried, and when the catalog rate limits a request
+    all concurrent saves wait for the requested delay.
+
+    Parameters
+    ----------
+    objects : iterable(CatalogObject)
+        The objects to save.
+    max_workers : int, optional
+        The maximum number of objects saved concurrently.  Defaults to 8.
+    on_error : str, optional
+        ``"continue"`` (the default) to save all objects and report the failures in
+        the result, or ``"raise"`` to stop saving objects after the first failure
+        and raise its exception once the saves in progress have completed.
+    retries : int, optional
+        The number of times a transient failure is retried for each object.
+        Defaults to 3.
+    headers : dict, optional
+        A dictionary of header keys and values to be sent with each request.
+
+    Returns
+    -------
+    BulkSaveResult
+        The objects that were saved, with any errors.
+
+    Raises
+    ------
+    ValueError
+        If `on_error` is not one of the allowed values.
+    ~descarteslabs.exceptions.ClientError or ~descarteslabs.exceptions.ServerError
+        If `on_error` is ``"raise"`` and an object could not be saved.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import Image, bulk_save
+    >>> images = Image.search().filter(...).collect() # doctest: +SKIP
+    >>> for image in images: # doctest: +SKIP
+    ...     image.tags.append("processed")
+    >>> result = bulk_save(images, max_workers=16) # doctest: +SKIP
+    >>> result.errors # doctest: +SKIP
+    []
+    """
+    if on_error not in ("continue", "raise"):
+        raise ValueError("on_error must be 'continue' or 'raise'")
+
+    stop = threading.Event()
+
+    def save_object(obj):
+        if stop.is_set():
+            return False
+        try:
+            call_with_retries(functools.partial(obj.save, headers=headers), retries)
+        except Exception:
+            if on_error == "raise":
+                stop.set()
+            raise
+        return True
+
+    objects = list(objects)
+    outcomes = [None] * len(objects)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(save_object, obj): i for i, obj in enumerate(objects)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                outcomes[futures[future]] = future.result()
+            except Exception as ex:
+                outcomes[futures[future]] = ex
+
+    # report the objects in the order in which they were given
+    result = BulkSaveResult()
+    for obj, outcome in zip(objects, outcomes):
+        if isinstance(outcome, Exception):
+            result.append_error(BulkSaveError(obj, outcome))
+        elif outcome:
+            result.append(obj)
+
+    if on_error == "raise" and result.errors:
+        raise result.errors[0].exception
+
+    return result
+
+
+class BulkUploadResult(object):
+    """The outcome of the upload of an image with :py:func:`bulk_upload`.
+
+    Attributes
+    ----------
+    image : Image
+        The image that was uploaded.
+    upload : ImageUpload or None
+        The upload, or None if it could not be created.
+    exception : Exception or None
+        The exception raised while creating the upload or transferring its
+        files, if any.
+    """
+
+    def __init__(self, image, upload=None, exception=None):
+        self.image = image
+        self.upload = upload
+        self.exception = exception
+
+    @property
+    def status(self):
+        """ImageUploadStatus or None: The final status of the upload, or None if
+        the upload could not be created or its files could not be transferred."""
+        if self.exception is not None or self.upload is None:
+            return None
+        return self.upload.status
+
+    @property
+    def success(self):
+        """bool: Whether the image was successfully uploaded."""
+        from .image_upload import ImageUploadStatus
+
+        return self.status == ImageUploadStatus.SUCCESS
+
+    @property
+    def retryable(self):
+        """bool: Whether the upload failed on a transient error, such that the
+        image can be uploaded again."""
+        return isinstance(self.exception, TRANSIENT_EXCEPTIONS)
+
+    def __repr__(self):
+        if self.exception is not None:
+            outcome = "exception={!r}".format(self.exception)
+        else:
+            outcome = "status={}".format(self.status)
+        return "BulkUploadResult(image={!r}, {})".format(self.image.id, outcome)
+
+
+def bulk_upload(
+    images_and_files,
+    max_workers=8,
+    retries=3,
+    overwrite=False,
+    warn_transient_errors=True,
+):
+    """Upload many images concurrently, tracking the uploads until they complete.
+
+    Each image is uploaded with :py:meth:`~descarteslabs.catalog.Image.upload`,
+    with up to `max_workers` uploads being created and their files transferred
+    at the same time.  The status of all uploads being processed is then checked
+    with a single :py:meth:`ImageUpload.search
+    <descarteslabs.catalog.ImageUpload.search>` per polling interval, rather
+    than by reloading each upload in turn.
+
+    The results are returned as the uploads complete, in the order in which they
+    complete.  An image whose upload could not be created or whose files could
+    not be transferred is returned with the exception, and uploads that were
+    processed with their final status.
+
+    Parameters
+    ----------
+    images_and_files : iterable(tuple(Image, files))
+        The images to upload, each with the file or files to upload for it, as
+        given to :py:meth:`~descarteslabs.catalog.Image.upload`.  The images
+        must be unsaved.
+    max_workers : int, optional
+        The maximum number of images whose uploads are created and whose files
+        are transferred concurrently.  Defaults to 8.
+    retries : int, optional
+        The number of times a transient failure is retried for each file.
+        Defaults to 3.
+    overwrite : bool, optional
+        If True, then permit overwriting of existing images with the same ids.
+        See :py:meth:`~descarteslabs.catalog.Image.upload`.  Defaults to False.
+    warn_transient_errors : bool, optional
+        Any transient errors while periodically checking the upload status are
+        suppressed.  If True, those errors will be printed as warnings.  Defaults
+        to True.
+
+    Returns
+    -------
+    generator(BulkUploadResult)
+        The results of the uploads, as they complete.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import bulk_upload
+    >>> for result in bulk_upload(zip(images, files)): # doctest: +SKIP
+    ...     if not result.success:
+    ...         print(result)
+    """
+    from .image_upload import ImageUpload
+
+    # products are looked up once rather than for each image
+    products = {}
+    products_lock = threading.Lock()
+
+    def upload_image(image, files):
+        product_id = image.product_id
+        with products_lock:
+            if product_id not in products:
+                products[product_id] = image.product
+        product = products[product_id]
+        if product is not None and "product" not in image._attributes:
+            # the immutable product can be set once, to the one of product_id
+            image.product = product
+        return image.upload(
+            files, overwrite=overwrite, max_workers=1, retries=retries, progress=False
+        )
+
+    images_and_files = iter(images_and_files)
+    intervals = itertools.chain(
+        ImageUpload._POLLING_INTERVALS,
+        itertools.repeat(ImageUpload._POLLING_INTERVALS[-1]),
+    )
+    # the images and uploads being processed, by upload id
+    pending = {}
+    next_poll = None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        transfers = {}
+
+        def submit():
+            # keep the workers busy without reading all images up front
+            for image, files in itertools.islice(
+                images_and_files, 2 * max_workers - len(transfers)
+            ):
+                transfers[executor.submit(upload_image, image, files)] = image
+
+        submit()
+        while transfers or pending:
+            timeout = None
+            if pending:
+                timeout = max(next_poll - time.monotonic(), 0)
+
+            if transfers:
+                done, _ = concurrent.futures.wait(
+                    transfers,
+                    timeout=timeout,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    image = transfers.pop(future)
+                    try:
+                        upload = future.result()
+                    except Exception as e:
+                        yield BulkUploadResult(image, exception=e)
+                    else:
+                        if upload.status in ImageUpload._TERMINAL_STATES:
+                            yield BulkUploadResult(image, upload)
+                        else:
+                            pending[upload.id] = (image, upload)
+                            if next_poll is None:
+                                next_poll = time.monotonic() + next(intervals)
+                submit()
+            elif timeout:
+                time.sleep(timeout)
+
+            if not pending or time.monotonic() < next_poll:
+                continue
+
+            uploads = [upload for _, upload in pending.values()]
+            search = ImageUpload.search(client=uploads[0]._client, includes=False)
+            # uploads can only be searched by product
+            search = search.filter(
+                properties.product_id.any_of(
+                    sorted({upload.product_id for upload in uploads})
+                )
+                & properties.id.any_of(list(pending))
+            )
+            try:
+                completed = [
+                    found.id
+                    for found in search
+                    if found.id in pending
+                    and found.status in ImageUpload._TERMINAL_STATES
+                ]
+            except TRANSIENT_EXCEPTIONS as e:
+                # try again on the next interval
+                completed = []
+                if warn_transient_errors:
+                    warnings.warn(
+                        "In bulk_upload: error fetching status for {} uploads; "
+                        "will retry: {}".format(len(pending), e)
+                    )
+
+            for upload_id in completed:
+                image, upload = pending[upload_id]
+                try:
+                    # the events and the uploaded image
+                    upload.reload()
+                except TRANSIENT_EXCEPTIONS as e:
+                    if warn_transient_errors:
+                        warnings.warn(
+                            "In bulk_upload: error fetching status for ImageUpload "
+                            "{!r}; will retry: {}".format(upload_id, e)
+                        )
+                    continue
+                del pending[upload_id]
+                yield BulkUploadResult(image, upload)
+
+            next_poll = time.monotonic() + next(intervals) if pending else None
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import json
 import urllib.parse
 from functools import wraps
@@ -33,6 +34,7 @@ from .attributes import (
     TypedAttribute,
 )
 from .catalog_client import CatalogClient, HttpRequestMethod
+from .metadata_cache import metadata_cache
 from .search import Search
 
 
@@ -56,6 +58,27 @@ class UnsavedObjectError(Exception):
     pass
 
 
+class GetManyError(RuntimeError):
+    """Several requests for the chunks of ids of a `get_many` failed.
+
+    Raised by :py:meth:`CatalogObject.get_many` and
+    :py:meth:`CatalogObject.iter_many` from the failure of the first chunk.
+
+    Attributes
+    ----------
+    errors : list(Exception)
+        The exception of each failed request, in the order of the chunks.
+    """
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super(GetManyError, self).__init__(
+            "{} requests failed: {}".format(
+                len(self.errors), "; ".join(repr(e) for e in self.errors)
+            )
+        )
+
+
 def check_deleted(f):
     @wraps(f)
     def wrapper(self, *args, **kwargs):
@@ -158,6 +181,12 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
     # Type returned by collect() on the corresponding Search object
     _collection_type = Collection
 
+    # Maximum number of ids sent in a single get_many request
+    _MAX_IDS_PER_REQUEST = 500
+
+    # Whether get requests can be served from the metadata cache
+    _cache_metadata = False
+
     id = TypedAttribute(
         str,
         mutable=False,
@@ -542,13 +571,31 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
             network request.
         """
         try:
-            data, related_objects = cls._send_data(
-                method=HttpRequestMethod.GET,
-                id=id,
-                client=client,
-                request_params=request_params,
-                headers=headers,
-            )
+            if (
+                cls._cache_metadata
+                and metadata_cache.cache_get
+                and not request_params
+                and not headers
+            ):
+                client = client or CatalogClient.get_default_client()
+                response = metadata_cache.get(
+                    cls._doc_type,
+                    id,
+                    client,
+                    lambda: cls._send_request(
+                        method=HttpRequestMethod.GET, id=id, client=client
+                    ),
+                )
+                data = response["data"]
+                related_objects = cls._load_related_objects(response, client)
+            else:
+                data, related_objects = cls._send_data(
+                    method=HttpRequestMethod.GET,
+                    id=id,
+                    client=client,
+                    request_params=request_params,
+                    headers=headers,
+                )
         except NotFoundError:
             return None
 
@@ -614,7 +661,13 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
 
     @classmethod
     def get_many(
-        cls, ids, ignore_missing=False, client=None, request_params=None, headers=None
+        cls,
+        ids,
+        ignore_missing=False,
+        client=None,
+        request_params=None,
+        headers=None,
+        max_workers=None,
     ):
         """Get existing objects from the Descartes Labs catalog.
 
@@ -625,6 +678,10 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         :meth:`SpectralBand.get_many`, you will only receive that type.  Use
         :meth:`Band.get_many` to receive any type.
 
+        Large lists of ids are split into chunks of at most ``_MAX_IDS_PER_REQUEST``
+        ids which are retrieved concurrently.  Also see :py:meth:`iter_many` to
+        consume the objects as the chunks arrive.
+
         Parameters
         ----------
         ids : list(str)
@@ -638,6 +695,12 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
             catalog.  The
             :py:meth:`~descarteslabs.catalog.CatalogClient.get_default_client` will
             be used if not set.
+        max_workers : int, default None
+            Maximum number of threads to use to retrieve the chunks of ids.
+            If None, it defaults to the number of processors on the machine,
+            multiplied by 5.
+            Note that unnecessary threads *won't* be created if ``max_workers``
+            is greater than the number of chunks.
 
         Returns
         -------
@@ -649,49 +712,168 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         NotFoundError
             If any of the requested objects do not exist in the Descartes Labs catalog
             and `ignore_missing` is ``False``.
+        GetManyError
+            If more than one chunk of ids failed to be retrieved, with the
+            exception of each chunk in its ``errors``.
         ~descarteslabs.exceptions.ClientError or ~descarteslabs.exceptions.ServerError
             :ref:`Spurious exception <network_exceptions>` that can occur during a
             network request.
         """
+        objects_by_id = {
+            obj.id: obj
+            for obj in cls.iter_many(
+                ids,
+                ignore_missing=ignore_missing,
+                client=client,
+                request_params=request_params,
+                headers=headers,
+                max_workers=max_workers,
+            )
+        }
+
+        return [
+            objects_by_id[id_] for id_ in dict.fromkeys(ids) if id_ in objects_by_id
+        ]
 
+    @classmethod
+    def iter_many(
+        cls,
+        ids,
+        ignore_missing=False,
+        client=None,
+        request_params=None,
+        headers=None,
+        max_workers=None,
+    ):
+        """Get existing objects from the Descartes Labs catalog as they arrive.
+
+        This behaves like :py:meth:`get_many`, except that the objects are yielded
+        as soon as the chunk of ids containing them has been retrieved.  The
+        order of the objects is therefore not guaranteed.
+
+        Parameters
+        ----------
+        ids : list(str)
+            A list of identifiers for the objects you are requesting.
+        ignore_missing : bool, optional
+            Whether to raise a `~descarteslabs.exceptions.NotFoundError`
+            exception if any of the requested objects are not found in the Descartes
+            Labs catalog.  ``False`` by default which raises the exception once
+            all retrieved objects have been yielded.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for requests to the Descartes Labs
+            catalog.  The
+            :py:meth:`~descarteslabs.catalog.CatalogClient.get_default_client` will
+            be used if not set.
+        max_workers : int, default None
+            Maximum number of threads to use to retrieve the chunks of ids.
+            If None, it defaults to the number of processors on the machine,
+            multiplied by 5.
+
+        Returns
+        -------
+        generator(:py:class:`~descarteslabs.catalog.CatalogObject`)
+            Generator of the objects you requested.
+
+        Raises
+        ------
+        NotFoundError
+            If any of the requested objects do not exist in the Descartes Labs catalog
+            and `ignore_missing` is ``False``.
+        GetManyError
+            If more than one chunk of ids failed to be retrieved, with the
+            exception of each chunk in its ``errors``.
+        ~descarteslabs.exceptions.ClientError or ~descarteslabs.exceptions.ServerError
+            :ref:`Spurious exception <network_exceptions>` that can occur during a
+            network request.
+        """
         if not isinstance(ids, list) or any(not isinstance(id_, str) for id_ in ids):
             raise TypeError("ids must be a list of strings")
 
-        id_filter = {"name": "id", "op": "eq", "val": ids}
-
-        raw_objects, related_objects = cls._send_data(
-            method=HttpRequestMethod.PUT,
-            client=client,
-            json={"filter": json.dumps([id_filter], separators=(",", ":"))},
-            request_params=request_params,
-            headers=headers,
+        return cls._iter_many(
+            ids, ignore_missing, client, request_params, headers, max_workers
         )
 
+    @classmethod
+    def _iter_many(
+        cls, ids, ignore_missing, client, request_params, headers, max_workers
+    ):
+        client = client or CatalogClient.get_default_client()
+        unique_ids = list(dict.fromkeys(ids))
+        chunks = [
+            unique_ids[i : i + cls._MAX_IDS_PER_REQUEST]
+            for i in range(0, len(unique_ids), cls._MAX_IDS_PER_REQUEST)
+        ] or [[]]
+
+        def get_chunk(chunk):
+            return cls._send_data(
+                method=HttpRequestMethod.PUT,
+                client=client,
+                json={
+                    "filter": json.dumps(
+                        [{"name": "id", "op": "eq", "val": chunk}],
+                        separators=(",", ":"),
+                    )
+                },
+                request_params=request_params,
+                headers=headers,
+            )
+
+        def completed_chunks():
+            if len(chunks) == 1:
+                yield get_chunk(chunks[0])
+                return
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = {
+                    executor.submit(get_chunk, chunk): i
+                    for i, chunk in enumerate(chunks)
+                }
+                exceptions = {}
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        try:
+                            result = future.result()
+                        except Exception as ex:
+                            exceptions[futures[future]] = ex
+                        else:
+                            yield result
+                finally:
+                    # don't send the remaining requests if the iteration stopped
+                    for future in futures:
+                        future.cancel()
+
+                exceptions = [exceptions[i] for i in sorted(exceptions)]
+                if len(exceptions) == 1:
+                    raise exceptions[0]
+                elif exceptions:
+                    raise GetManyError(exceptions) from exceptions[0]
+
+        received_ids = set()
+        for raw_objects, related_objects in completed_chunks():
+            for obj in raw_objects:
+                received_ids.add(obj["id"])
+                model_class = cls._get_model_class(obj)
+                if issubclass(model_class, cls):
+                    yield model_class(
+                        id=obj["id"],
+                        client=client,
+                        _saved=True,
+                        _relationships=obj.get("relationships"),
+                        _related_objects=related_objects,
+                        **obj["attributes"],
+                    )
+
         if not ignore_missing:
-            received_ids = set(obj["id"] for obj in raw_objects)
-            missing_ids = set(ids) - received_ids
+            missing_ids = [id_ for id_ in unique_ids if id_ not in received_ids]
 
             if len(missing_ids) > 0:
                 raise NotFoundError(
                     "Objects not found for ids: {}".format(", ".join(missing_ids))
                 )
 
-        objects = [
-            model_class(
-                id=obj["id"],
-                client=client,
-                _saved=True,
-                _relationships=obj.get("relationships"),
-                _related_objects=related_objects,
-                **obj["attributes"],
-            )
-            for obj in raw_objects
-            for model_class in (cls._get_model_class(obj),)
-            if issubclass(model_class, cls)
-        ]
-
-        return objects
-
     @classmethod
     @check_derived
     def exists(cls, id, client=None, headers=None):
@@ -821,6 +1003,7 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         data, related_objects = self._send_data(
             method=method, id=self.id, json=json, client=self._client, headers=headers
         )
+        self._invalidate_cached_metadata(data["id"])
 
         self._initialize(
             id=data["id"],
@@ -922,6 +1105,8 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
             return True  # non-200 will raise an exception
         except NotFoundError:
             return False
+        finally:
+            cls._invalidate_cached_metadata(id)
 
     @delete.instancemethod
     @check_deleted
@@ -946,6 +1131,7 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
 
         self._client.session.delete(self._url + "/" + self.id)
         self._deleted = True  # non-200 will raise an exception
+        self._invalidate_cached_metadata(self.id)
 
     # This unused method must remain here to support unpickling any
     # pickled objects generated prior to v3.2.0.
@@ -953,10 +1139,35 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         """Obsolete, do not use"""
         self.delete()
 
+    @classmethod
+    def _invalidate_cached_metadata(cls, id):
+        # Remove any cached lookups for the object with the given id
+        if cls._cache_metadata:
+            metadata_cache.invalidate(cls._doc_type, id)
+
     @classmethod
     @check_derived
     def _send_data(
         cls, method, id=None, json=None, client=None, request_params=None, headers=None
+    ):
+        client = client or CatalogClient.get_default_client()
+        r = cls._send_request(
+            method=method,
+            id=id,
+            json=json,
+            client=client,
+            request_params=request_params,
+            headers=headers,
+        )
+        data = r["data"]
+        related_objects = cls._load_related_objects(r, client)
+
+        return data, related_objects
+
+    @classmethod
+    @check_derived
+    def _send_request(
+        cls, method, id=None, json=None, client=None, request_params=None, headers=None
     ):
         client = client or CatalogClient.get_default_client()
         session_method = getattr(client.session, method.lower())
@@ -979,11 +1190,7 @@ class CatalogObjectBase(AttributeEqualityMixin, metaclass=CatalogObjectMeta):
         if query_params:
             url += "?" + urllib.parse.urlencode(query_params)
 
-        r = session_method(url, json=json, headers=headers).json()
-        data = r["data"]
-        related_objects = cls._load_related_objects(r, client)
-
-        return data, related_objects
+        return session_method(url, json=json, headers=headers).json()
 
     @classmethod
     def _load_related_objects(cls, response, client):
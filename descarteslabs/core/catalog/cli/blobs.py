@@ -16,7 +16,7 @@ import json
 
 import click
 
-from .. import Blob, StorageType, properties as p
+from .. import Blob, StorageType, properties as p, sync_blobs
 
 from .utils import serialize
 
@@ -89,6 +89,51 @@ def list(
                 click.echo(blob)
 
 
+@blobs.command()
+@click.argument("local_dir", type=click.Path(file_okay=False))
+@click.option("--namespace", type=str, help="Defaults to the user's namespace")
+@click.option("--prefix", type=str, default="", help="Name prefix")
+@click.option(
+    "--direction",
+    type=click.Choice(("upload", "download")),
+    default="upload",
+    help="Upload the local files, or download the blobs",
+)
+@click.option(
+    "--delete",
+    is_flag=True,
+    help="Delete the blobs or files which do not exist on the source side",
+)
+@click.option("--max-workers", type=int, default=8, help="Concurrent transfers")
+@click.option("--dry-run", is_flag=True, help="Only show what would be done")
+def sync(local_dir, namespace, prefix, direction, delete, max_workers, dry_run):
+    """Synchronize a local directory with blobs."""
+    result = sync_blobs(
+        local_dir,
+        namespace=namespace,
+        prefix=prefix,
+        direction=direction,
+        delete=delete,
+        max_workers=max_workers,
+        dry_run=dry_run,
+    )
+    if dry_run:
+        transferred, deleted = f"Would {direction}", "Would delete"
+    else:
+        transferred, deleted = f"{direction.capitalize()}ed", "Deleted"
+    for name in result.transferred:
+        click.echo(f"{transferred} {name}")
+    for name in result.deleted:
+        click.echo(f"{deleted} {name}")
+    for name, e in result.errors:
+        click.echo(f"Failed {name}: {e}", err=True)
+    click.echo(result)
+    if result.errors:
+        raise click.ClickException(
+            f"{len(result.errors)} blobs could not be synchronized"
+        )
+
+
 @blobs.command()
 @click.argument("id", type=str)
 @click.argument("subject", type=str)
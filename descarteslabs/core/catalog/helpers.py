@@ -12,29 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import cachetools
 import os.path
 import json
+import tempfile
 
 from descarteslabs.exceptions import NotFoundError, BadRequestError
 from ..client.services.raster import Raster
 from ..common.property_filtering import Properties
 
 from .band import Band
+from .blob import Blob
 from .image_types import DownloadFileFormat, ResampleAlgorithm
+from .metadata_cache import BANDS_BY_PRODUCT, metadata_cache
 
 
-BANDS_BY_PRODUCT_CACHE = cachetools.TTLCache(maxsize=256, ttl=600)
-
-
-@cachetools.cached(BANDS_BY_PRODUCT_CACHE, key=lambda p, c: p)
 def cached_bands_by_product(product_id, client):
-    bands = {
-        band.name: band
-        for band in Band.search(client=client).filter(
-            Properties().product_id == product_id
-        )
-    }
+    search = Band.search(client=client).filter(Properties().product_id == product_id)
+    pages = metadata_cache.get(
+        BANDS_BY_PRODUCT,
+        product_id,
+        search._client,
+        lambda: list(search._iter_pages()),
+    )
+    bands = {band.name: band for page in pages for band in search._load_page(page)}
     return bands
 
 
@@ -50,6 +50,10 @@ def bands_to_list(bands):
     return list(bands)
 
 
+# The size up to which an image downloaded to a blob is held in memory before
+# it is uploaded; larger images are spooled to a temporary file
+BLOB_SPOOL_SIZE = 512 * 1024 * 1024
+
 # map from file extensions to GDAL file format string
 ext_to_format = {
     DownloadFileFormat.TIF: "GTiff",
@@ -95,9 +99,25 @@ def download(
     progress=None,
 ):
     """
-    Download inputs as an image file and save to file or path-like `dest`.
+    Download inputs as an image file and save to file or path-like `dest`,
+    or upload it to an unsaved Blob `dest`.
     Code shared by Scene.download and SceneCollection.download_mosaic
     """
+    if isinstance(dest, Blob):
+        return _download_to_blob(
+            inputs,
+            bands_list,
+            geocontext,
+            data_type,
+            dest,
+            format=format,
+            resampler=resampler,
+            processing_level=processing_level,
+            scales=scales,
+            nodata=nodata,
+            progress=progress,
+        )
+
     if dest is None:
         if len(inputs) == 0:
             raise ValueError("No inputs given to download")
@@ -136,6 +156,57 @@ def download(
         **raster_params,
     )
 
+    _raster(inputs, full_raster_args)
+
+    return dest
+
+
+def _download_to_blob(
+    inputs,
+    bands_list,
+    geocontext,
+    data_type,
+    blob,
+    format=DownloadFileFormat.TIF,
+    resampler=ResampleAlgorithm.NEAR,
+    processing_level=None,
+    scales=None,
+    nodata=None,
+    progress=None,
+):
+    """
+    Download inputs as an image file and upload it to the unsaved `blob`, without
+    writing it to disk unless it exceeds BLOB_SPOOL_SIZE.
+    """
+    if blob.name is None:
+        raise ValueError("name field required")
+    if os.path.splitext(blob.name)[1]:
+        format = format_from_path(blob.name)
+    else:
+        format = get_format(format)
+
+    full_raster_args = dict(
+        inputs=inputs,
+        bands=bands_list,
+        scales=scales,
+        data_type=data_type,
+        resampler=resampler,
+        processing_level=processing_level,
+        output_format=format,
+        nodata=nodata,
+        progress=progress,
+        **geocontext.raster_params,
+    )
+
+    with tempfile.SpooledTemporaryFile(max_size=BLOB_SPOOL_SIZE) as outfile:
+        _raster(inputs, dict(full_raster_args, outfile=outfile))
+        outfile.seek(0)
+        blob.upload(outfile)
+
+    return blob
+
+
+def _raster(inputs, full_raster_args):
     try:
         Raster.get_default_client().raster(**full_raster_args)
     except NotFoundError:
@@ -153,9 +224,8 @@ def download(
             "For reference, Raster.raster was called with these arguments:\n"
             "{args}"
         )
-        msg = msg.format(err=e, args=json.dumps(full_raster_args, indent=2))
+        args = {k: v for k, v in full_raster_args.items() if k != "outfile"}
+        msg = msg.format(err=e, args=json.dumps(args, indent=2))
         raise BadRequestError(msg) from None
     except ValueError as e:
         raise e
-
-    return dest
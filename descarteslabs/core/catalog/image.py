@@ -12,11 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import io
 import json
-import os.path
+import threading
 import warnings
-from tempfile import NamedTemporaryFile
 
 try:
     import collections.abc as abc
@@ -25,6 +25,7 @@ except ImportError:
 
 from affine import Affine
 import numpy as np
+from tqdm import tqdm
 
 from descarteslabs.exceptions import BadRequestError, NotFoundError
 
@@ -50,10 +51,166 @@ from .image_types import DownloadFileFormat, ResampleAlgorithm
 from .named_catalog_base import NamedCatalogObject
 from .scaling import scaling_parameters
 from .search import AggregateDateField, GeoSearch, SummarySearchMixin
+from .transfer import call_with_retries
 
 properties = Properties()
 
 
+class _NpyStream(io.RawIOBase):
+    """A readable file of an array in ``.npy`` format, read from memory.
+
+    The ``.npy`` header is followed by the data of the array itself, so the
+    array is not saved to disk nor copied in memory, except for a block of
+    rows at a time when the array is not contiguous.  The stream is seekable,
+    so that its size is known and it can be read again to retry an upload.
+    """
+
+    # the largest block of a non-contiguous array copied at a time
+    _BLOCK_SIZE = 16 * 1024 * 1024
+
+    mode = "rb"
+
+    def __init__(self, array, name):
+        super().__init__()
+        self.name = name
+
+        header = io.BytesIO()
+        header_data = np.lib.format.header_data_from_array_1_0(array)
+        try:
+            np.lib.format.write_array_header_1_0(header, header_data)
+        except ValueError:
+            # the header is too large for version 1.0 of the format
+            header = io.BytesIO()
+            np.lib.format.write_array_header_2_0(header, header_data)
+        self._header = memoryview(header.getvalue())
+
+        if array.flags.c_contiguous:
+            self._data = self._bytes(array)
+        elif array.flags.f_contiguous:
+            # the header marks the data as being in fortran order
+            self._data = self._bytes(array.T)
+        else:
+            self._data = None
+            self._array = array
+            row_size = array.nbytes // array.shape[0] if array.shape[0] else 0
+            self._block_rows = max(1, self._BLOCK_SIZE // max(row_size, 1))
+            self._block_size = self._block_rows * row_size
+            self._block_index = None
+            self._block = None
+
+        self._size = len(self._header) + array.nbytes
+        self._position = 0
+
+    @staticmethod
+    def _bytes(array):
+        return memoryview(array.reshape(-1).view(np.uint8))
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError("Invalid whence ({})".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {}".format(position))
+        self._position = position
+        return position
+
+    def _chunk(self, position):
+        # The bytes from a position up to the end of the header or block
+        if position < len(self._header):
+            return self._header[position:]
+
+        position -= len(self._header)
+        if self._data is not None:
+            return self._data[position:]
+
+        index = position // self._block_size
+        if index != self._block_index:
+            start = index * self._block_rows
+            block = self._array[start : start + self._block_rows]
+            self._block = self._bytes(np.ascontiguousarray(block))
+            self._block_index = index
+        return self._block[position - index * self._block_size :]
+
+    def readinto(self, buffer):
+        buffer = memoryview(buffer).cast("B")
+        n = 0
+        while n < len(buffer) and self._position < self._size:
+            chunk = self._chunk(self._position)
+            count = min(len(buffer) - n, len(chunk))
+            buffer[n : n + count] = chunk[:count]
+            self._position += count
+            n += count
+        return n
+
+    def close(self):
+        self._header = self._data = self._array = self._block = None
+        super().close()
+
+
+def _remaining_size(file):
+    # The number of bytes from the current position to the end of a binary file,
+    # or None if the file is not seekable
+    try:
+        position = file.tell()
+        end = file.seek(0, io.SEEK_END)
+        file.seek(position)
+    except (OSError, ValueError):
+        return None
+    return end - position
+
+
+class _UploadFile(object):
+    """A binary file being uploaded, which reports the bytes read to a progress bar.
+
+    The file can be rewound to where the upload started, so that the upload can
+    be retried.
+    """
+
+    def __init__(self, file, progress_bar=None, lock=None):
+        self._file = file
+        self._progress_bar = progress_bar
+        self._lock = lock
+        self._count = 0
+
+    def _update(self, n):
+        if self._progress_bar is not None and n:
+            with self._lock:
+                self._progress_bar.update(n)
+
+    def read(self, size=-1):
+        data = self._file.read(size)
+        self._count += len(data)
+        self._update(len(data))
+        return data
+
+    def tell(self):
+        return self._file.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self._file.seek(offset, whence)
+
+    def rewind(self):
+        """Return to where the upload started, if anything was read."""
+        if self._count:
+            self._file.seek(-self._count, io.SEEK_CUR)
+            self._update(-self._count)
+            self._count = 0
+
+
 class ImageSummaryResult(object):
     """
     The readonly data returned by :py:meth:`SummaySearch.summary` or
@@ -450,6 +607,9 @@ class Image(NamedCatalogObject):
         "float64",
     )
 
+    # the default maximum number of files uploaded concurrently
+    _UPLOAD_MAX_WORKERS = 8
+
     def __init__(self, **kwargs):
         super(Image, self).__init__(**kwargs)
         self._geocontext = None
@@ -579,7 +739,15 @@ class Image(NamedCatalogObject):
         )
 
     @check_deleted
-    def upload(self, files, upload_options=None, overwrite=False):
+    def upload(
+        self,
+        files,
+        upload_options=None,
+        overwrite=False,
+        max_workers=None,
+        retries=3,
+        progress=False,
+    ):
         """Uploads imagery from a file (or files).
 
         Uploads imagery from a file (or files) in GeoTIFF or JP2 format to be ingested
@@ -606,6 +774,16 @@ class Image(NamedCatalogObject):
             USE WITH CAUTION: This can cause data cache inconsistencies in the platform,
             and should only be used for infrequent needs to update the image file
             contents. You can expect inconsistencies to endure for a period afterwards.
+        max_workers : int, optional
+            The maximum number of files uploaded concurrently.  Defaults to the
+            number of files, up to 8.
+        retries : int, optional
+            The number of times the upload of a file is retried after a transient
+            failure.  Defaults to 3.
+        progress : None, bool, optional
+            Controls display of a progress bar of the bytes uploaded across all
+            files.  ``None`` displays it only in an interactive session.
+            Defaults to False.
 
         Returns
         -------
@@ -678,7 +856,13 @@ class Image(NamedCatalogObject):
         upload_options.upload_type = ImageUploadType.FILE
         upload_options.image_files = filenames
 
-        return self._do_upload(files, upload_options)
+        return self._do_upload(
+            files,
+            upload_options,
+            max_workers=max_workers,
+            retries=retries,
+            progress=progress,
+        )
 
     @check_deleted
     def upload_ndarray(
@@ -689,6 +873,9 @@ class Image(NamedCatalogObject):
         overviews=None,
         overview_resampler=None,
         overwrite=False,
+        max_workers=None,
+        retries=3,
+        progress=False,
     ):
         """Uploads imagery from an ndarray to be ingested as an Image.
 
@@ -739,6 +926,16 @@ class Image(NamedCatalogObject):
             USE WITH CAUTION: This can cause data cache inconsistencies in the platform,
             and should only be used for infrequent needs to update the image file
             contents. You can expect inconsistencies to endure for a period afterwards.
+        max_workers : int, optional
+            The maximum number of files uploaded concurrently.  Defaults to the
+            number of files, up to 8.
+        retries : int, optional
+            The number of times the upload of a file is retried after a transient
+            failure.  Defaults to 3.
+        progress : None, bool, optional
+            Controls display of a progress bar of the bytes uploaded across all
+            files.  ``None`` displays it only in an interactive session.
+            Defaults to False.
 
         Raises
         ------
@@ -797,7 +994,8 @@ class Image(NamedCatalogObject):
             )
 
         # validate the shape of each ndarray
-        # modify image data to shift axes to what ingest expects
+        # shift axes to what ingest expects, without modifying the given arrays
+        arrays = []
         for idx, image_data in enumerate(ndarray):
             if not isinstance(image_data, (np.ndarray, np.generic)):
                 raise ValueError(f"The item at index {idx} is not an ndarray")
@@ -830,7 +1028,9 @@ class Image(NamedCatalogObject):
                         "'(band, x, y)'".format(image_data.shape)
                     )
                 # v1 ingest expects (X,Y,bands)
-                ndarray[idx] = np.moveaxis(image_data, 0, -1)
+                image_data = np.moveaxis(image_data, 0, -1)
+
+            arrays.append(image_data)
 
         # default to raster_meta fields if not explicitly provided
         if raster_meta:
@@ -856,37 +1056,25 @@ class Image(NamedCatalogObject):
         if overview_resampler:
             upload_options.overview_resampler = overview_resampler
 
-        # write all the ndarrays to files so that _do_upload can read them
-        files = []
-        upload_size = 0
+        # stream the ndarrays from memory in .npy format
+        files = [
+            _NpyStream(np.asarray(image_data), "{}_{}.npy".format(self.name, idx))
+            for idx, image_data in enumerate(arrays)
+        ]
+        upload_options.upload_size = sum(image_data.nbytes for image_data in arrays)
+        upload_options.image_files = [f.name for f in files]
 
         try:
-            for image_data in ndarray:
-                upload_size += image_data.nbytes
-                tmp = NamedTemporaryFile(delete=False)
-                files.append(tmp)
-                np.save(tmp, image_data, allow_pickle=False)
-                # From tempfile docs:
-                # Whether the name can be used to open the file a second time,
-                # while the named temporary file is still open, varies across
-                # platforms (it can be so used on Unix; it cannot on Windows
-                # NT or later)
-                # We close the underlying file object so _do_upload can open
-                # the path again in a cross platform compatible way.
-                # Cleanup is manual in the finally block.
-                tmp.close()
-
-            file_names = [f.name for f in files]
-            upload_options.upload_size = upload_size
-            upload_options.image_files = file_names
-
-            return self._do_upload(file_names, upload_options)
+            return self._do_upload(
+                files,
+                upload_options,
+                max_workers=max_workers,
+                retries=retries,
+                progress=progress,
+            )
         finally:
             for file in files:
-                try:
-                    os.unlink(file.name)
-                except OSError:
-                    pass
+                file.close()
 
     def image_uploads(self):
         """A search query for all uploads for this image created by this user.
@@ -905,7 +1093,9 @@ class Image(NamedCatalogObject):
         )
 
     # the upload implementation is broken out so it can be used from multiple methods
-    def _do_upload(self, files, upload_options):
+    def _do_upload(
+        self, files, upload_options, max_workers=None, retries=3, progress=False
+    ):
         from .image_upload import ImageUpload, ImageUploadStatus
 
         upload = ImageUpload(
@@ -916,18 +1106,61 @@ class Image(NamedCatalogObject):
 
         headers = {"content-type": "application/octet-stream"}
 
-        for file, upload_url in zip(files, upload.resumable_urls):
-            if isinstance(file, io.IOBase):
-                if "b" not in file.mode:
-                    file.close()
-                    file = io.open(file.name, "rb")
-                f = file
-            else:
-                f = io.open(file, "rb")
+        opened = []
+        try:
+            for file in files:
+                if isinstance(file, io.IOBase):
+                    if "b" not in file.mode:
+                        file.close()
+                        file = io.open(file.name, "rb")
+                    opened.append(file)
+                else:
+                    opened.append(io.open(file, "rb"))
+
+            sizes = [_remaining_size(f) for f in opened]
+            progress_bar = (
+                tqdm(
+                    desc="Uploading",
+                    total=None if None in sizes else sum(sizes),
+                    unit_scale=True,
+                    unit_divisor=1024,
+                    unit="B",
+                    disable=False if progress is True else None,
+                )
+                if progress is not False
+                else None
+            )
+            lock = threading.Lock()
 
-            try:
+            def put_file(f, upload_url):
+                # a retry sends the whole file again
+                f.rewind()
                 self._upload_service.session.put(upload_url, data=f, headers=headers)
+
+            def upload_file(f, upload_url):
+                f = _UploadFile(f, progress_bar, lock)
+                # rate limiting of any file delays the uploads of all files
+                call_with_retries(lambda: put_file(f, upload_url), retries)
+
+            if max_workers is None:
+                max_workers = min(len(opened), self._UPLOAD_MAX_WORKERS)
+
+            try:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(max_workers, 1)
+                ) as executor:
+                    futures = [
+                        executor.submit(upload_file, f, upload_url)
+                        for f, upload_url in zip(opened, upload.resumable_urls)
+                    ]
+                    # raise the first failure, once all uploads have completed
+                    for future in futures:
+                        future.result()
             finally:
+                if progress_bar is not None:
+                    progress_bar.close()
+        finally:
+            for f in opened:
                 f.close()
 
         upload.status = ImageUploadStatus.PENDING
@@ -1139,13 +1372,35 @@ class Image(NamedCatalogObject):
         data_type=None,
         progress=None,
     ):
-        if not (-3 < bands_axis < 3):
-            raise ValueError(
-                "Invalid bands_axis; axis {} would not exist in a 3D array".format(
-                    bands_axis
-                )
-            )
+        raster_args = self._raster_args(
+            bands,
+            geocontext,
+            mask_nodata=mask_nodata,
+            mask_alpha=mask_alpha,
+            resampler=resampler,
+            processing_level=processing_level,
+            scaling=scaling,
+            data_type=data_type,
+            progress=progress,
+        )
+        return self._raster_ndarray(
+            raster_args, bands_axis=bands_axis, raster_info=raster_info
+        )
 
+    def _raster_args(
+        self,
+        bands,
+        geocontext,
+        mask_nodata=True,
+        mask_alpha=None,
+        resampler=ResampleAlgorithm.NEAR,
+        processing_level=None,
+        scaling=None,
+        data_type=None,
+        progress=None,
+    ):
+        # The arguments for Raster.ndarray, other than the image id, which are
+        # the same for all images of the same product
         bands = bands_to_list(bands)
         product_bands = cached_bands_by_product(self.product_id, self._client)
 
@@ -1187,8 +1442,7 @@ class Image(NamedCatalogObject):
                     )
 
         raster_params = geocontext.raster_params
-        full_raster_args = dict(
-            inputs=[self.id],
+        return dict(
             order="gdal",
             bands=bands,
             scales=scales,
@@ -1203,6 +1457,21 @@ class Image(NamedCatalogObject):
             **raster_params,
         )
 
+    def _raster_ndarray(
+        self, raster_args, bands_axis=0, raster_info=False, raster_request=None
+    ):
+        if not (-3 < bands_axis < 3):
+            raise ValueError(
+                "Invalid bands_axis; axis {} would not exist in a 3D array".format(
+                    bands_axis
+                )
+            )
+
+        # raster_request is an optional NdarrayRequest for the raster_args
+        full_raster_args = dict(inputs=[self.id], **raster_args)
+        if raster_request is not None:
+            full_raster_args["request"] = raster_request
+
         try:
             arr, info = Raster.get_default_client().ndarray(**full_raster_args)
 
@@ -1211,6 +1480,7 @@ class Image(NamedCatalogObject):
                 "'{}' does not exist in the Descartes Labs catalog".format(self.id)
             ) from None
         except BadRequestError as e:
+            full_raster_args.pop("request", None)
             msg = (
                 "Error with request:\n"
                 "{err}\n"
@@ -1267,7 +1537,7 @@ class Image(NamedCatalogObject):
             in the units native to the specified or defaulted output CRS.
         all_touched : float, default None
             if not None, update the geocontext with this value to control rastering behavior.
-        dest : str or path-like object, default None
+        dest : str, path-like object or Blob, default None
             Where to write the image file.
 
             * If None (default), it's written to an image file of the given ``format``
@@ -1281,6 +1551,10 @@ class Image(NamedCatalogObject):
 
               Note that path-like objects (such as pathlib.Path) are only supported
               in Python 3.6 or later.
+            * If an unsaved :py:class:`~descarteslabs.catalog.Blob`, the image is
+              uploaded to it, without writing it to local disk unless it exceeds
+              512 MiB.  The Blob must have a ``name``, and the ``format`` is
+              determined from its extension if it has one.
         format : `DownloadFileFormat`, default `DownloadFileFormat.TIF`
             Output file format to use
             If a str or path-like object is given as ``dest``, ``format`` is ignored
@@ -1307,9 +1581,10 @@ class Image(NamedCatalogObject):
 
         Returns
         -------
-        path : str or None
+        path : str, Blob or None
             If ``dest`` is None or a path, the path where the image file was written is returned.
             If ``dest`` is file-like, nothing is returned.
+            If ``dest`` is a Blob, the saved Blob is returned.
 
         Example
         -------
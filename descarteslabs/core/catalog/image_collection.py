@@ -16,21 +16,105 @@ import collections
 import concurrent.futures
 import json
 import os
+import struct
+import zlib
+from datetime import datetime
 
 import numpy as np
+import shapely
 
 from descarteslabs.exceptions import NotFoundError, BadRequestError
 
 from ..common.collection import Collection
-from ..common.geo import GeoContext, AOI
+from ..common.dltile import Grid, Tile
+from ..common.geo import GeoContext, AOI, DLTile, XYZTile
+from ..common.shapely_support import geometry_like_to_shapely
 from ..client.services.raster import Raster
 
-from .attributes import ResolutionUnit
+from .attributes import ResolutionUnit, Timestamp
 from .image_types import ResampleAlgorithm, DownloadFileFormat
 from .helpers import bands_to_list, cached_bands_by_product, download, is_path_like
 from .scaling import multiproduct_scaling_parameters, append_alpha_scaling
 
 
+def _coverage(shape, footprints):
+    # The fraction of shape covered by each of an array of footprints
+    coverage = np.zeros(len(footprints), dtype=np.float64)
+    if len(footprints) == 0:
+        return coverage
+
+    # only compute the (expensive) intersection for footprints that
+    # intersect at all, using the prepared geometry for the predicate
+    shapely.prepare(shape)
+    candidates = np.flatnonzero(shapely.intersects(shape, footprints))
+    if len(candidates):
+        intersections = shapely.intersection(footprints[candidates], shape)
+        coverage[candidates] = shapely.area(intersections) / shape.area
+
+    return coverage
+
+
+# Header of the binary format written by ImageCollection.to_bytes()
+_MAGIC = b"DLIC"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sB")
+
+_GEOCONTEXT_TYPES = {cls.__name__: cls for cls in (AOI, DLTile, XYZTile)}
+
+
+def _from_isoformat(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _encode_geocontext_value(value):
+    if isinstance(value, shapely.Geometry):
+        return {"wkb": shapely.to_wkb(value, hex=True)}
+    if isinstance(value, tuple):
+        return [_encode_geocontext_value(v) for v in value]
+    return value
+
+
+def _decode_geocontext_value(value):
+    if isinstance(value, dict):
+        return shapely.from_wkb(value["wkb"])
+    if isinstance(value, list):
+        return tuple(_decode_geocontext_value(v) for v in value)
+    return value
+
+
+def _encode_geocontext(geocontext):
+    # The geocontext's slots, which are restored as-is without recomputing them
+    if geocontext is None:
+        return None
+    name = type(geocontext).__name__
+    if name not in _GEOCONTEXT_TYPES:
+        raise TypeError("Cannot serialize a geocontext of type {}".format(name))
+    return {
+        "type": name,
+        "state": {
+            attr: _encode_geocontext_value(value)
+            for attr, value in geocontext.__getstate__().items()
+        },
+    }
+
+
+def _decode_geocontext(encoded):
+    if encoded is None:
+        return None
+    cls = _GEOCONTEXT_TYPES[encoded["type"]]
+    geocontext = cls.__new__(cls)
+    geocontext.__setstate__(
+        {
+            attr: _decode_geocontext_value(value)
+            for attr, value in encoded["state"].items()
+        }
+    )
+    return geocontext
+
+
 class ImageCollection(Collection):
     """
     Holds Images, with methods for loading their data.
@@ -45,6 +129,8 @@ class ImageCollection(Collection):
 
     # _item_type set below due to circular imports
 
+    _default_columns = ("id", "product_id", "acquired", "cloud_fraction")
+
     def __init__(self, iterable=None, geocontext=None):
         super(ImageCollection, self).__init__(iterable)
 
@@ -126,7 +212,8 @@ class ImageCollection(Collection):
         """
         Include only images overlapping with ``geom`` by some fraction.
 
-        See `Image.coverage <descarteslabs.catalog.image.Image.coverage>`
+        See `coverage` for getting the coverage of all images, or
+        `Image.coverage <descarteslabs.catalog.image.Image.coverage>`
         for getting coverage information for an image.
 
         Parameters
@@ -152,7 +239,296 @@ class ImageCollection(Collection):
         >>> assert len(filtered_images) < len(images)  # doctest: +SKIP
         """
 
-        return self.filter(lambda i: i.coverage(geom) >= minimum_coverage)
+        coverage = self.coverage(geom)
+        return self[np.flatnonzero(coverage >= minimum_coverage)]
+
+    def coverage(self, geom):
+        """
+        The fraction of a geometry-like object covered by each Image's geometry.
+
+        This gives the same results as calling
+        `Image.coverage <descarteslabs.catalog.image.Image.coverage>` for every
+        image, but ``geom`` is only prepared once and the intersections with all
+        image geometries are computed as a single array operation, which is much
+        faster for large collections.
+
+        Parameters
+        ----------
+        geom : GeoJSON-like dict, :class:`~descarteslabs.common.geo.geocontext.GeoContext`, or object with __geo_interface__  # noqa: E501
+            Geometry to which to compare each image's geometry.
+
+        Returns
+        -------
+        coverage : numpy.ndarray
+            A float array with, for each image in the collection, the fraction of
+            ``geom``'s area that overlaps with the image, between 0 and 1.
+            Images without a geometry have a coverage of 0.
+
+        Example
+        -------
+        >>> import descarteslabs as dl
+        >>> product = dl.catalog.Product.get("landsat:LC08:PRE:TOAR")  # doctest: +SKIP
+        >>> images = product.images().intersects(aoi_geometry).limit(20).collect()  # doctest: +SKIP
+        >>> images.coverage(images.geocontext)  # doctest: +SKIP
+        array([0.25837064, 1.        , ...])
+        """
+
+        if isinstance(geom, GeoContext):
+            shape = geom.geometry
+        else:
+            shape = geometry_like_to_shapely(geom)
+
+        return _coverage(shape, self._footprints())
+
+    def partition_by_tiles(self, tiles, min_coverage=None):
+        """
+        Assign the images to the tiles they intersect.
+
+        Rather than filtering the whole collection once per tile, a spatial index
+        over the image geometries is built once and queried for each tile.
+
+        Parameters
+        ----------
+        tiles : Grid, or iterable of DLTile, Tile, or str
+            The tiles, as :class:`~descarteslabs.common.geo.geocontext.DLTile`
+            geocontexts, :class:`~descarteslabs.common.dltile.Tile` objects, or
+            DLTile keys.  Given a :class:`~descarteslabs.common.dltile.Grid`, the
+            tiles of that grid covering this collection's geocontext geometry (or,
+            without one, the union of the image geometries) are used.
+        min_coverage : float, optional
+            Only assign an image to a tile if it covers at least this fraction
+            of the tile, as in `filter_coverage`.  By default an image is assigned
+            to every tile it intersects.
+
+        Returns
+        -------
+        partition : dict
+            Mapping of each tile key to an `ImageCollection` of the images
+            assigned to that tile, with the tile's
+            :class:`~descarteslabs.common.geo.geocontext.DLTile` as geocontext.
+            Tiles without any images are left out.
+
+        Example
+        -------
+        >>> import descarteslabs as dl
+        >>> from descarteslabs.common.dltile import Grid
+        >>> product = dl.catalog.Product.get("usgs:landsat:oli-tirs:c2:l2:v0")  # doctest: +SKIP
+        >>> images = product.images().intersects(aoi_geometry).collect()  # doctest: +SKIP
+        >>> grid = Grid(resolution=30, tilesize=1024, pad=0)
+        >>> for key, tile_images in images.partition_by_tiles(grid).items():  # doctest: +SKIP
+        ...     stack = tile_images.stack("red green blue")
+        """
+
+        return dict(self.iter_partition_by_tiles(tiles, min_coverage=min_coverage))
+
+    def iter_partition_by_tiles(self, tiles, min_coverage=None):
+        """
+        Assign the images to the tiles they intersect, one tile at a time.
+
+        Like `partition_by_tiles`, but tiles are consumed and yielded lazily, so
+        that a large number of tiles (for example from a
+        :class:`~descarteslabs.common.dltile.Grid`, or from
+        :meth:`DLTile.iter_from_shape <descarteslabs.common.geo.geocontext.DLTile.iter_from_shape>`)
+        never has to be held in memory at once.
+
+        Parameters
+        ----------
+        tiles : Grid, or iterable of DLTile, Tile, or str
+            The tiles, see `partition_by_tiles`.
+        min_coverage : float, optional
+            Only assign an image to a tile if it covers at least this fraction
+            of the tile.
+
+        Returns
+        -------
+        Iterator of (str, ImageCollection)
+            The key of each tile with at least one image, and the images assigned
+            to that tile.
+        """  # noqa: E501
+
+        footprints = self._footprints()
+        tree = shapely.STRtree(footprints)
+
+        if isinstance(tiles, Grid):
+            tiles = tiles.tiles_from_shape(self._tiling_shape(footprints))
+        elif isinstance(tiles, (str, Tile, GeoContext)):
+            tiles = [tiles]
+
+        for tile in tiles:
+            if isinstance(tile, str):
+                tile = DLTile.from_key(tile)
+            elif isinstance(tile, Tile):
+                tile = DLTile(tile.geocontext)
+            elif not isinstance(tile, DLTile):
+                raise TypeError(
+                    "Expected a Grid, or DLTiles, Tiles or DLTile keys, not {}".format(
+                        type(tile).__name__
+                    )
+                )
+
+            shape = tile.geometry
+            indices = np.sort(tree.query(shape, predicate="intersects"))
+            if min_coverage:
+                coverage = _coverage(shape, footprints[indices])
+                indices = indices[coverage >= min_coverage]
+
+            if len(indices):
+                yield tile.key, self.__class__(
+                    [self._list[i] for i in indices], geocontext=tile
+                )
+
+    def _footprints(self):
+        return np.array([i.geometry for i in self._list], dtype=object)
+
+    def _tiling_shape(self, footprints):
+        geometry = getattr(self._geocontext, "geometry", None)
+        if geometry is not None:
+            return geometry
+        return shapely.union_all(footprints)
+
+    def to_bytes(self):
+        """Serialize the images and geocontext of this collection.
+
+        Only the attribute values of the images are serialized, column by
+        column, with the footprints in WKB, making the result much smaller and
+        faster to create than a pickle of the collection.  This is useful to
+        pass a collection to a :py:class:`~descarteslabs.compute.Function`, or
+        to store it in a :py:class:`~descarteslabs.catalog.Blob`.
+
+        Returns
+        -------
+        bytes
+            The serialized collection, which can be restored with
+            :py:meth:`from_bytes`.
+
+        Raises
+        ------
+        TypeError
+            If the geocontext is not an
+            :py:class:`~descarteslabs.common.geo.AOI`,
+            :py:class:`~descarteslabs.common.geo.DLTile` or
+            :py:class:`~descarteslabs.common.geo.XYZTile`.
+
+        Example
+        -------
+        >>> from descarteslabs.catalog import ImageCollection
+        >>> data = images.to_bytes() # doctest: +SKIP
+        >>> images = ImageCollection.from_bytes(data) # doctest: +SKIP
+        """
+        ids = []
+        columns = {}
+        for i, image in enumerate(self._list):
+            ids.append(image.id)
+            # the footprints are serialized separately, in WKB
+            attributes = image._serialize(
+                [name for name in image._attributes if name != "geometry"]
+            )
+            for name, value in attributes.items():
+                if name not in columns:
+                    columns[name] = [None] * len(self._list)
+                columns[name][i] = value
+
+        header = json.dumps(
+            {
+                "ids": ids,
+                "columns": columns,
+                "geocontext": _encode_geocontext(self._geocontext),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        wkbs = shapely.to_wkb(self._footprints())
+        # the length of each footprint, -1 for a missing footprint
+        lengths = np.array(
+            [-1 if wkb is None else len(wkb) for wkb in wkbs], dtype="<i4"
+        )
+
+        payload = b"".join(
+            [
+                struct.pack("<Q", len(header)),
+                header,
+                lengths.tobytes(),
+                b"".join(wkb for wkb in wkbs if wkb is not None),
+            ]
+        )
+        return _HEADER.pack(_MAGIC, _FORMAT_VERSION) + zlib.compress(payload, 1)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Restore a collection serialized with :py:meth:`to_bytes`.
+
+        The images are created from the serialized attribute values, as if
+        they had been retrieved from the catalog, without any requests to the
+        catalog.  The footprints are decoded all at once, and the geocontext
+        is restored as it was, without recomputing any defaults from the
+        images.
+
+        Parameters
+        ----------
+        data : bytes
+            The serialized collection.
+
+        Returns
+        -------
+        ImageCollection
+            The restored collection.
+
+        Raises
+        ------
+        ValueError
+            If `data` is not a serialized collection.
+        """
+        data = memoryview(data)
+        try:
+            magic, version = _HEADER.unpack_from(data)
+        except struct.error:
+            magic = version = None
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized ImageCollection")
+        if version != _FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported serialized ImageCollection version {}".format(version)
+            )
+
+        payload = memoryview(zlib.decompress(data[_HEADER.size :]))
+        (size,) = struct.unpack_from("<Q", payload)
+        offset = struct.calcsize("<Q")
+        header = json.loads(bytes(payload[offset : offset + size]))
+        offset += size
+
+        ids = header["ids"]
+        lengths = np.frombuffer(payload, dtype="<i4", count=len(ids), offset=offset)
+        offset += lengths.nbytes
+        wkbs = np.empty(len(ids), dtype=object)
+        for i, length in enumerate(lengths.tolist()):
+            if length >= 0:
+                wkbs[i] = bytes(payload[offset : offset + length])
+                offset += length
+        geometries = shapely.from_wkb(wkbs)
+
+        columns = header["columns"]
+        # timestamps are serialized in ISO format rather than the catalog's format
+        for name, values in columns.items():
+            if isinstance(cls._item_type._attribute_types.get(name), Timestamp):
+                columns[name] = [
+                    _from_isoformat(value) if isinstance(value, str) else value
+                    for value in values
+                ]
+
+        images = []
+        for i, id_ in enumerate(ids):
+            attributes = {
+                name: values[i]
+                for name, values in columns.items()
+                if values[i] is not None
+            }
+            if geometries[i] is not None:
+                attributes["geometry"] = geometries[i]
+            images.append(cls._item_type(id=id_, _saved=True, **attributes))
+
+        collection = cls(images)
+        collection._geocontext = _decode_geocontext(header["geocontext"])
+        return collection
 
     def stack(
         self,
@@ -367,6 +743,26 @@ class ImageCollection(Collection):
         kwargs["scaling"] = scales
         kwargs["data_type"] = data_type
 
+        # The raster request is the same for all images of a product except for
+        # the image id, so it is prepared and serialized once for each product
+        raster_requests = {}
+        raster_args_kwargs = {
+            k: v for k, v in kwargs.items() if k not in ("bands_axis", "raster_info")
+        }
+        for image in images:
+            if isinstance(image, Image) and image.product_id not in raster_requests:
+                raster_args = image._raster_args(
+                    bands, geocontext, **raster_args_kwargs
+                )
+                request = Raster.get_default_client().ndarray_request(
+                    **{
+                        k: v
+                        for k, v in raster_args.items()
+                        if k not in ("order", "masked", "progress")
+                    }
+                )
+                raster_requests[image.product_id] = (raster_args, request)
+
         def threaded_ndarrays():
             def data_loader(image_or_imagecollection, bands, geocontext, **kwargs):
                 if isinstance(image_or_imagecollection, self.__class__):
@@ -374,8 +770,14 @@ class ImageCollection(Collection):
                         bands, geocontext, **kwargs
                     )
                 else:
-                    return lambda: image_or_imagecollection._ndarray(
-                        bands, geocontext, **kwargs
+                    raster_args, request = raster_requests[
+                        image_or_imagecollection.product_id
+                    ]
+                    return lambda: image_or_imagecollection._raster_ndarray(
+                        raster_args,
+                        bands_axis=kwargs["bands_axis"],
+                        raster_info=kwargs["raster_info"],
+                        raster_request=request,
                     )
 
             with concurrent.futures.ThreadPoolExecutor(
@@ -887,7 +1289,7 @@ class ImageCollection(Collection):
             in the units native to the specified or defaulted output CRS.
         all_touched : float, default None
             if not None, update the geocontext with this value to control rastering behavior.
-        dest : str or path-like object, default None
+        dest : str, path-like object or Blob, default None
             Where to write the image file.
 
             * If None (default), it's written to an image file of the given ``format``
@@ -901,6 +1303,10 @@ class ImageCollection(Collection):
 
               Note that path-like objects (such as pathlib.Path) are only supported
               in Python 3.6 or later.
+            * If an unsaved :py:class:`~descarteslabs.catalog.Blob`, the image is
+              uploaded to it, without writing it to local disk unless it exceeds
+              512 MiB.  The Blob must have a ``name``, and the ``format`` is
+              determined from its extension if it has one.
         format : `DownloadFileFormat`, default `DownloadFileFormat.TIF`
             Output file format to use.
             If a str or path-like object is given as ``dest``, ``format`` is ignored
@@ -933,9 +1339,10 @@ class ImageCollection(Collection):
 
         Returns
         -------
-        path : str or None
+        path : str, Blob or None
             If ``dest`` is a path or None, the path where the image file was written is returned.
             If ``dest`` is file-like, nothing is returned.
+            If ``dest`` is a Blob, the saved Blob is returned.
 
         Example
         -------
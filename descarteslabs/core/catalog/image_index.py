@@ -0,0 +1,187 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+
+import numpy as np
+import shapely
+
+from ..common.shapely_support import geometry_like_to_shapely
+from .attributes import parse_iso_datetime
+from .image_collection import ImageCollection
+
+
+def _timestamp(value):
+    if isinstance(value, str):
+        try:
+            value = parse_iso_datetime(value)
+        except ValueError:
+            value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class ImageIndex(object):
+    """An in-process spatial and temporal index over image footprints.
+
+    The index answers the same questions as an
+    :py:class:`~descarteslabs.catalog.ImageSearch` with an
+    :py:meth:`~descarteslabs.catalog.ImageSearch.intersects` geometry, an
+    ``acquired`` date range and a property filter, but without any requests to
+    the Descartes Labs catalog.  This is useful when many searches are made over
+    the same set of images, for example one per tile.
+
+    Footprints are held in a :py:class:`shapely.STRtree` and acquisition dates in
+    a sorted array.  Images without a geometry never match an intersects query,
+    and images without an acquisition date never match a date range query.
+
+    Parameters
+    ----------
+    images : iterable(Image)
+        The images to index, for example an
+        :py:class:`~descarteslabs.catalog.ImageCollection` or the result of
+        :py:meth:`ImageStore.images <descarteslabs.catalog.ImageStore.images>`.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import ImageIndex, properties as p
+    >>> index = ImageIndex(images) # doctest: +SKIP
+    >>> index.query(
+    ...     intersects=tile,
+    ...     start_datetime="2023-01-01",
+    ...     end_datetime="2023-02-01",
+    ...     filter=p.cloud_fraction < 0.2,
+    ... ) # doctest: +SKIP
+    """
+
+    def __init__(self, images):
+        self._images = list(images)
+
+        geometries = [image.geometry for image in self._images]
+        self._tree = shapely.STRtree(geometries)
+
+        acquired = np.array(
+            [
+                np.nan if image.acquired is None else _timestamp(image.acquired)
+                for image in self._images
+            ],
+            dtype=np.float64,
+        )
+        # argsort puts the missing (nan) dates at the end
+        self._acquired_order = np.argsort(acquired, kind="stable")
+        self._acquired_sorted = acquired[self._acquired_order]
+        self._acquired_count = int(np.count_nonzero(~np.isnan(acquired)))
+
+        # columns of the most commonly filtered properties, see filter()
+        self._columns = ImageCollection(self._images).columnar().columns
+
+    def __len__(self):
+        return len(self._images)
+
+    def query(
+        self,
+        intersects=None,
+        start_datetime=None,
+        end_datetime=None,
+        filter=None,
+        geocontext=None,
+    ):
+        """Find the indexed images matching all of the given criteria.
+
+        Parameters
+        ----------
+        intersects : shapely.geometry.base.BaseGeometry, descarteslabs.common.geo.GeoContext, geojson-like, optional  # noqa: E501
+            Only return images whose footprint intersects this geometry.
+        start_datetime : str or datetime, optional
+            Only return images acquired at or after this time.
+        end_datetime : str or datetime, optional
+            Only return images acquired before this time.
+        filter : Expression, optional
+            Only return images matching this expression, built from the
+            :py:data:`~descarteslabs.catalog.properties` in the same way as for
+            :py:meth:`Search.filter <descarteslabs.catalog.Search.filter>`.
+        geocontext : shapely.geometry.base.BaseGeometry, descarteslabs.common.geo.GeoContext, geojson-like, optional  # noqa: E501
+            AOI for the ImageCollection.  Defaults to the `intersects` geometry.
+
+        Returns
+        -------
+        ~descarteslabs.catalog.ImageCollection
+            The matching images, in the order in which they were indexed.
+        """
+        indices = None
+
+        if intersects is not None:
+            geometry = geometry_like_to_shapely(intersects)
+            indices = self._tree.query(geometry, predicate="intersects")
+
+        if start_datetime is not None or end_datetime is not None:
+            lo = 0
+            hi = self._acquired_count
+            if start_datetime is not None:
+                lo = np.searchsorted(
+                    self._acquired_sorted[:hi], _timestamp(start_datetime), "left"
+                )
+            if end_datetime is not None:
+                hi = np.searchsorted(
+                    self._acquired_sorted[:hi], _timestamp(end_datetime), "left"
+                )
+            in_range = self._acquired_order[lo:hi]
+            if indices is None:
+                indices = in_range
+            else:
+                indices = np.intersect1d(indices, in_range, assume_unique=True)
+
+        if indices is None:
+            indices = np.arange(len(self._images))
+        else:
+            indices = np.sort(indices)
+
+        if filter is not None:
+            indices = self._filter(indices, filter)
+
+        images = [self._images[i] for i in indices.tolist()]
+
+        if geocontext is None:
+            geocontext = intersects
+
+        return ImageCollection(images, geocontext=geocontext)
+
+    def _filter(self, indices, filter):
+        # Filters on the indexed columns are evaluated as array operations,
+        # any others image by image
+        try:
+            mask = filter.compile()(self._columns)
+        except (KeyError, TypeError, ValueError):
+            return np.array(
+                [i for i in indices if filter.evaluate(self._images[i])], dtype=np.intp
+            )
+        return indices[mask[indices]]
+
+    def intersects(self, geometry):
+        """Find the indexed images whose footprint intersects a geometry.
+
+        Shorthand for ``query(intersects=geometry)``.
+
+        Parameters
+        ----------
+        geometry : shapely.geometry.base.BaseGeometry, descarteslabs.common.geo.GeoContext, geojson-like
+            The geometry to intersect with.
+
+        Returns
+        -------
+        ~descarteslabs.catalog.ImageCollection
+            The matching images, in the order in which they were indexed.
+        """
+        return self.query(intersects=geometry)
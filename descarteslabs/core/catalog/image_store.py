@@ -0,0 +1,345 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sqlite3
+from datetime import date, datetime, timezone
+
+from ..common.property_filtering import Properties
+from .attributes import parse_iso_datetime
+from .catalog_client import CatalogClient
+from .image import Image
+from .image_collection import ImageCollection
+
+properties = Properties()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    id TEXT PRIMARY KEY,
+    product_id TEXT NOT NULL,
+    acquired TEXT,
+    modified TEXT,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    document TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS images_product_acquired ON images (product_id, acquired);
+CREATE TABLE IF NOT EXISTS sync_state (
+    product_id TEXT PRIMARY KEY,
+    modified TEXT
+);
+"""
+
+
+def _utc_iso(value):
+    # Normalize a datetime, date or iso formatted string so that it sorts lexically
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = parse_iso_datetime(value)
+        except ValueError:
+            value = datetime.fromisoformat(value)
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        # a date is its midnight, as an iso formatted date string
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class ImageStore(object):
+    """A local SQLite store of image metadata.
+
+    The store is kept up to date with :py:meth:`sync`, which after the first run
+    only retrieves the images that were modified since the last sync of each
+    product.  Images deleted from the catalog are only detected by a full sync.
+    The images can then be queried locally with :py:meth:`images` without any
+    requests to the Descartes Labs catalog.
+
+    Parameters
+    ----------
+    path : str
+        The path of the SQLite database file, which is created if it does not
+        exist.  Use ``":memory:"`` for a store that is not persisted.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import ImageStore
+    >>> store = ImageStore("images.db")
+    >>> store.sync(["usgs:landsat:oli-tirs:c2:l2:v0"]) # doctest: +SKIP
+    >>> images = store.images(start_datetime="2023-01-01") # doctest: +SKIP
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def high_water_mark(self, product_id):
+        """Return the latest ``modified`` timestamp synced for a product.
+
+        Parameters
+        ----------
+        product_id : str
+            The id of the product.
+
+        Returns
+        -------
+        str or None
+            The timestamp as a UTC ISO formatted string, or ``None`` if the
+            product was never synced.
+        """
+        row = self._connection.execute(
+            "SELECT modified FROM sync_state WHERE product_id = ?", (product_id,)
+        ).fetchone()
+        return _utc_iso(row[0]) if row else None
+
+    def sync(self, products, full=False, client=None):
+        """Synchronize the store with the Descartes Labs catalog.
+
+        For each product only the images that were modified since the previous
+        sync are retrieved and inserted or updated in the store.  Progress is
+        committed after every page of results, so an interrupted sync resumes
+        where it left off.
+
+        Deletions are only detected by a full sync: an image deleted from the
+        catalog has no later modification, so it remains in the store until
+        the products are synchronized with ``full=True``.
+
+        Parameters
+        ----------
+        products : str or Product or list(str or Product)
+            The products whose images to synchronize.
+        full : bool, optional
+            Retrieve all images of the products rather than only the modified
+            ones, and mark any images in the store which no longer exist in the
+            catalog as deleted.  ``False`` by default.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for requests to the Descartes Labs
+            catalog.  The
+            :py:meth:`~descarteslabs.catalog.CatalogClient.get_default_client` will
+            be used if not set.
+
+        Returns
+        -------
+        dict
+            The number of images inserted or updated, by product id.
+
+        Raises
+        ------
+        ~descarteslabs.exceptions.ClientError or ~descarteslabs.exceptions.ServerError
+            :ref:`Spurious exception <network_exceptions>` that can occur during a
+            network request.
+        """
+        if isinstance(products, str) or not isinstance(products, (list, tuple)):
+            products = [products]
+        client = client or CatalogClient.get_default_client()
+
+        counts = {}
+        for product in products:
+            product_id = product if isinstance(product, str) else product.id
+            counts[product_id] = self._sync_product(product_id, full, client)
+
+        return counts
+
+    def _sync_product(self, product_id, full, client):
+        high_water_mark = None if full else self.high_water_mark(product_id)
+
+        search = (
+            Image.search(client=client)
+            .filter(properties.product_id == product_id)
+            .sort("modified")
+        )
+        if high_water_mark is not None:
+            # images modified at the high water mark are upserted again
+            search = search.filter(
+                properties.modified >= parse_iso_datetime(high_water_mark)
+            )
+
+        count = 0
+        seen_ids = set()
+        for page in search._iter_pages():
+            rows = []
+            for doc in page["data"]:
+                attributes = doc["attributes"]
+                modified = _utc_iso(attributes.get("modified"))
+                rows.append(
+                    (
+                        doc["id"],
+                        product_id,
+                        _utc_iso(attributes.get("acquired")),
+                        modified,
+                        json.dumps(doc, separators=(",", ":")),
+                    )
+                )
+                seen_ids.add(doc["id"])
+                if modified:
+                    high_water_mark = max(high_water_mark or "", modified)
+
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO images"
+                    " (id, product_id, acquired, modified, deleted, document)"
+                    " VALUES (?, ?, ?, ?, 0, ?)",
+                    rows,
+                )
+                self._set_high_water_mark(product_id, high_water_mark)
+            count += len(rows)
+
+        if full:
+            stored_ids = self._connection.execute(
+                "SELECT id FROM images WHERE product_id = ? AND deleted = 0",
+                (product_id,),
+            )
+            deleted_ids = [(id_,) for (id_,) in stored_ids if id_ not in seen_ids]
+            with self._connection:
+                self._connection.executemany(
+                    "UPDATE images SET deleted = 1 WHERE id = ?", deleted_ids
+                )
+                self._set_high_water_mark(product_id, high_water_mark)
+
+        return count
+
+    def _set_high_water_mark(self, product_id, modified):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO sync_state (product_id, modified) VALUES (?, ?)",
+            (product_id, modified),
+        )
+
+    def images(
+        self,
+        product_ids=None,
+        start_datetime=None,
+        end_datetime=None,
+        include_deleted=False,
+        geocontext=None,
+        client=None,
+    ):
+        """Query the images in the store.
+
+        Parameters
+        ----------
+        product_ids : str or list(str), optional
+            Only return images of these products.
+        start_datetime : str or datetime or date, optional
+            Only return images acquired at or after this time.
+        end_datetime : str or datetime or date, optional
+            Only return images acquired before this time.
+        include_deleted : bool, optional
+            Whether to include images that were marked as deleted by a full
+            :py:meth:`sync`.  ``False`` by default.
+        geocontext : shapely.geometry.base.BaseGeometry, descarteslabs.common.geo.Geocontext, geojson-like, default None  # noqa: E501
+            AOI for the ImageCollection.
+        client : CatalogClient, optional
+            A `CatalogClient` instance to use for the returned images.
+
+        Returns
+        -------
+        ~descarteslabs.catalog.ImageCollection
+            The matching images, ordered by acquisition date.
+        """
+        clauses = []
+        args = []
+
+        if product_ids is not None:
+            if isinstance(product_ids, str):
+                product_ids = [product_ids]
+            clauses.append(
+                "product_id IN ({})".format(", ".join("?" for _ in product_ids))
+            )
+            args.extend(product_ids)
+        if start_datetime is not None:
+            clauses.append("acquired >= ?")
+            args.append(_utc_iso(start_datetime))
+        if end_datetime is not None:
+            clauses.append("acquired < ?")
+            args.append(_utc_iso(end_datetime))
+        if not include_deleted:
+            clauses.append("deleted = 0")
+
+        query = "SELECT document FROM images"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY acquired, id"
+
+        client = client or CatalogClient.get_default_client()
+        images = []
+        for (document,) in self._connection.execute(query, args):
+            doc = json.loads(document)
+            images.append(
+                Image(
+                    id=doc["id"],
+                    client=client,
+                    _saved=True,
+                    _relationships=doc.get("relationships"),
+                    **doc["attributes"],
+                )
+            )
+
+        return ImageCollection(images, geocontext=geocontext)
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM images WHERE deleted = 0"
+        ).fetchone()[0]
+
+
+def sync_images(products, store, full=False, client=None):
+    """Synchronize a local store of image metadata with the Descartes Labs catalog.
+
+    See :py:meth:`ImageStore.sync` for details.
+
+    Parameters
+    ----------
+    products : str or Product or list(str or Product)
+        The products whose images to synchronize.
+    store : str or ImageStore
+        The store, or the path of the SQLite database file of the store.
+    full : bool, optional
+        Retrieve all images of the products rather than only the modified ones,
+        and mark any images in the store which no longer exist in the catalog as
+        deleted.  Deletions are only detected by a full sync.  ``False`` by
+        default.
+    client : CatalogClient, optional
+        A `CatalogClient` instance to use for requests to the Descartes Labs
+        catalog.  The
+        :py:meth:`~descarteslabs.catalog.CatalogClient.get_default_client` will
+        be used if not set.
+
+    Returns
+    -------
+    ImageStore
+        The synchronized store.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import sync_images
+    >>> store = sync_images("usgs:landsat:oli-tirs:c2:l2:v0", "images.db") # doctest: +SKIP
+    >>> images = store.images(start_datetime="2023-01-01") # doctest: +SKIP
+    """
+    if not isinstance(store, ImageStore):
+        store = ImageStore(store)
+
+    store.sync(products, full=full, client=client)
+    return store
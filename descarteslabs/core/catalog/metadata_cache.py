@@ -0,0 +1,276 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import cachetools
+
+_MISSING = object()
+
+# Kind of lookup for the bands of a product, other kinds are catalog document types
+BANDS_BY_PRODUCT = "bands_by_product"
+
+
+def _digest(value):
+    return hashlib.sha1(str(value).encode("utf-8")).hexdigest()
+
+
+class MetadataCache(object):
+    """A cache for catalog metadata lookups.
+
+    The cache holds the raw catalog responses for product and band lookups,
+    keyed by the catalog environment and credentials of the client as well as
+    by the kind of lookup and its id.  Objects are always constructed
+    anew from the cached responses, so modifying a returned object never
+    affects the cache.
+
+    Entries are kept in memory and, when a ``path`` is configured, are also
+    persisted as json files in that directory so that they can be shared across
+    processes.  Entries are invalidated when the corresponding catalog object is
+    saved or deleted through this client.
+
+    There is a single instance of this class, available as
+    :py:data:`~descarteslabs.catalog.metadata_cache`, which can be reconfigured
+    using :py:meth:`configure`.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of entries held in memory.  Defaults to 256.
+    ttl : int or float, optional
+        The number of seconds an entry is valid for.  Defaults to 600.
+    path : str, optional
+        A directory in which entries are persisted.  Entries are only kept in
+        memory if not set.
+    enabled : bool, optional
+        Whether lookups are cached at all.  Defaults to ``True``.
+    cache_get : bool, optional
+        Whether :py:meth:`Product.get <descarteslabs.catalog.Product.get>` and
+        :py:meth:`Band.get <descarteslabs.catalog.Band.get>` are cached.  Off by
+        default, since cached objects may be up to ``ttl`` seconds out of date
+        relative to changes made by other clients.
+
+    Example
+    -------
+    >>> from descarteslabs.catalog import metadata_cache
+    >>> metadata_cache.configure(path="/tmp/dl-metadata", cache_get=True)
+    >>> metadata_cache.stats() # doctest: +SKIP
+    {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0}
+    """
+
+    def __init__(self, maxsize=256, ttl=600, path=None, enabled=True, cache_get=False):
+        self._lock = threading.RLock()
+        self.configure(
+            maxsize=maxsize, ttl=ttl, path=path, enabled=enabled, cache_get=cache_get
+        )
+
+    def configure(self, maxsize=256, ttl=600, path=None, enabled=True, cache_get=False):
+        """Reconfigure the cache.
+
+        All entries held in memory and the statistics are discarded.  Entries
+        persisted in ``path`` are retained.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of entries held in memory.  Defaults to 256.
+        ttl : int or float, optional
+            The number of seconds an entry is valid for.  Defaults to 600.
+        path : str, optional
+            A directory in which entries are persisted.  Entries are only kept in
+            memory if not set.
+        enabled : bool, optional
+            Whether lookups are cached at all.  Defaults to ``True``.
+        cache_get : bool, optional
+            Whether product and band ``get`` requests are cached.  Defaults to
+            ``False``.
+        """
+        with self._lock:
+            if path is not None:
+                os.makedirs(path, exist_ok=True)
+
+            self.maxsize = maxsize
+            self.ttl = ttl
+            self.path = path
+            self.enabled = enabled
+            self.cache_get = cache_get
+            self._cache = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """float: The fraction of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Return the cache statistics.
+
+        Returns
+        -------
+        dict
+            The number of ``hits`` and ``misses``, the ``hit_rate`` and the
+            number of entries held in memory as ``size``.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "size": len(self._cache),
+            }
+
+    def get(self, kind, key, client, fetch):
+        """Return the cached value for a lookup, fetching it if necessary.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of lookup, e.g. a catalog document type.
+        key : str
+            The id of the lookup.
+        client : CatalogClient
+            The client that is used for the lookup.
+        fetch : callable
+            Called without arguments to retrieve the value on a cache miss.  The
+            value must be json serializable.  Exceptions are not cached.
+
+        Returns
+        -------
+        object
+            A copy of the cached or fetched value.
+        """
+        if not self.enabled:
+            return fetch()
+
+        cache_key = (self._client_key(client), kind, key)
+
+        with self._lock:
+            value = self._cache.get(cache_key, _MISSING)
+
+        if value is _MISSING and self.path is not None:
+            value = self._read(cache_key)
+            if value is not _MISSING:
+                with self._lock:
+                    self._cache[cache_key] = value
+
+        if value is not _MISSING:
+            with self._lock:
+                self.hits += 1
+            return copy.deepcopy(value)
+
+        with self._lock:
+            self.misses += 1
+
+        value = fetch()
+
+        with self._lock:
+            self._cache[cache_key] = value
+        if self.path is not None:
+            self._write(cache_key, value)
+
+        return copy.deepcopy(value)
+
+    def invalidate(self, kind=None, key=None):
+        """Remove entries from the cache, for all clients.
+
+        Parameters
+        ----------
+        kind : str, optional
+            Only remove entries of this kind.  All entries are removed if not set.
+        key : str, optional
+            Only remove entries with this id.  Ignored if `kind` is not set.
+        """
+        with self._lock:
+            for cache_key in list(self._cache.keys()):
+                if kind is None or (
+                    cache_key[1] == kind and (key is None or cache_key[2] == key)
+                ):
+                    self._cache.pop(cache_key, None)
+
+        if self.path is not None:
+            if kind is None:
+                pattern = "*.json"
+            elif key is None:
+                pattern = "{}-*.json".format(_digest(kind))
+            else:
+                pattern = "{}-{}-*.json".format(_digest(kind), _digest(key))
+
+            for filename in glob.glob(os.path.join(self.path, pattern)):
+                try:
+                    os.remove(filename)
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        """Remove all entries from the cache and reset the statistics."""
+        self.invalidate()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _client_key(self, client):
+        auth = client.auth
+        credentials = auth.refresh_token or auth.client_secret or auth._token
+        return "{}|{}|{}".format(client.base_url, auth.client_id, _digest(credentials))
+
+    def _filename(self, cache_key):
+        client_key, kind, key = cache_key
+        return os.path.join(
+            self.path,
+            "{}-{}-{}.json".format(_digest(kind), _digest(key), _digest(client_key)),
+        )
+
+    def _read(self, cache_key):
+        try:
+            with open(self._filename(cache_key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return _MISSING
+
+        if entry.get("key") != list(cache_key) or entry["expires"] < time.time():
+            return _MISSING
+
+        return entry["value"]
+
+    def _write(self, cache_key, value):
+        entry = {
+            "key": list(cache_key),
+            "expires": time.time() + self.ttl,
+            "value": value,
+        }
+
+        # write atomically so concurrent processes never see a partial entry
+        fd, tmp_name = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_name, self._filename(cache_key))
+        except OSError:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+
+
+#: The :py:class:`MetadataCache` used by the catalog.
+metadata_cache = MetadataCache()
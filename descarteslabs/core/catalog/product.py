@@ -26,6 +26,7 @@ from .catalog_base import (
     CatalogClient,
     check_deleted,
 )
+from .metadata_cache import BANDS_BY_PRODUCT, metadata_cache
 from .task import TaskStatus
 
 
@@ -59,6 +60,7 @@ class Product(AuthCatalogObject):
 
     _doc_type = "product"
     _url = "/products"
+    _cache_metadata = True
     # _collection_type set below due to circular problems
 
     # Product Attributes
@@ -251,6 +253,11 @@ class Product(AuthCatalogObject):
             headers=headers,
         )
 
+    @classmethod
+    def _invalidate_cached_metadata(cls, id):
+        super(Product, cls)._invalidate_cached_metadata(id)
+        metadata_cache.invalidate(BANDS_BY_PRODUCT, id)
+
     @check_deleted
     def delete_related_objects(self):
         """Delete all related bands and images for this product.
@@ -280,6 +287,7 @@ class Product(AuthCatalogObject):
             "/products/{}/delete_related_objects".format(self.id),
             json={"data": {"type": "product_delete_task"}},
         )
+        metadata_cache.invalidate(BANDS_BY_PRODUCT, self.id)
         if r.status_code == 201:
             response = r.json()
             return DeletionTaskStatus(
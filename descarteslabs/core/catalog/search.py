@@ -23,6 +23,12 @@ from strenum import StrEnum
 from .catalog_client import CatalogClient
 from ..common.property_filtering.filtering import AndExpression
 from ..common.property_filtering.filtering import Expression  # noqa: F401
+from ..common.property_filtering.planner import (
+    count_concurrently,
+    iter_concurrently,
+    split_any_of,
+)
+from ..common.shapely_support.optimize import optimize_intersects
 
 from .attributes import serialize_datetime
 
@@ -46,6 +52,13 @@ class Search(object):
     results.  This might raise a `~descarteslabs.exceptions.BadRequestError`
     if any of the query parameters or filters are invalid.
 
+    Example
+    -------
+    A filter with a large :meth:`~descarteslabs.common.property_filtering.filtering.Property.any_of`
+    term, such as ``p.id.any_of(ids)`` for many ids, is transparently split into
+    several searches with at most ``_MAX_FILTER_VALUES`` values each, which are
+    executed concurrently and whose results are merged.
+
     Example
     -------
     >>> from descarteslabs.catalog import Product, Search, properties as p
@@ -53,6 +66,11 @@ class Search(object):
     >>> list(search) # doctest: +SKIP
     """
 
+    # The maximum number of values of an any_of() filter in a single request
+    _MAX_FILTER_VALUES = 1000
+    # The maximum number of requests for a split filter executed concurrently
+    _MAX_CONCURRENT_QUERIES = 8
+
     def __init__(
         self,
         model,
@@ -75,6 +93,7 @@ class Search(object):
         self._client = client or CatalogClient.get_default_client()
         self._limit = None
         self._use_includes = includes
+        self._checkpoint = None
 
     def limit(self, limit):
         """Limit the number of search results returned by the search execution.
@@ -124,6 +143,72 @@ class Search(object):
 
         return s
 
+    def resume_from(self, continuation):
+        """Resume the search from a continuation token.
+
+        The search will start with the results that follow the result for which
+        the continuation token was returned, either by a search using
+        ``per_item_continuations`` or by a :py:meth:`checkpoint` callback.
+        Successive calls to `resume_from` will overwrite the previous token.
+
+        Parameters
+        ----------
+        continuation : str
+            The continuation token.
+
+        Returns
+        -------
+        Search
+
+        Example
+        -------
+        >>> from descarteslabs.catalog import Image, properties as p
+        >>> search = Image.search().filter(p.product_id == "my-product")
+        >>> list(search.resume_from(token)) # doctest: +SKIP
+        """
+        s = copy.deepcopy(self)
+        s._request_params["continuation"] = continuation
+
+        return s
+
+    def checkpoint(self, callback, every=1000):
+        """Periodically report the continuation token while iterating.
+
+        While iterating over the returned search, `callback` is called with the
+        continuation token of the most recent result every `every` results,
+        once that result has been consumed.  Persisting the token allows an
+        interrupted search to be continued using :py:meth:`resume_from`, with
+        at most `every` results being returned again.
+
+        Parameters
+        ----------
+        callback : callable
+            Called with a single continuation token (str) argument.
+        every : int, optional
+            The number of results between calls to `callback`.  Defaults to 1000.
+
+        Returns
+        -------
+        Search
+
+        Example
+        -------
+        >>> from descarteslabs.catalog import Image, properties as p
+        >>> def save_token(token):
+        ...     with open("checkpoint.txt", "w") as f:
+        ...         f.write(token)
+        >>> search = Image.search().filter(p.product_id == "my-product")
+        >>> for image in search.checkpoint(save_token, every=500): # doctest: +SKIP
+        ...     process(image)
+        """
+        if every < 1:
+            raise ValueError("every must be at least one")
+
+        s = copy.deepcopy(self)
+        s._checkpoint = (callback, every)
+
+        return s
+
     def filter(self, properties):
         """Filter results by the values of various fields.
 
@@ -230,6 +315,9 @@ class Search(object):
         if self._use_includes and self._model_cls._default_includes:
             s._request_params["include"] = ",".join(self._model_cls._default_includes)
 
+        if self._checkpoint:
+            s._request_params["per_item_continuations"] = True
+
         url = s._url
         continuation = s._request_params.pop("continuation", None)
         if continuation:
@@ -272,6 +360,10 @@ class Search(object):
         """Fetch the number of documents that match the search.
 
         Note that this may not be an exact count if searching within a geometry.
+        A large :py:meth:`~descarteslabs.common.property_filtering.filtering.Property.any_of`
+        filter is split into several searches as when iterating, whose counts are
+        added, so that a document matching several of the values of a
+        multi-valued property such as ``tags`` is counted more than once.
 
         Returns
         -------
@@ -292,6 +384,9 @@ class Search(object):
         >>> search = Search(Band).filter(p.type=="spectral")
         >>> count = search.count() # doctest: +SKIP
         """
+        searches = self._split()
+        if len(searches) > 1:
+            return count_concurrently(searches, self._MAX_CONCURRENT_QUERIES)
 
         # modify query to return 0 results, and just get the object count
         s = self.limit(0)
@@ -346,36 +441,71 @@ class Search(object):
         >>> list(search) # doctest: +SKIP
 
         """
-        url_next, params = self._to_request()
         per_item_continuations = (
-            str(params.get("per_item_continuations", False)).lower() == "true"
+            str(self._request_params.get("per_item_continuations", False)).lower()
+            == "true"
         )
+
+        searches = self._split()
+        if len(searches) > 1:
+            sort = self._request_params.get("sort")
+            sorts = [(sort.lstrip("-"), not sort.startswith("-"))] if sort else []
+            yield from iter_concurrently(
+                searches,
+                self._MAX_CONCURRENT_QUERIES,
+                sorts=sorts,
+                limit=self._limit,
+            )
+            return
+
+        checkpoint = self._checkpoint
+        count = 0
+        for response in self._iter_pages():
+            items = self._load_page(response, per_item_continuations)
+            if not checkpoint:
+                yield from items
+                continue
+
+            callback, every = checkpoint
+            continuations = response["meta"]["per_item_continuations"]
+            for i, item in enumerate(items):
+                yield item
+                count += 1
+                if count % every == 0:
+                    callback(continuations[i])
+
+    def _split(self):
+        # The searches to execute for a large any_of() filter, see split_any_of().
+        # Searches which are resumed or report continuations are never split.
+        if (
+            self._filter_properties is None
+            or self._checkpoint
+            or "continuation" in self._request_params
+            or "per_item_continuations" in self._request_params
+        ):
+            return [self]
+
+        filters = split_any_of(self._filter_properties, self._MAX_FILTER_VALUES)
+        if len(filters) == 1:
+            return [self]
+
+        searches = []
+        for filter in filters:
+            s = copy.deepcopy(self)
+            s._filter_properties = filter
+            searches.append(s)
+        return searches
+
+    def _iter_pages(self):
+        # Generator of the raw responses for each page of search results
+        url_next, params = self._to_request()
         while url_next is not None:
             r = self._client.session.put(url_next, json=params, headers=self._headers)
             response = r.json()
             if not response["data"]:
                 break
 
-            related_objects = self._model_cls._load_related_objects(
-                response, self._client
-            )
-
-            if per_item_continuations:
-                continuations = response["meta"]["per_item_continuations"]
-            for i, doc in enumerate(response["data"]):
-                model_class = self._model_cls._get_model_class(doc)
-                model_obj = model_class(
-                    id=doc["id"],
-                    client=self._client,
-                    _saved=True,
-                    _relationships=doc.get("relationships"),
-                    _related_objects=related_objects,
-                    **doc["attributes"],
-                )
-                if per_item_continuations:
-                    yield (model_obj, continuations[i])
-                else:
-                    yield model_obj
+            yield response
 
             next_link = response["links"].get("next")
             if next_link is not None:
@@ -391,12 +521,33 @@ class Search(object):
             else:
                 url_next = None
 
+    def _load_page(self, response, per_item_continuations=False):
+        # Generator of the objects in a raw response page
+        related_objects = self._model_cls._load_related_objects(response, self._client)
+
+        if per_item_continuations:
+            continuations = response["meta"]["per_item_continuations"]
+        for i, doc in enumerate(response["data"]):
+            model_class = self._model_cls._get_model_class(doc)
+            model_obj = model_class(
+                id=doc["id"],
+                client=self._client,
+                _saved=True,
+                _relationships=doc.get("relationships"),
+                _related_objects=related_objects,
+                **doc["attributes"],
+            )
+            if per_item_continuations:
+                yield (model_obj, continuations[i])
+            else:
+                yield model_obj
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k in ["_client"]:
+            if k in ["_client", "_checkpoint"]:
                 setattr(result, k, v)
             else:
                 setattr(result, k, copy.deepcopy(v, memo))
@@ -474,7 +625,7 @@ class GeoSearch(Search):
         self._intersects = None
         self._intersects_none = False
 
-    def intersects(self, geometry, match_null_geometry=False):
+    def intersects(self, geometry, match_null_geometry=False, optimize=False):
         """Filter images or blobs to those that intersect the given geometry.
 
         Successive calls to `intersects` override the previous intersection
@@ -484,6 +635,7 @@ class GeoSearch(Search):
         ----------
         geometry : shapely.geometry.base.BaseGeometry, ~descarteslabs.common.geo.GeoContext, geojson-like Geometry that found images must intersect.
         match_null_geometry : bool, optional (default False) Also match images or blobs with no geometry.
+        optimize : bool, optional (default False) Send a simplified outer envelope of a large geometry, which makes the request smaller, see :py:func:`~descarteslabs.core.common.shapely_support.optimize.optimize_intersects`. The search then also finds images or blobs very close to the geometry.
 
         Returns
         -------
@@ -492,11 +644,14 @@ class GeoSearch(Search):
             class that includes geometry filter.
         """  # noqa: E501
         s = copy.deepcopy(self)
-        _, value = self._model_cls._serialize_filter_attribute("geometry", geometry)
-        s._request_params["intersects"] = json.dumps(
-            value,
-            separators=(",", ":"),
-        )
+        if optimize:
+            s._request_params["intersects"] = optimize_intersects(geometry).json
+        else:
+            _, value = self._model_cls._serialize_filter_attribute("geometry", geometry)
+            s._request_params["intersects"] = json.dumps(
+                value,
+                separators=(",", ":"),
+            )
 
         if match_null_geometry:
             s._request_params["intersects_none"] = True
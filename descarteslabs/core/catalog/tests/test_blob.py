@@ -14,9 +14,12 @@
 
 # -*- coding: utf-8 -*-
 import copy
+import hashlib
+import io
 import json
 import os
 import pytest
+import requests.exceptions
 import responses
 
 import textwrap
@@ -25,12 +28,19 @@ import shapely.geometry
 
 from datetime import datetime
 from tempfile import NamedTemporaryFile
-from unittest.mock import patch
-
-from descarteslabs.exceptions import BadRequestError
+from unittest.mock import Mock, patch
+
+from descarteslabs.exceptions import (
+    BadRequestError,
+    ForbiddenError,
+    NotFoundError,
+    RateLimitError,
+)
 from .base import ClientTestCase
 from ..attributes import AttributeValidationError
+from .. import blob as blob_module
 from ..blob import Blob, BlobCollection, BlobDeletionTaskStatus, BlobSearch, StorageType
+from ..blob_download import BlobDownload
 from ..blob_upload import BlobUpload
 from ..catalog_base import DocumentState, DeletedObjectError
 from ...common.property_filtering import Properties
@@ -1002,6 +1012,297 @@ class TestBlob(ClientTestCase):
                     os.unlink(f1.name)
                     os.unlink(f2.name)
 
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    @patch.object(Blob, "_url_client")
+    @responses.activate
+    def test_upload(self, url_client_mock):
+        data = b"0123456789" * 1000
+        digest = hashlib.md5(data).hexdigest()
+
+        self.mock_response(
+            responses.POST,
+            {
+                "data": {
+                    "attributes": {
+                        "resumable_url": "https://example.com/upload",
+                        "signature": "signature",
+                        "storage_id": "data/someorg:test-namespace/test-blob",
+                    },
+                    "id": "upload",
+                    "type": "storage_upload",
+                }
+            },
+        )
+        self.mock_response(
+            responses.POST,
+            {
+                "data": {
+                    "attributes": {
+                        "hash": digest,
+                        "name": "test-blob",
+                        "namespace": "someorg:test-namespace",
+                        "size_bytes": len(data),
+                        "storage_state": "available",
+                        "storage_type": "data",
+                    },
+                    "id": "data/someorg:test-namespace/test-blob",
+                    "type": "storage",
+                }
+            },
+        )
+
+        uploaded = []
+
+        def put(url, data=None, headers=None):
+            content = data.read(10)
+            if not uploaded:
+                # fail after part of the data was sent
+                uploaded.append(None)
+                raise RateLimitError("slow down", retry_after="0")
+            while True:
+                chunk = data.read(8192)
+                if not chunk:
+                    break
+                content += chunk
+            uploaded.append(content)
+
+        url_client_mock.session.put.side_effect = put
+
+        with patch.object(blob_module._UploadSource, "_PART_SIZE", 1000):
+            b = Blob(
+                id="data/someorg:test-namespace/test-blob",
+                name="test-blob",
+                client=self.client,
+            )
+            f = io.BytesIO(data)
+            f.mode = "rb"
+            b.upload(f)
+
+        assert b.state == DocumentState.SAVED
+        # the data is sent again from the start
+        assert uploaded == [None, data]
+        # the hash of the data is computed as it is sent
+        body = json.loads(responses.calls[1].request.body)
+        assert body["data"]["attributes"]["hash"] == digest
+
+        # a hash that does not match the data is not saved
+        self.mock_response(
+            responses.POST,
+            {
+                "data": {
+                    "attributes": {
+                        "resumable_url": "https://example.com/upload",
+                        "signature": "signature",
+                        "storage_id": "data/someorg:test-namespace/test-blob-2",
+                    },
+                    "id": "upload",
+                    "type": "storage_upload",
+                }
+            },
+        )
+        b = Blob(
+            id="data/someorg:test-namespace/test-blob-2",
+            name="test-blob-2",
+            hash="0" * 32,
+            client=self.client,
+        )
+        uploaded.clear()
+        with pytest.raises(ValueError, match="does not match"):
+            b.upload_data(data)
+        assert b.state == DocumentState.UNSAVED
+
+    @patch.object(Blob, "_url_client")
+    @patch.object(
+        BlobDownload, "get", return_value=Mock(resumable_url="https://example.com/d")
+    )
+    @patch("time.sleep")
+    def test_download_parallel(self, sleep_mock, get_mock, url_client_mock):
+        data = bytes(range(256)) * 40
+        ranges = []
+
+        def get(url, headers=None, stream=False):
+            start, end = map(int, headers["range"][len("bytes=") :].split("-"))
+            ranges.append((start, end))
+            part = data[start : end + 1]
+            if ranges.count((start, end)) == 1 and start == 4000:
+                # the download url has expired
+                raise ForbiddenError("Request has expired")
+
+            def iter_content(chunk_size):
+                yield part[:100]
+                if ranges.count((start, end)) == 1 and start == 2000:
+                    # the connection is dropped during the first attempt
+                    raise requests.exceptions.ChunkedEncodingError("dropped")
+                yield part[100:]
+
+            return Mock(status_code=206, iter_content=iter_content)
+
+        url_client_mock.session.get.side_effect = get
+
+        b = Blob(
+            name="test-blob",
+            id="data/someorg:test-namespace/test-blob",
+            size_bytes=len(data),
+            hash=hashlib.md5(data).hexdigest(),
+            _saved=True,
+            client=self.client,
+        )
+
+        with NamedTemporaryFile(delete=False) as f:
+            try:
+                f.close()
+
+                assert b.download(f.name, parallel=4, part_size=1000) == f.name
+                with open(f.name, "rb") as handle:
+                    assert handle.read() == data
+                # one range request per part, and the retried parts
+                assert sorted(set(ranges)) == [
+                    (start, min(start + 1000, len(data)) - 1)
+                    for start in range(0, len(data), 1000)
+                ]
+                assert len(ranges) == 13
+                # the expired url was renewed
+                assert get_mock.call_count == 2
+
+                b = Blob(
+                    name="test-blob",
+                    id="data/someorg:test-namespace/test-blob",
+                    size_bytes=len(data),
+                    hash="0" * 32,
+                    _saved=True,
+                    client=self.client,
+                )
+                with pytest.raises(ValueError, match="does not match"):
+                    b.download(f.name, parallel=4, part_size=1000)
+            finally:
+                os.unlink(f.name)
+
+        # an in-memory file is verified through the file itself
+        b = Blob(
+            name="test-blob",
+            id="data/someorg:test-namespace/test-blob",
+            size_bytes=len(data),
+            hash=hashlib.md5(data).hexdigest(),
+            _saved=True,
+            client=self.client,
+        )
+        buffer = io.BytesIO()
+        buffer.write(b"header")
+        assert b.download(buffer, parallel=4, part_size=1000) is None
+        assert buffer.tell() == len(b"header") + len(data)
+        assert buffer.getvalue() == b"header" + data
+
+    @patch.object(Blob, "_url_client")
+    @patch.object(
+        BlobDownload, "get", return_value=Mock(resumable_url="https://example.com/d")
+    )
+    @patch("time.sleep")
+    def test_open(self, sleep_mock, get_mock, url_client_mock):
+        data = bytes(range(256)) * 40
+        ranges = []
+
+        def get(url, headers=None, stream=False):
+            start, end = map(int, headers["range"][len("bytes=") :].split("-"))
+            ranges.append((start, end))
+            if ranges.count((start, end)) == 1 and start == 5000:
+                # the connection is dropped during the first attempt
+                return Mock(raw=Mock(read=Mock(return_value=data[start : start + 10])))
+            if ranges.count((start, end)) == 1 and start == 8000:
+                # the download url has expired
+                raise ForbiddenError("Request has expired")
+            return Mock(raw=Mock(read=Mock(return_value=data[start : end + 1])))
+
+        url_client_mock.session.get.side_effect = get
+
+        b = Blob(
+            name="test-blob",
+            id="data/someorg:test-namespace/test-blob",
+            size_bytes=len(data),
+            hash=hashlib.md5(data).hexdigest(),
+            _saved=True,
+            client=self.client,
+        )
+
+        with pytest.raises(ValueError):
+            b.open("wb")
+
+        with b.open(block_size=1000, prefetch=2) as f:
+            assert f.seekable()
+            f.seek(-100, io.SEEK_END)
+            assert f.read() == data[-100:]
+            assert ranges == [(10000, 10239)]
+
+            # the blocks of a read are requested together
+            f.seek(0)
+            assert f.read(2500) == data[:2500]
+            assert sorted(ranges[1:]) == [(0, 999), (1000, 1999), (2000, 2999)]
+
+            # sequential reads request the following blocks ahead
+            assert f.read(1000) == data[2500:3500]
+            assert f.tell() == 3500
+            f.read(1)
+            assert (4000, 4999) in ranges and (5000, 5999) in ranges
+
+            # cached blocks are not requested again
+            count = len(ranges)
+            f.seek(10200)
+            assert f.read(100) == data[10200:]
+            assert f.read(100) == b""
+            assert len(ranges) == count
+
+            f.seek(4900)
+            assert f.read(4000) == data[4900:8900]
+            assert f.read() == data[8900:]
+
+        assert f.closed
+        # the short read of 5000-5999 was retried, and the url renewed once
+        assert ranges.count((5000, 5999)) == 2
+        assert get_mock.call_count == 2
+        assert all(
+            call[1]["headers"]["if-match"] == b.hash
+            for call in url_client_mock.session.get.call_args_list
+        )
+
+    @patch.object(Blob, "_url_client")
+    @patch.object(BlobDownload, "get")
+    @patch("time.sleep")
+    def test_get_many_data(self, sleep_mock, get_mock, url_client_mock):
+        ids = ["data/someorg:test-namespace/blob-{}".format(i) for i in range(50)]
+        failures = []
+
+        def get(id, client=None):
+            if id.endswith("-7"):
+                return None
+            return Mock(resumable_url="https://example.com/" + id)
+
+        def get_data(url):
+            id = url[len("https://example.com/") :]
+            if id.endswith("-3") and id not in failures:
+                # the first attempt fails transiently
+                failures.append(id)
+                raise requests.exceptions.ConnectionError("reset")
+            if id.endswith("-5"):
+                return Mock(
+                    raise_for_status=Mock(side_effect=BadRequestError("denied"))
+                )
+            return Mock(content=id.encode())
+
+        get_mock.side_effect = get
+        url_client_mock.session.get.side_effect = get_data
+
+        results = dict(Blob.get_many_data(iter(ids), max_workers=4, client=self.client))
+
+        assert sorted(results) == sorted(ids)
+        for id, data in results.items():
+            if id.endswith("-7"):
+                assert isinstance(data, NotFoundError)
+            elif id.endswith("-5"):
+                assert isinstance(data, BadRequestError)
+            else:
+                assert data == id.encode()
+        assert failures == [ids[3]]
+        assert get_mock.call_count == len(ids) + len(failures)
+
     @patch.object(Blob, "namespace_id", _namespace_id)
     def test_invalid_upload_data(self):
         b = Blob(
@@ -0,0 +1,184 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+import pytest
+
+from descarteslabs.exceptions import ClientError
+
+from ..blob import Blob
+from ..blob_cache import BlobCache, blob_cache
+from .base import ClientTestCase
+
+
+def client_error(status):
+    # the session raises the statuses without a specific exception as ClientError
+    error = ClientError("status {}".format(status))
+    error.status = status
+    return error
+
+
+class TestBlobCache(ClientTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = self.tempdir.name
+        self.remote = {}
+        self.downloads = []
+        self.revalidations = []
+
+        def do_download(blob, dest=None, range=None):
+            if range == (0, 0):
+                self.revalidations.append(blob.id)
+                if self.remote[blob.id] != blob.hash:
+                    raise client_error(412)
+                if not self.data[blob.id]:
+                    raise client_error(416)
+                return self.data[blob.id][:1]
+            self.downloads.append(blob.id)
+            if dest is None:
+                return self.data[blob.id]
+            dest.write(self.data[blob.id])
+            return dest.name
+
+        self.data = {}
+        patcher = patch.object(Blob, "_do_download", autospec=True)
+        patcher.start().side_effect = do_download
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        blob_cache.configure()
+        self.tempdir.cleanup()
+
+    def blob(self, name, data, hash=None):
+        id = "data/someorg:test-namespace/{}".format(name)
+        self.data[id] = data
+        blob = Blob(
+            id=id,
+            name=name,
+            size_bytes=len(data),
+            hash=hash or hashlib.md5(data).hexdigest(),
+            _saved=True,
+            client=self.client,
+        )
+        self.remote[id] = blob.hash
+        return blob
+
+    def test_read_through(self):
+        blob_cache.configure(path=self.path)
+        b = self.blob("weights.bin", b"some weights")
+
+        assert b.data() == b"some weights"
+        assert b.data() == b"some weights"
+        assert self.downloads == [b.id]
+        # the hit was revalidated
+        assert self.revalidations == [b.id]
+
+        with patch.object(Blob, "get", return_value=b) as get_mock:
+            assert Blob.get_data(id=b.id, client=self.client) == b"some weights"
+        get_mock.assert_called_once_with(b.id, client=self.client)
+        assert self.revalidations == [b.id]
+
+        # ranges are not cached
+        Blob.get_data(id=b.id, client=self.client, range=(0, 3))
+        assert self.downloads == [b.id, b.id]
+
+        mapped = blob_cache.mmap(b)
+        try:
+            assert mapped[:] == b"some weights"
+        finally:
+            mapped.close()
+
+        assert blob_cache.stats() == {
+            "hits": 3,
+            "misses": 1,
+            "hit_rate": 0.75,
+            "entries": 1,
+            "bytes": len(b"some weights"),
+        }
+
+        # a replaced blob fails revalidation, as it fails without the cache
+        self.remote[b.id] = "0" * 32
+        with pytest.raises(ClientError) as e:
+            b.data()
+        assert e.value.status == 412
+
+        blob_cache.configure(path=self.path, revalidate=False)
+        assert b.data() == b"some weights"
+
+    def test_empty_blob(self):
+        blob_cache.configure(path=self.path)
+        b = self.blob("empty.bin", b"")
+
+        assert b.data() == b""
+        # the revalidation of the empty entry fails as there is no byte to return
+        assert b.data() == b""
+        assert self.downloads == [b.id]
+        assert self.revalidations == [b.id]
+
+    def test_not_configured(self):
+        b = self.blob("weights.bin", b"some weights")
+        assert b.data() == b"some weights"
+        assert b.data() == b"some weights"
+        assert self.downloads == [b.id, b.id]
+
+        with pytest.raises(ValueError, match="not configured"):
+            blob_cache.mmap(b)
+
+    def test_hash_mismatch(self):
+        cache = BlobCache(path=self.path)
+        b = self.blob("weights.bin", b"some weights", hash="0" * 32)
+
+        with pytest.raises(ValueError, match="does not match"):
+            cache.get_data(b)
+        # nothing is left behind
+        assert os.listdir(self.path) == []
+
+    def test_eviction(self):
+        cache = BlobCache(path=self.path, max_bytes=25)
+        a = self.blob("a", b"a" * 10)
+        b = self.blob("b", b"b" * 10)
+        c = self.blob("c", b"c" * 10)
+
+        cache.get_data(a)
+        cache.get_data(b)
+        now = time.time()
+        os.utime(cache.filename(a), (now - 200, now - 200))
+        os.utime(cache.filename(b), (now - 100, now - 100))
+
+        # a becomes the most recently used
+        assert cache.get_data(a) == b"a" * 10
+        assert cache.get_data(c) == b"c" * 10
+
+        assert self.downloads == [a.id, b.id, c.id]
+        assert cache.stats()["entries"] == 2
+        assert cache.get_data(a) == b"a" * 10
+        assert cache.get_data(b) == b"b" * 10
+        assert self.downloads == [a.id, b.id, c.id, b.id]
+
+        cache.invalidate(a.id)
+        assert not os.path.exists(cache._filename(a))
+        cache.clear()
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+            "entries": 0,
+            "bytes": 0,
+        }
@@ -0,0 +1,129 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ..blob import Blob
+from .base import ClientTestCase
+
+fsspec = pytest.importorskip("fsspec")
+
+from .. import blob_fs  # noqa: E402
+
+NAMESPACE = "someorg:test-namespace"
+
+
+class TestBlobFileSystem(ClientTestCase):
+    def setUp(self):
+        super().setUp()
+        self.remote = {
+            "a.txt": b"some data",
+            "tables/t1.parquet": b"0123456789",
+            "tables/2024/t2.parquet": b"abc",
+        }
+        self.fs = blob_fs.BlobFileSystem(client=self.client, skip_instance_cache=True)
+
+    def blobs(self, prefix=""):
+        return [
+            Blob(
+                id="data/{}/{}".format(NAMESPACE, name),
+                name=name,
+                namespace=NAMESPACE,
+                size_bytes=len(data),
+                hash=hashlib.md5(data).hexdigest(),
+                _saved=True,
+                client=self.client,
+            )
+            for name, data in self.remote.items()
+            if name.startswith(prefix)
+        ]
+
+    def search(self):
+        search = MagicMock()
+        filters = []
+
+        def filter(expression):
+            filters.append(expression.serialize())
+            return search
+
+        def iterate():
+            prefix = ""
+            for expression in filters:
+                if "prefix" in expression:
+                    prefix = expression["prefix"]["name"]
+            return iter(self.blobs(prefix))
+
+        search.filter.side_effect = filter
+        search.__iter__.side_effect = iterate
+        return search
+
+    def get(self, id, client=None):
+        name = id[len("data/{}/".format(NAMESPACE)) :]
+        for blob in self.blobs():
+            if blob.name == name:
+                return blob
+        return None
+
+    def test_registered(self):
+        assert fsspec.get_filesystem_class("dlblob") is blob_fs.BlobFileSystem
+
+    def test_ls_and_info(self):
+        with patch.object(Blob, "search", side_effect=lambda client: self.search()):
+            with patch.object(Blob, "get", side_effect=self.get):
+                assert self.fs.ls("dlblob://{}".format(NAMESPACE), detail=False) == [
+                    NAMESPACE + "/a.txt",
+                    NAMESPACE + "/tables",
+                ]
+                entries = self.fs.ls(NAMESPACE + "/tables")
+                assert [(e["name"], e["type"], e["size"]) for e in entries] == [
+                    (NAMESPACE + "/tables/2024", "directory", 0),
+                    (NAMESPACE + "/tables/t1.parquet", "file", 10),
+                ]
+
+                info = self.fs.info("dlblob://{}/a.txt".format(NAMESPACE))
+                assert info["type"] == "file"
+                assert info["size"] == 9
+                assert info["hash"] == hashlib.md5(b"some data").hexdigest()
+                assert self.fs.isdir(NAMESPACE + "/tables/2024")
+                assert not self.fs.exists(NAMESPACE + "/missing")
+                assert self.fs.ls(NAMESPACE + "/a.txt", detail=False) == [
+                    NAMESPACE + "/a.txt"
+                ]
+
+    def test_read(self):
+        def data(blob, range=None):
+            value = self.remote[blob.name]
+            if range is not None:
+                value = value[range[0] : range[1] + 1]
+            return value
+
+        with patch.object(Blob, "get", side_effect=self.get):
+            with patch.object(Blob, "data", autospec=True, side_effect=data):
+                path = "dlblob://{}/tables/t1.parquet".format(NAMESPACE)
+                assert self.fs.cat_file(path) == b"0123456789"
+                assert self.fs.cat_file(path, start=2, end=5) == b"234"
+                assert self.fs.cat_file(path, start=-3) == b"789"
+
+            with patch.object(Blob, "open", autospec=True) as open_mock:
+                self.fs.open(path, block_size=1024)
+            open_mock.assert_called_once()
+            assert open_mock.call_args[1]["block_size"] == 1024
+
+            with pytest.raises(NotImplementedError):
+                self.fs.open(path, "wb")
+            with pytest.raises(FileNotFoundError):
+                self.fs.open(NAMESPACE + "/missing", "rb")
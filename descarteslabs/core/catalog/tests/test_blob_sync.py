@@ -0,0 +1,228 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import click.testing
+import pytest
+
+from .. import blob_sync
+from ..blob import Blob
+from ..blob_sync import sync_blobs
+from ..cli import blobs as blobs_cli
+from ..cli.cli import cli
+from .base import ClientTestCase
+
+NAMESPACE = "someorg:test-namespace"
+
+
+def _namespace_id(namespace_id, client=None):
+    return NAMESPACE
+
+
+class TestSyncBlobs(ClientTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.local_dir = self.tempdir.name
+        self.remote = {
+            "a.txt": b"unchanged",
+            "b/c.txt": b"remote version",
+            "old.txt": b"extraneous",
+        }
+        self.local = {
+            "a.txt": b"unchanged",
+            "b/c.txt": b"local version!",
+            "d.txt": b"new",
+        }
+        for name, data in self.local.items():
+            path = os.path.join(self.local_dir, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def blobs(self):
+        return [
+            Blob(
+                id="data/{}/models/{}".format(NAMESPACE, name),
+                name="models/" + name,
+                namespace=NAMESPACE,
+                size_bytes=len(data),
+                hash=hashlib.md5(data).hexdigest(),
+                tags=["model"],
+                _saved=True,
+                client=self.client,
+            )
+            for name, data in self.remote.items()
+        ]
+
+    def search(self):
+        search = MagicMock()
+        search.filter.return_value = search
+        search.__iter__.side_effect = lambda: iter(self.blobs())
+        return search
+
+    def read_local(self):
+        files = {}
+        for root, _, filenames in os.walk(self.local_dir):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                with open(path, "rb") as f:
+                    name = os.path.relpath(path, self.local_dir).replace(os.sep, "/")
+                    files[name] = f.read()
+        return files
+
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    @patch.object(Blob, "delete_many")
+    @patch.object(Blob, "delete")
+    @patch.object(Blob, "upload", autospec=True)
+    def test_upload(self, upload_mock, delete_mock, delete_many_mock):
+        uploaded = {}
+
+        def upload(blob, file):
+            with open(file, "rb") as f:
+                data = f.read()
+                assert blob.hash == hashlib.md5(data).hexdigest()
+                uploaded[blob.name] = (data, list(blob.tags or []))
+
+        upload_mock.side_effect = upload
+
+        with patch.object(Blob, "search", return_value=self.search()):
+            result = sync_blobs(
+                self.local_dir,
+                "test-namespace",
+                prefix="models",
+                delete=True,
+                client=self.client,
+            )
+
+        assert result.transferred == ["b/c.txt", "d.txt"]
+        assert result.unchanged == ["a.txt"]
+        assert result.deleted == ["old.txt"]
+        assert not result.errors
+        assert result.bytes_transferred == len(b"local version!") + len(b"new")
+        assert result.bytes_skipped == len(b"unchanged")
+
+        # a changed blob is replaced, keeping its attributes
+        assert uploaded == {
+            "models/b/c.txt": (b"local version!", ["model"]),
+            "models/d.txt": (b"new", []),
+        }
+        delete_mock.assert_called_once_with(
+            "data/{}/models/b/c.txt".format(NAMESPACE), client=self.client
+        )
+        delete_many_mock.assert_called_once_with(
+            ["data/{}/models/old.txt".format(NAMESPACE)],
+            wait_for_completion=True,
+            client=self.client,
+        )
+
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    @patch.object(Blob, "delete")
+    @patch.object(Blob, "upload", autospec=True)
+    def test_upload_unreadable(self, upload_mock, delete_mock):
+        # differs in size, so that the file is only read to be uploaded
+        self.remote["b/c.txt"] = b"older remote version"
+        md5_file = blob_sync.md5_file
+
+        def md5(path):
+            if path.endswith("c.txt"):
+                raise PermissionError(path)
+            return md5_file(path)
+
+        with patch.object(Blob, "search", return_value=self.search()):
+            with patch.object(blob_sync, "md5_file", side_effect=md5):
+                result = sync_blobs(
+                    self.local_dir,
+                    "test-namespace",
+                    prefix="models",
+                    client=self.client,
+                )
+
+        assert result.transferred == ["d.txt"]
+        assert [name for name, _ in result.errors] == ["b/c.txt"]
+        # the blob is not deleted
+        delete_mock.assert_not_called()
+        assert upload_mock.call_count == 1
+
+    @patch.object(Blob, "namespace_id", _namespace_id)
+    @patch.object(Blob, "download", autospec=True)
+    def test_download(self, download_mock):
+        def download(blob, file):
+            with open(file, "wb") as f:
+                f.write(self.remote[blob.name[len("models/") :]])
+            return file
+
+        download_mock.side_effect = download
+
+        with patch.object(Blob, "search", return_value=self.search()):
+            result = sync_blobs(
+                self.local_dir,
+                prefix="models/",
+                direction="download",
+                dry_run=True,
+                client=self.client,
+            )
+        assert result.dry_run
+        assert result.transferred == ["b/c.txt", "old.txt"]
+        assert str(result).startswith("Dry run: 2 transferred")
+        assert not download_mock.called
+
+        with patch.object(Blob, "search", return_value=self.search()):
+            result = sync_blobs(
+                self.local_dir,
+                prefix="models/",
+                direction="download",
+                delete=True,
+                client=self.client,
+            )
+        assert result.transferred == ["b/c.txt", "old.txt"]
+        assert result.unchanged == ["a.txt"]
+        assert result.deleted == ["d.txt"]
+        assert self.read_local() == self.remote
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            sync_blobs(self.local_dir, direction="both", client=self.client)
+        with pytest.raises(ValueError):
+            sync_blobs(os.path.join(self.local_dir, "missing"), client=self.client)
+
+    @patch.object(blobs_cli, "sync_blobs")
+    def test_cli(self, sync_mock):
+        sync_mock.return_value.transferred = ["d.txt"]
+        sync_mock.return_value.deleted = []
+        sync_mock.return_value.errors = []
+
+        result = click.testing.CliRunner().invoke(
+            cli,
+            ["blobs", "sync", self.local_dir, "--prefix", "models", "--dry-run"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Would upload d.txt" in result.output
+        sync_mock.assert_called_once_with(
+            self.local_dir,
+            namespace=None,
+            prefix="models",
+            direction="upload",
+            delete=False,
+            max_workers=8,
+            dry_run=True,
+        )
@@ -0,0 +1,204 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from descarteslabs.exceptions import BadRequestError, ServerError
+
+from ..attributes import DocumentState
+from ..bulk import bulk_save, bulk_upload
+from ..image import Image
+from ..image_upload import ImageUpload, ImageUploadStatus
+from ..product import Product
+from .base import ClientTestCase
+
+
+class TestBulkSave(ClientTestCase):
+    def product(self, i):
+        return Product(
+            id="p{}".format(i),
+            name="Product {}".format(i),
+            client=self.client,
+            _saved=True,
+        )
+
+    def callback(self, request):
+        body = json.loads(request.body)
+        data = body["data"]
+        if data["attributes"].get("name") == "bad":
+            return (400, {}, json.dumps(self.not_found_json))
+        data["attributes"].setdefault("name", "unchanged")
+        return (200, {}, json.dumps({"data": data, "jsonapi": {"version": "1.0"}}))
+
+    @responses.activate
+    def test_bulk_save(self):
+        responses.add_callback(responses.PATCH, self.match_url, callback=self.callback)
+
+        products = [self.product(i) for i in range(5)]
+        for p in products[:4]:
+            p.tags = ["new"]
+        products[1].name = "bad"
+
+        result = bulk_save(products, max_workers=2)
+
+        assert [p.id for p in result] == ["p0", "p2", "p3", "p4"]
+        assert [e.object.id for e in result.errors] == ["p1"]
+        assert isinstance(result.errors[0].exception, BadRequestError)
+        # the unmodified product is not sent
+        assert len(responses.calls) == 4
+        # only modified attributes are sent
+        body = json.loads(responses.calls[0].request.body)
+        assert body["data"]["attributes"].keys() <= {"tags", "name"}
+        assert products[0].state == DocumentState.SAVED
+        assert products[1].state == DocumentState.MODIFIED
+
+    @responses.activate
+    def test_bulk_save_raise(self):
+        responses.add_callback(responses.PATCH, self.match_url, callback=self.callback)
+
+        products = [self.product(i) for i in range(3)]
+        for p in products:
+            p.name = "bad"
+
+        with pytest.raises(BadRequestError):
+            bulk_save(products, max_workers=1, on_error="raise")
+        assert len(responses.calls) == 1
+
+        with pytest.raises(ValueError):
+            bulk_save(products, on_error="ignore")
+
+    @responses.activate
+    def test_bulk_save_rate_limited(self):
+        responses.add(
+            responses.PATCH,
+            self.match_url,
+            status=429,
+            headers={"Retry-After": "0"},
+            json={},
+        )
+        responses.add_callback(responses.PATCH, self.match_url, callback=self.callback)
+
+        p = self.product(0)
+        p.tags = ["new"]
+        result = bulk_save([p])
+
+        assert [p] == result
+        assert not result.errors
+        assert len(responses.calls) == 2
+
+
+class TestBulkUpload(ClientTestCase):
+    def upload_json(self, upload_id, status):
+        return {
+            "type": "image_upload",
+            "id": upload_id,
+            "attributes": {
+                "product_id": "p1",
+                "image_id": "p1:image{}".format(upload_id[1:]),
+                "status": status.value,
+            },
+        }
+
+    def get_callback(self, request):
+        path = request.path_url.split("?")[0]
+        if path.endswith("/products/p1"):
+            data = {"type": "product", "id": "p1", "attributes": {}}
+        elif path.endswith("/uploads_v2/u0"):
+            data = self.upload_json("u0", ImageUploadStatus.SUCCESS)
+        elif path.endswith("/uploads_v2/u1"):
+            data = self.upload_json("u1", ImageUploadStatus.FAILURE)
+        else:
+            data = {
+                "type": "image",
+                "id": "p1:image0",
+                "attributes": {"name": "image0", "product_id": "p1"},
+            }
+        return (200, {}, json.dumps({"data": data, "jsonapi": {"version": "1.0"}}))
+
+    def search_callback(self, request):
+        search = json.dumps(json.loads(request.body))
+        self.searches.append(search)
+        data = []
+        if '\\"u0\\"' in search:
+            data.append(self.upload_json("u0", ImageUploadStatus.SUCCESS))
+        if '\\"u1\\"' in search:
+            # still running when first polled
+            self.u1_polls += 1
+            status = (
+                ImageUploadStatus.RUNNING
+                if self.u1_polls == 1
+                else ImageUploadStatus.FAILURE
+            )
+            data.append(self.upload_json("u1", status))
+        return (
+            200,
+            {},
+            json.dumps({"data": data, "links": {}, "jsonapi": {"version": "1.0"}}),
+        )
+
+    @patch.object(ImageUpload, "_POLLING_INTERVALS", [0.2])
+    @patch.object(Image, "upload", autospec=True)
+    @responses.activate
+    def test_bulk_upload(self, upload_mock):
+        self.searches = []
+        self.u1_polls = 0
+        responses.add_callback(
+            responses.GET, self.match_url, callback=self.get_callback
+        )
+        responses.add_callback(
+            responses.PUT, self.match_url, callback=self.search_callback
+        )
+
+        def upload(image, files, **kwargs):
+            if files == "bad.tif":
+                raise ServerError("unavailable")
+            return ImageUpload(
+                id="u{}".format(image.name[-1]),
+                product_id=image.product_id,
+                status=ImageUploadStatus.PENDING,
+                client=self.client,
+                _saved=True,
+            )
+
+        upload_mock.side_effect = upload
+
+        images = [
+            Image(name="image{}".format(i), product_id="p1", client=self.client)
+            for i in range(3)
+        ]
+        results = list(
+            bulk_upload(zip(images, ["a.tif", "b.tif", "bad.tif"]), max_workers=2)
+        )
+
+        # the results are returned as the uploads complete
+        results = {r.image.name: r for r in results}
+        assert {name: r.status for name, r in results.items()} == {
+            "image0": ImageUploadStatus.SUCCESS,
+            "image1": ImageUploadStatus.FAILURE,
+            "image2": None,
+        }
+        assert results["image0"].success
+        assert not results["image1"].success and not results["image1"].retryable
+        assert isinstance(results["image2"].exception, ServerError)
+        assert results["image2"].retryable
+
+        # the product is looked up once
+        assert images[0].product is images[1].product is images[2].product
+        # the pending uploads are polled together, until they complete
+        assert any('\\"u0\\"' in s and '\\"u1\\"' in s for s in self.searches)
+        assert '\\"u0\\"' not in self.searches[-1]
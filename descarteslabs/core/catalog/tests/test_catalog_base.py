@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import pytest
 import responses
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 
 from descarteslabs.exceptions import (
@@ -34,6 +36,7 @@ from ..catalog_base import (
     CatalogClient,
     CatalogObject as OriginalCatalogObject,
     DeletedObjectError,
+    GetManyError,
     UnsavedObjectError,
 )
 from ..named_catalog_base import NamedCatalogObject
@@ -283,6 +286,72 @@ class TestCatalogObject(ClientTestCase):
         assert ["baz", "qux"] == [f.bar for f in foos]
         assert responses.calls[1].request.headers["X-On-Behalf-Of"] == "user"
 
+    @responses.activate
+    def test_get_many_chunked(self):
+        def callback(request):
+            ids = json.loads(json.loads(request.body)["filter"])[0]["val"]
+            data = [
+                {"attributes": {"bar": id_}, "id": id_, "type": Foo._doc_type}
+                for id_ in reversed(ids)
+                if id_ != "p1:3"
+            ]
+            return (200, {}, json.dumps({"data": data, "jsonapi": {"version": "1.0"}}))
+
+        responses.add_callback(responses.PUT, self.match_url, callback=callback)
+
+        ids = ["p1:{}".format(i) for i in range(7)]
+        with patch.object(Foo, "_MAX_IDS_PER_REQUEST", 2):
+            with pytest.raises(NotFoundError):
+                Foo.get_many(ids, client=self.client)
+            assert len(responses.calls) == 4
+
+            foos = Foo.get_many(ids, ignore_missing=True, client=self.client)
+            assert [id_ for id_ in ids if id_ != "p1:3"] == [f.id for f in foos]
+            assert [f.id for f in foos] == [f.bar for f in foos]
+
+            streamed = Foo.iter_many(ids, ignore_missing=True, client=self.client)
+            assert sorted(f.id for f in foos) == sorted(f.id for f in streamed)
+
+    @responses.activate
+    def test_get_many_chunk_errors(self):
+        self.mock_response(responses.PUT, self.not_found_json, status=400)
+
+        ids = ["p1:{}".format(i) for i in range(4)]
+        with patch.object(Foo, "_MAX_IDS_PER_REQUEST", 2):
+            with pytest.raises(GetManyError) as e:
+                Foo.get_many(ids, client=self.client)
+        # the failures of all chunks, raised from the first one
+        assert len(e.value.errors) == 2
+        assert all(isinstance(error, BadRequestError) for error in e.value.errors)
+        assert e.value.__cause__ is e.value.errors[0]
+
+        with pytest.raises(BadRequestError):
+            Foo.get_many(ids, client=self.client)
+
+    @responses.activate
+    def test_iter_many_closed(self):
+        def callback(request):
+            ids = json.loads(json.loads(request.body)["filter"])[0]["val"]
+            data = [
+                {"attributes": {"bar": id_}, "id": id_, "type": Foo._doc_type}
+                for id_ in ids
+            ]
+            return (200, {}, json.dumps({"data": data, "jsonapi": {"version": "1.0"}}))
+
+        responses.add_callback(responses.PUT, self.match_url, callback=callback)
+
+        ids = ["p1:{}".format(i) for i in range(20)]
+        with patch.object(Foo, "_MAX_IDS_PER_REQUEST", 2):
+            foos = Foo.iter_many(ids, max_workers=1, client=self.client)
+            assert next(foos).id in ids
+            foos.close()
+        # the pending chunks are not requested
+        assert len(responses.calls) < 10
+
+    def test_iter_many_invalid_ids(self):
+        with pytest.raises(TypeError):
+            Foo.iter_many("p1:foo", client=self.client)
+
     @responses.activate
     def test_reload(self):
         self.mock_response(
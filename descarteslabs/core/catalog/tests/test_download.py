@@ -20,6 +20,7 @@ from unittest.mock import MagicMock, mock_open, patch
 from descarteslabs.exceptions import NotFoundError, BadRequestError
 from ...common.geo import AOI
 from .. import helpers
+from ..blob import Blob
 
 
 class TestFormat(unittest.TestCase):
@@ -97,6 +98,28 @@ class TestDownload(unittest.TestCase):
         with pytest.raises(ValueError):
             self.download(file, format="foo")
 
+    def test_to_blob(self, mock_raster, mock_makedirs, mock_open):
+        def raster(**kwargs):
+            kwargs["outfile"].write(b"i'm a png!")
+
+        mock_raster.side_effect = raster
+        uploaded = []
+
+        blob = Blob(name="rasters/foo.png", namespace="someorg:test-namespace")
+        with patch.object(Blob, "upload", autospec=True) as mock_upload:
+            mock_upload.side_effect = lambda blob, file: uploaded.append(file.read())
+            assert self.download_mosaic(blob, format="tif") is blob
+
+        assert uploaded == [b"i'm a png!"]
+        mock_raster.assert_called_once()
+        assert mock_raster.call_args[1]["output_format"] == "PNG"
+        assert "outfile_basename" not in mock_raster.call_args[1]
+        mock_makedirs.assert_not_called()
+        mock_open.assert_not_called()
+
+        with pytest.raises(ValueError):
+            self.download(Blob(namespace="someorg:test-namespace"))
+
     def test_to_path(self, mock_raster, mock_makedirs, mock_open):
         path = "foo/bar.tif"
         result = self.download(path)
@@ -14,6 +14,7 @@
 
 import datetime
 import functools
+import io
 import json
 import os.path
 import textwrap
@@ -26,6 +27,8 @@ import responses
 import shapely.geometry
 from unittest.mock import patch
 
+from descarteslabs.exceptions import BadRequestError, RateLimitError
+
 from ...common.geo import AOI
 from ...common.property_filtering import Properties
 from ...common.shapely_support import shapely_to_geojson
@@ -38,7 +41,7 @@ from ..attributes import (
     MappingAttribute,
 )
 from ..image import Image
-from ..image_upload import ImageUploadStatus
+from ..image_upload import ImageUploadOptions, ImageUploadStatus
 from ..product import Product
 from .base import ClientTestCase
 from .mock_data import (
@@ -635,9 +638,10 @@ class TestImage(ClientTestCase):
         assert upload.product_id == product_id
         assert upload.image_id == image.id
         assert upload.status == ImageUploadStatus.PENDING
-        assert len(upload_mock.session.put.call_args_list) == 2
-        assert upload_mock.session.put.call_args_list[0][0][0] == upload_url1
-        assert upload_mock.session.put.call_args_list[1][0][0] == upload_url2
+        # the files are uploaded concurrently
+        assert sorted(
+            call[0][0] for call in upload_mock.session.put.call_args_list
+        ) == [upload_url1, upload_url2]
 
         upload.wait_for_completion(15)
 
@@ -871,10 +875,91 @@ class TestImage(ClientTestCase):
             assert 1 == len(w)
             assert "cs_code" in str(w[0].message)
 
-    @patch("descarteslabs.catalog.Image._do_upload", return_value=True)
+    @patch.object(image_module.Image, "_upload_service")
+    @responses.activate
+    def test_do_upload_retries(self, upload_mock):
+        upload_urls = ["https:www.fake.com/{}".format(i) for i in range(3)]
+        for method, status in (
+            (responses.POST, ImageUploadStatus.TRANSFERRING),
+            (responses.PATCH, ImageUploadStatus.PENDING),
+        ):
+            self.mock_response(
+                method,
+                {
+                    "data": {
+                        "type": "image_upload",
+                        "id": "1",
+                        "attributes": {
+                            "product_id": "p1",
+                            "image_id": "p1:image",
+                            "resumable_urls": upload_urls,
+                            "status": status.value,
+                        },
+                    },
+                    "jsonapi": {"version": "1.0"},
+                },
+            )
+
+        uploaded = {}
+
+        def put(url, data=None, headers=None):
+            content = data.read(4)
+            if url == upload_urls[1] and url not in uploaded:
+                # fail after part of the file was sent
+                uploaded[url] = None
+                raise RateLimitError("slow down", retry_after="0")
+            uploaded[url] = content + data.read()
+
+        upload_mock.session.put.side_effect = put
+
+        contents = [b"first file", b"second file", b"third file"]
+        files = [io.BytesIO(content) for content in contents]
+        for f in files:
+            f.mode = "rb"
+
+        image = Image(id="p1:image", client=self.client)
+        upload = image._do_upload(
+            files, ImageUploadOptions(), max_workers=2, progress=True
+        )
+
+        assert upload.status == ImageUploadStatus.PENDING
+        assert upload_mock.session.put.call_count == 4
+        # the failed file is sent again from the start
+        assert [uploaded[url] for url in upload_urls] == contents
+        assert all(f.closed for f in files)
+
+        upload_mock.session.put.side_effect = BadRequestError("bad")
+        files = [io.BytesIO(content) for content in contents]
+        for f in files:
+            f.mode = "rb"
+        with pytest.raises(BadRequestError):
+            image._do_upload(files, ImageUploadOptions(), retries=1)
+        assert all(f.closed for f in files)
+
+    @patch.object(image_module._NpyStream, "_BLOCK_SIZE", 100)
+    def test_npy_stream(self):
+        array = np.arange(3 * 20 * 10, dtype=np.int16).reshape((3, 20, 10))
+        for a in (array, np.asfortranarray(array), np.moveaxis(array, 0, -1)):
+            expected = io.BytesIO()
+            np.save(expected, a)
+            expected = expected.getvalue()
+
+            stream = image_module._NpyStream(a, "a.npy")
+            assert stream.read() == expected
+            assert stream.seek(0, io.SEEK_END) == len(expected)
+            stream.seek(len(expected) // 2)
+            assert stream.read(7) == expected[len(expected) // 2 :][:7]
+            stream.seek(0)
+            np.testing.assert_array_equal(np.load(stream), a)
+
+    @patch("descarteslabs.catalog.Image._do_upload")
     @patch("descarteslabs.catalog.Image.exists", return_value=False)
-    @patch("numpy.save")
-    def test_upload_ndarray_moves_band_axis(self, mock_np_save, *mocks):
+    def test_upload_ndarray_moves_band_axis(self, exists_mock, do_upload_mock):
+        uploaded = []
+        do_upload_mock.side_effect = lambda files, options, **kwargs: uploaded.extend(
+            np.load(f) for f in files
+        )
+
         p = Product(id="p1", name="Test Product", client=self.client, _saved=True)
         image = Image(
             id="p1:image",
@@ -884,20 +969,26 @@ class TestImage(ClientTestCase):
             projection="foo",
         )
 
-        array = np.zeros((1, 100, 100))
+        array = np.arange(2 * 30 * 40, dtype=np.uint16).reshape((2, 30, 40))
         with warnings.catch_warnings(record=True) as w:
             image.upload_ndarray(array)
             assert 0 == len(w)
 
-        assert mock_np_save.called
-
-        _, ndarray = mock_np_save.call_args[0]
-        assert ndarray.shape == (100, 100, 1)
+        assert do_upload_mock.called
+        # the array is streamed in .npy format with the bands last
+        (ndarray,) = uploaded
+        assert ndarray.shape == (30, 40, 2)
+        np.testing.assert_array_equal(ndarray, np.moveaxis(array, 0, -1))
+        assert array.shape == (2, 30, 40)
 
-    @patch("descarteslabs.catalog.Image._do_upload", return_value=True)
+    @patch("descarteslabs.catalog.Image._do_upload")
     @patch("descarteslabs.catalog.Image.exists", return_value=False)
-    @patch("numpy.save")
-    def test_upload_ndarray_multiple(self, mock_np_save, *mocks):
+    def test_upload_ndarray_multiple(self, exists_mock, do_upload_mock):
+        uploaded = []
+        do_upload_mock.side_effect = lambda files, options, **kwargs: uploaded.extend(
+            np.load(f) for f in files
+        )
+
         p = Product(id="p1", name="Test Product", client=self.client, _saved=True)
         image = Image(
             id="p1:image",
@@ -938,12 +1029,11 @@ class TestImage(ClientTestCase):
         array2 = np.zeros((1, 25, 25))
         image.upload_ndarray([array, array2])
 
-        assert mock_np_save.call_count == 4
+        # the given arrays are not modified
+        assert array.shape == (1, 75, 75)
+        assert len(uploaded) == 4
 
-        shapes = [
-            ndarray.shape
-            for (_tmp_file, ndarray), _kwargs in mock_np_save.call_args_list
-        ]
+        shapes = [ndarray.shape for ndarray in uploaded]
 
         assert shapes == [
             (100, 100, 1),
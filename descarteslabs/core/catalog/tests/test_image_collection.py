@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import pytest
 import unittest
 from unittest.mock import patch
@@ -19,10 +20,13 @@ import os.path
 import shapely.geometry
 import numpy as np
 
-from ...common.geo import AOI
+from ...client.services.raster.raster import NdarrayRequest
+from ...common.dltile import Grid
+from ...common.geo import AOI, DLTile
 
 from .. import image_collection as icmod
 from .. import image as imod
+from ..attributes import DocumentState
 from ..image_collection import ImageCollection
 from ..image import Image
 from ..image_types import ResampleAlgorithm, DownloadFileFormat
@@ -74,6 +78,48 @@ class TestImageCollection(unittest.TestCase):
         stack_axis_1 = ic.stack("nir red", bands_axis=1)
         assert stack_axis_1.shape == (2, 2, 122, 120)
 
+    @patch.object(Image, "get", _image_get)
+    @patch.object(
+        imod,
+        "cached_bands_by_product",
+        _cached_bands_by_product,
+    )
+    @patch.object(
+        icmod,
+        "cached_bands_by_product",
+        _cached_bands_by_product,
+    )
+    @patch.object(imod.Raster, "ndarray")
+    def test_stack_raster_request(self, mock_raster):
+        mock_raster.side_effect = functools.partial(_raster_ndarray, None)
+        image_ids = (
+            "landsat:LC08:PRE:TOAR:meta_LC80270312016188_v1",
+            "landsat:LC08:PRE:TOAR:meta_LC80260322016197_v1",
+        )
+        images = [Image.get(image_id) for image_id in image_ids]
+        geocontext = images[0].geocontext.assign(
+            geometry=images[0].geometry.intersection(images[1].geometry),
+            bounds="update",
+            resolution=600,
+        )
+
+        ic = ImageCollection(images, geocontext=geocontext)
+        with patch.object(
+            imod.Raster,
+            "ndarray_request",
+            autospec=True,
+            side_effect=imod.Raster.ndarray_request,
+        ) as mock_request:
+            stack = ic.stack("nir")
+        assert stack.shape == (2, 1, 122, 120)
+
+        # a single request is prepared for the images of the same product
+        assert mock_request.call_count == 1
+        calls = mock_raster.call_args_list
+        assert isinstance(calls[0].kwargs["request"], NdarrayRequest)
+        assert calls[0].kwargs["request"] is calls[1].kwargs["request"]
+        assert sorted(call.kwargs["inputs"][0] for call in calls) == sorted(image_ids)
+
     @patch.object(Image, "get", _image_get)
     @patch.object(
         imod,
@@ -274,6 +320,113 @@ class TestImageCollection(unittest.TestCase):
 
         assert len(images.filter_coverage(geocontext)) == 1
 
+    def test_coverage(self):
+        polygon = shapely.geometry.box(0, 0, 2, 2)
+        images = ImageCollection(
+            [
+                Image(id="foo:left", geometry=shapely.geometry.box(0, 0, 1, 2)),
+                Image(id="foo:outside", geometry=shapely.geometry.box(5, 5, 6, 6)),
+                Image(id="foo:none"),
+                Image(id="foo:all", geometry=shapely.geometry.box(-1, -1, 3, 3)),
+            ]
+        )
+
+        coverage = images.coverage(polygon.__geo_interface__)
+        assert isinstance(coverage, np.ndarray)
+        np.testing.assert_allclose(coverage, [0.5, 0.0, 0.0, 1.0])
+        for image, value in zip(images, coverage):
+            if image.geometry is not None:
+                assert image.coverage(polygon) == pytest.approx(value)
+
+        filtered = images.filter_coverage(polygon, 0.5)
+        assert isinstance(filtered, ImageCollection)
+        assert ["foo:left", "foo:all"] == filtered.each.id.combine()
+
+        assert len(ImageCollection([]).coverage(polygon)) == 0
+
+    def test_partition_by_tiles(self):
+        grid = Grid(resolution=100, tilesize=100, pad=0)
+        tiles = list(grid.tiles_from_shape(shapely.geometry.box(3, 1, 3.3, 1.3)))
+        assert len(tiles) > 4
+
+        west = shapely.geometry.box(2.9, 0.9, 3.12, 1.4)
+        images = ImageCollection(
+            [
+                Image(id="foo:west", geometry=west),
+                Image(id="foo:all", geometry=shapely.geometry.box(2.9, 0.9, 3.4, 1.4)),
+                Image(id="foo:corner", geometry=tiles[0].polygon.buffer(-0.001)),
+                Image(id="foo:far", geometry=shapely.geometry.box(10, 10, 11, 11)),
+            ]
+        )
+
+        partition = images.partition_by_tiles(tiles)
+        assert set(partition) == {tile.key for tile in tiles}
+        for tile in tiles:
+            tile_images = partition[tile.key]
+            assert isinstance(tile_images, ImageCollection)
+            assert isinstance(tile_images.geocontext, DLTile)
+            assert tile_images.geocontext.key == tile.key
+            expected = [i.id for i in images if i.geometry.intersects(tile.polygon)]
+            assert expected == tile_images.each.id.combine()
+            assert "foo:far" not in expected
+
+        partition = images.partition_by_tiles(
+            [tile.key for tile in tiles], min_coverage=0.9
+        )
+        assert all(
+            ["foo:corner"] != tile_images.each.id.combine()
+            for tile_images in partition.values()
+        )
+        assert all(
+            "foo:all" in tile_images.each.id.combine()
+            for tile_images in partition.values()
+        )
+
+        # tiles from a grid are streamed over the image footprints
+        partition = images[:2].iter_partition_by_tiles(grid)
+        assert not isinstance(partition, dict)
+        keys = [key for key, _ in partition]
+        assert set(keys) >= {tile.key for tile in tiles}
+
+        with pytest.raises(TypeError):
+            images.partition_by_tiles([1])
+
+    @patch.object(Image, "get", _image_get)
+    def test_to_bytes(self):
+        image = Image.get("landsat:LC08:PRE:TOAR:meta_LC80270312016188_v1")
+        geocontext = image.geocontext.assign(resolution=600)
+        images = ImageCollection(
+            [image, Image(id="foo:bar", product_id="foo", cloud_fraction=0.5)],
+            geocontext=geocontext,
+        )
+
+        data = images.to_bytes()
+        assert isinstance(data, bytes)
+        restored = ImageCollection.from_bytes(data)
+
+        assert isinstance(restored, ImageCollection)
+        assert restored.each.id.combine() == images.each.id.combine()
+        for original, copy in zip(images, restored):
+            assert copy.serialize() == original.serialize()
+            assert copy.acquired == original.acquired
+            assert copy.state == DocumentState.SAVED
+        assert restored[0].geometry.equals(image.geometry)
+        assert restored[1].geometry is None
+        assert isinstance(restored.geocontext, AOI)
+        assert restored.geocontext == geocontext
+
+        tile = DLTile.from_key("2048:16:30.0:15:3:80")
+        restored = ImageCollection.from_bytes(
+            ImageCollection(images, geocontext=tile).to_bytes()
+        )
+        assert restored.geocontext == tile
+        assert restored.geocontext.key == tile.key
+
+        assert ImageCollection.from_bytes(ImageCollection().to_bytes()) == []
+
+        with pytest.raises(ValueError):
+            ImageCollection.from_bytes(b"not an image collection")
+
     @patch.object(Image, "get", _image_get)
     @patch.object(
         icmod,
@@ -0,0 +1,94 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import shapely.geometry
+
+from ...common.property_filtering import Properties
+from .. import image_collection as icmod
+from ..image import Image
+from ..image_collection import ImageCollection
+from ..image_index import ImageIndex
+from .mock_data import _cached_bands_by_product
+
+properties = Properties()
+
+
+@patch.object(icmod, "cached_bands_by_product", _cached_bands_by_product)
+class TestImageIndex(unittest.TestCase):
+    def setUp(self):
+        self.images = ImageCollection(
+            [
+                Image(
+                    id="landsat:LC08:PRE:TOAR:a",
+                    geometry=shapely.geometry.box(0, 0, 1, 1),
+                    acquired="2020-01-01T00:00:00Z",
+                    cloud_fraction=0.1,
+                    cs_code="EPSG:4326",
+                ),
+                Image(
+                    id="landsat:LC08:PRE:TOAR:b",
+                    geometry=shapely.geometry.box(2, 2, 3, 3),
+                    acquired="2020-01-02T00:00:00Z",
+                    cloud_fraction=0.5,
+                ),
+                Image(
+                    id="landsat:LC08:PRE:TOAR:c",
+                    geometry=shapely.geometry.box(0.5, 0.5, 2.5, 2.5),
+                    acquired="2020-01-03T00:00:00Z",
+                    cloud_fraction=0.2,
+                ),
+                Image(id="landsat:LC08:PRE:TOAR:d"),
+            ]
+        )
+        self.index = ImageIndex(self.images)
+
+    def test_all(self):
+        assert len(self.index) == 4
+        assert ["a", "b", "c", "d"] == [i.name for i in self.index.query()]
+
+    def test_intersects(self):
+        images = self.index.intersects(shapely.geometry.box(0.9, 0.9, 2.1, 2.1))
+        assert isinstance(images, ImageCollection)
+        assert ["a", "b", "c"] == [i.name for i in images]
+
+        geojson = shapely.geometry.mapping(shapely.geometry.Point(2.8, 2.8))
+        assert ["b"] == [i.name for i in self.index.intersects(geojson)]
+
+    def test_date_range(self):
+        images = self.index.query(
+            start_datetime="2020-01-02T00:00:00Z", end_datetime=datetime(2020, 1, 3)
+        )
+        assert ["b"] == [i.name for i in images]
+
+        images = self.index.query(start_datetime="2020-01-02T00:00:00Z")
+        assert ["b", "c"] == [i.name for i in images]
+
+        images = self.index.query(end_datetime="2020-01-02T00:00:00Z")
+        assert ["a"] == [i.name for i in images]
+
+    def test_combined(self):
+        images = self.index.query(
+            intersects=shapely.geometry.box(0.9, 0.9, 2.1, 2.1),
+            start_datetime="2020-01-01T12:00:00Z",
+            filter=properties.cloud_fraction < 0.3,
+        )
+        assert ["c"] == [i.name for i in images]
+
+    def test_empty(self):
+        index = ImageIndex([])
+        assert 0 == len(index.query(start_datetime="2020-01-01T00:00:00Z"))
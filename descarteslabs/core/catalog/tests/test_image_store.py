@@ -0,0 +1,136 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from datetime import date, datetime
+
+import responses
+
+from ..image import Image
+from ..image_collection import ImageCollection
+from ..image_store import ImageStore, sync_images
+from .base import ClientTestCase
+
+
+def _image_doc(name, acquired, modified):
+    return {
+        "attributes": {
+            "name": name,
+            "product_id": "p1",
+            "acquired": acquired,
+            "modified": modified,
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
+            },
+        },
+        "type": "image",
+        "id": "p1:{}".format(name),
+    }
+
+
+class TestImageStore(ClientTestCase):
+    def mock_images(self, *docs):
+        self.mock_response(
+            responses.PUT,
+            {"data": list(docs), "jsonapi": {"version": "1.0"}, "links": {}},
+        )
+
+    @responses.activate
+    def test_sync(self):
+        self.mock_images(
+            _image_doc("a", "2020-01-02T00:00:00Z", "2020-02-01T00:00:00.000000Z"),
+            _image_doc("b", "2020-01-01T00:00:00Z", "2020-02-02T00:00:00.000000Z"),
+        )
+
+        store = sync_images("p1", ":memory:", client=self.client)
+        assert len(store) == 2
+        assert store.high_water_mark("p1") == "2020-02-02T00:00:00.000000Z"
+
+        request = json.loads(self.get_request_body(0)["filter"])
+        assert {"name": "product_id", "op": "eq", "val": "p1"} in request
+        assert self.get_request_body(0)["sort"] == "modified"
+
+        responses.reset()
+        self.mock_images(
+            _image_doc("b", "2020-01-03T00:00:00Z", "2020-02-03T00:00:00.000000Z")
+        )
+
+        assert store.sync(["p1"], client=self.client) == {"p1": 1}
+        request = json.loads(self.get_request_body(0)["filter"])
+        assert {
+            "name": "modified",
+            "op": "gte",
+            "val": "2020-02-02T00:00:00+00:00",
+        } in request
+
+        images = store.images(client=self.client)
+        assert isinstance(images, ImageCollection)
+        assert ["p1:a", "p1:b"] == [i.id for i in images]
+        assert isinstance(images[0], Image)
+        assert images[1].acquired.day == 3
+
+    @responses.activate
+    def test_sync_modified_formats(self):
+        # timestamps without fractional seconds are normalized before comparing
+        self.mock_images(
+            _image_doc("a", "2020-01-01T00:00:00Z", "2020-02-01T12:00:00.500000Z"),
+            _image_doc("b", "2020-01-02T00:00:00Z", "2020-02-01T12:00:00Z"),
+        )
+        store = sync_images("p1", ":memory:", client=self.client)
+        assert store.high_water_mark("p1") == "2020-02-01T12:00:00.500000Z"
+
+    @responses.activate
+    def test_sync_full(self):
+        self.mock_images(
+            _image_doc("a", "2020-01-01T00:00:00Z", "2020-02-01T00:00:00.000000Z"),
+            _image_doc("b", "2020-01-02T00:00:00Z", "2020-02-01T00:00:00.000000Z"),
+        )
+        store = ImageStore(":memory:")
+        store.sync("p1", client=self.client)
+
+        responses.reset()
+        self.mock_images(
+            _image_doc("a", "2020-01-01T00:00:00Z", "2020-02-01T00:00:00.000000Z")
+        )
+        store.sync("p1", full=True, client=self.client)
+        assert "modified" not in self.get_request_body(0)["filter"]
+
+        assert ["p1:a"] == [i.id for i in store.images(client=self.client)]
+        assert 2 == len(store.images(include_deleted=True, client=self.client))
+
+    @responses.activate
+    def test_images_filters(self):
+        self.mock_images(
+            _image_doc("a", "2020-01-01T00:00:00Z", "2020-02-01T00:00:00.000000Z"),
+            _image_doc("b", "2020-01-02T12:00:00Z", "2020-02-01T00:00:00.000000Z"),
+        )
+        store = sync_images("p1", ":memory:", client=self.client)
+
+        images = store.images(
+            product_ids="p1",
+            start_datetime=datetime(2020, 1, 2),
+            end_datetime="2020-01-03T00:00:00Z",
+            client=self.client,
+        )
+        assert ["p1:b"] == [i.id for i in images]
+        assert 0 == len(store.images(product_ids=["p2"], client=self.client))
+
+        # dates are their midnight in UTC
+        images = store.images(
+            start_datetime=date(2020, 1, 1),
+            end_datetime=date(2020, 1, 2),
+            client=self.client,
+        )
+        assert ["p1:a"] == [i.id for i in images]
@@ -0,0 +1,160 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+import responses
+
+from ..band import SpectralBand
+from ..helpers import cached_bands_by_product
+from ..metadata_cache import MetadataCache, metadata_cache
+from ..product import Product
+from .base import ClientTestCase
+
+
+class TestMetadataCache(ClientTestCase):
+    product_json = {
+        "data": {
+            "attributes": {
+                "readers": [],
+                "writers": [],
+                "owners": ["org:someorg"],
+                "name": "My Product",
+            },
+            "type": "product",
+            "id": "p1",
+        },
+        "jsonapi": {"version": "1.0"},
+    }
+
+    def setUp(self):
+        super().setUp()
+        metadata_cache.configure(cache_get=True)
+
+    def tearDown(self):
+        metadata_cache.configure()
+
+    def test_get_and_stats(self):
+        cache = MetadataCache()
+        fetches = []
+
+        def fetch():
+            fetches.append(1)
+            return {"value": len(fetches)}
+
+        assert cache.get("kind", "id", self.client, fetch) == {"value": 1}
+        value = cache.get("kind", "id", self.client, fetch)
+        assert value == {"value": 1}
+
+        # the cached value is not shared with the caller
+        value["value"] = 42
+        assert cache.get("kind", "id", self.client, fetch) == {"value": 1}
+
+        assert cache.get("kind", "other", self.client, fetch) == {"value": 2}
+        assert cache.stats() == {"hits": 2, "misses": 2, "hit_rate": 0.5, "size": 2}
+
+        cache.invalidate("kind", "id")
+        assert cache.get("kind", "id", self.client, fetch) == {"value": 3}
+        assert cache.get("kind", "other", self.client, fetch) == {"value": 2}
+
+    def test_disabled(self):
+        cache = MetadataCache(enabled=False)
+        assert cache.get("kind", "id", self.client, lambda: 1) == 1
+        assert cache.get("kind", "id", self.client, lambda: 2) == 2
+        assert cache.stats()["misses"] == 0
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = MetadataCache(path=path)
+            cache.get("kind", "id", self.client, lambda: [1, 2])
+
+            other = MetadataCache(path=path)
+            assert other.get("kind", "id", self.client, lambda: None) == [1, 2]
+            assert other.hits == 1
+
+            other.invalidate("kind")
+            assert os.listdir(path) == []
+            assert cache.get("kind", "id", self.client, lambda: [3]) == [1, 2]
+
+    def test_persistence_expired(self):
+        with tempfile.TemporaryDirectory() as path:
+            MetadataCache(path=path, ttl=-1).get("kind", "id", self.client, lambda: 1)
+            assert (
+                MetadataCache(path=path).get("kind", "id", self.client, lambda: 2) == 2
+            )
+
+    @responses.activate
+    def test_product_get(self):
+        self.mock_response(responses.GET, self.product_json)
+
+        p = Product.get("p1", client=self.client)
+        p.name = "Modified"
+        p = Product.get("p1", client=self.client)
+        assert p.name == "My Product"
+        assert p._client is self.client
+        assert len(responses.calls) == 1
+
+        self.mock_response(responses.PATCH, self.product_json)
+        p.name = "Other name"
+        p.save()
+
+        Product.get("p1", client=self.client)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_product_get_not_cached(self):
+        self.mock_response(responses.GET, self.product_json)
+        metadata_cache.configure()
+
+        Product.get("p1", client=self.client)
+        Product.get("p1", client=self.client)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_bands_by_product(self):
+        self.mock_response(
+            responses.PUT,
+            {
+                "data": [
+                    {
+                        "attributes": {
+                            "name": "blue",
+                            "product_id": "p1",
+                            "type": "spectral",
+                        },
+                        "id": "p1:blue",
+                        "type": "band",
+                        "relationships": {
+                            "product": {"data": {"type": "product", "id": "p1"}}
+                        },
+                    }
+                ],
+                "included": [self.product_json["data"]],
+                "links": {},
+                "jsonapi": {"version": "1.0"},
+            },
+        )
+
+        bands = cached_bands_by_product("p1", self.client)
+        assert isinstance(bands["blue"], SpectralBand)
+        assert bands["blue"].product.name == "My Product"
+
+        cached_bands_by_product("p1", self.client)
+        assert len(responses.calls) == 1
+        assert metadata_cache.stats()["size"] == 1
+
+        self.mock_response(responses.DELETE, {})
+        SpectralBand.delete("p1:blue", client=self.client)
+        assert metadata_cache.stats()["size"] == 0
@@ -15,6 +15,7 @@
 import responses
 import json
 import shapely.geometry
+from unittest.mock import patch
 
 from ...common.collection import Collection
 from ...common.geo import AOI
@@ -302,6 +303,51 @@ class TestSearch(ClientTestCase):
         s = self.search.sort("start_datetime").sort("created", ascending=False)
         assert s._to_request() == ("/products", {"sort": "-created"})
 
+    def test_resume_from(self):
+        s = self.search.resume_from(".xxx")
+        assert s._to_request() == ("/products?continuation=.xxx", {})
+        assert self.search._to_request() == ("/products", {})
+
+    @responses.activate
+    def test_checkpoint(self):
+        def product(i):
+            return {
+                "attributes": {"name": "Product {}".format(i)},
+                "type": "product",
+                "id": "someorg:product-{}".format(i),
+            }
+
+        self.mock_response(
+            responses.PUT,
+            {
+                "meta": {"count": 3, "per_item_continuations": [".1", ".2", ".3"]},
+                "data": [product(1), product(2), product(3)],
+                "jsonapi": {"version": "1.0"},
+                "links": {
+                    "self": "https://example.com/catalog/v2/products",
+                    "next": "https://example.com/catalog/v2/products?continuation=.3",
+                },
+            },
+        )
+        self.mock_response(
+            responses.PUT,
+            {
+                "meta": {"count": 1, "per_item_continuations": [".4"]},
+                "data": [product(4)],
+                "jsonapi": {"version": "1.0"},
+                "links": {"self": "https://example.com/catalog/v2/products"},
+            },
+        )
+
+        tokens = []
+        results = list(self.search.checkpoint(tokens.append, every=2))
+        assert [type(r) for r in results] == [Product] * 4
+        assert tokens == [".2", ".4"]
+        assert self.get_request_body(0)["per_item_continuations"] is True
+
+        with self.assertRaises(ValueError):
+            self.search.checkpoint(tokens.append, every=0)
+
     def test_filter_nested(self):
         s = self.search.filter(
             (
@@ -408,6 +454,19 @@ class TestSearch(ClientTestCase):
         filters = s._serialize_filters()
         assert filters[0]["val"] == geometry
 
+    def test_intersects_optimize(self):
+        geometry = shapely.geometry.Point(-95.0, 42.0).buffer(0.5, quad_segs=256)
+
+        s = ImageSearch(Image, client=self.client).intersects(geometry)
+        original = s._request_params["intersects"]
+        assert json.loads(original)["type"] == "Polygon"
+
+        s = s.intersects(geometry, optimize=True)
+        optimized = s._request_params["intersects"]
+        assert len(optimized) < len(original) / 4
+        assert shapely.geometry.shape(json.loads(optimized)).covers(geometry)
+        assert s._intersects is not None and s._intersects.equals(geometry)
+
     def test_filter_object(self):
         my_product = Product(id="my_product")
 
@@ -601,3 +660,59 @@ class TestSearch(ClientTestCase):
         assert len(results) == 1
         assert isinstance(results.geocontext, AOI)
         assert results.geocontext.__geo_interface__ == aoi
+
+    @responses.activate
+    def test_split_any_of(self):
+        def callback(request):
+            body = json.loads(request.body)
+            filters = json.loads(body["filter"])
+            ids = [f["val"] for f in filters[0].get("or", filters)]
+            data = [
+                {
+                    "attributes": {"name": id_},
+                    "type": "product",
+                    "id": "someorg:{}".format(id_),
+                }
+                for id_ in ids
+                if id_ != "missing"
+            ]
+            response = {
+                "meta": {
+                    "count": len(data),
+                    "per_item_continuations": ["." + d["id"] for d in data],
+                },
+                "data": data,
+                "jsonapi": {"version": "1.0"},
+                "links": {},
+            }
+            return (200, {}, json.dumps(response))
+
+        responses.add_callback(responses.PUT, self.match_url, callback=callback)
+
+        ids = ["e", "b", "missing", "d", "a", "b", "c"]
+        with patch.object(Search, "_MAX_FILTER_VALUES", 2):
+            search = self.search.filter(p.id.any_of(ids) & (p.tags == "foo"))
+            results = list(search)
+            assert len(responses.calls) == 3
+            assert [r.name for r in results] == ["e", "b", "d", "a", "c"]
+            for call in responses.calls:
+                filters = json.loads(json.loads(call.request.body)["filter"])
+                assert len(filters) == 2
+                assert filters[1] == {"name": "tags", "op": "eq", "val": "foo"}
+
+            results = list(search.sort("name", ascending=False).limit(3))
+            assert [r.name for r in results] == ["e", "d", "c"]
+            assert all(
+                json.loads(call.request.body)["limit"] == 3
+                for call in responses.calls[3:]
+            )
+
+            # the counts of the split searches are added
+            responses.calls.reset()
+            assert search.count() == 5
+            assert len(responses.calls) == 3
+
+            # searches which report continuations are not split
+            responses.calls.reset()
+            list(search.checkpoint(lambda token: None))
+            assert len(responses.calls) == 1
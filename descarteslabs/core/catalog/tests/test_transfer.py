@@ -0,0 +1,76 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import pytest
+
+from descarteslabs.exceptions import BadRequestError, RateLimitError, ServerError
+
+from .. import transfer
+
+
+@patch("time.sleep")
+class TestCallWithRetries(unittest.TestCase):
+    def test_retries(self, sleep_mock):
+        fn = Mock(side_effect=[ServerError("failed"), "done"])
+        assert transfer.call_with_retries(fn, 3) == "done"
+        assert fn.call_count == 2
+
+    def test_last_exception(self, sleep_mock):
+        error = ServerError("failed")
+        fn = Mock(side_effect=error)
+        with pytest.raises(ServerError) as e:
+            transfer.call_with_retries(fn, 2)
+        assert e.value is error
+        assert fn.call_count == 3
+
+    def test_not_retried(self, sleep_mock):
+        fn = Mock(side_effect=BadRequestError("bad"))
+        with pytest.raises(BadRequestError):
+            transfer.call_with_retries(fn, 3)
+        assert fn.call_count == 1
+
+    def test_shared_throttle(self, sleep_mock):
+        error = RateLimitError("slow down", retry_after="5")
+        with patch.object(transfer, "throttle", transfer.Throttle()) as throttle:
+            transfer.call_with_retries(Mock(side_effect=[error, "done"]), 1)
+            # the rate limiting delays the following calls
+            sleep_mock.reset_mock()
+            transfer.call_with_retries(Mock(return_value="done"), 1)
+        assert throttle._resume_at > 0
+        sleep_mock.assert_called_once()
+        assert 4 < sleep_mock.call_args[0][0] <= 5
+
+
+class TestMd5File(unittest.TestCase):
+    def test_md5_file(self):
+        data = os.urandom(3 * 1048576 + 17)
+        expected = hashlib.md5(data).hexdigest()
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            assert transfer.md5_file(path) == expected
+
+        f = io.BytesIO(b"header" + data + b"trailer")
+        f.seek(len(b"header"))
+        assert transfer.md5_file(f, size=len(data)) == expected
+        assert f.read() == b"trailer"
@@ -0,0 +1,167 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Retries and rate limiting shared by the concurrent catalog transfers."""
+
+import hashlib
+import os
+import threading
+import time
+
+import requests.exceptions
+
+from descarteslabs.exceptions import ForbiddenError, RateLimitError, ServerError
+
+from ..common.retry import Retry, RetryError
+
+# The size of the chunks in which files are read to be hashed
+_HASH_CHUNK_SIZE = 1048576
+
+# Exceptions for which a request is retried
+TRANSIENT_EXCEPTIONS = (
+    ServerError,
+    RateLimitError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.RetryError,
+)
+
+# Exceptions for which the download of a part of a blob is retried, including
+# a connection that was dropped while reading the part, and an expired download
+# url which is renewed before the retry
+DOWNLOAD_EXCEPTIONS = TRANSIENT_EXCEPTIONS + (
+    requests.exceptions.ChunkedEncodingError,
+    ForbiddenError,
+)
+
+
+class Throttle(object):
+    """Shared feedback between concurrent requests that were rate limited.
+
+    When any request is rate limited, all requests that go through the throttle
+    wait until the requested delay has passed before being sent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self):
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self, delay):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def call(self, func, *args, **kwargs):
+        """Call func once the throttle allows, recording any rate limiting."""
+        self.wait()
+        try:
+            return func(*args, **kwargs)
+        except RateLimitError as e:
+            self.backoff(retry_after(e))
+            raise
+
+
+def retry_after(exception, default=1.0):
+    """Return the delay in seconds requested by a rate limited response."""
+    try:
+        return float(exception.retry_after)
+    except (TypeError, ValueError):
+        return default
+
+
+def is_retryable(exception):
+    """The retry predicate for the transient exceptions."""
+    # the throttle already waits for the retry-after delay
+    if isinstance(exception, RateLimitError):
+        return True, 0
+    return True
+
+
+#: The throttle shared by all bulk operations and transfers.
+throttle = Throttle()
+
+
+def call_with_retries(fn, retries, exceptions=TRANSIENT_EXCEPTIONS):
+    """Call ``fn`` through the shared throttle, retrying transient failures.
+
+    Parameters
+    ----------
+    fn : callable
+        The function to call, without arguments.  It is called again from the
+        start on each retry.
+    retries : int
+        The number of times ``fn`` is retried after a transient failure.
+    exceptions : tuple(Exception), optional
+        The exceptions for which ``fn`` is retried.  Defaults to
+        `TRANSIENT_EXCEPTIONS`.
+
+    Returns
+    -------
+    object
+        The return value of ``fn``.
+
+    Raises
+    ------
+    Exception
+        The last exception raised by ``fn`` once the retries are exhausted, or
+        any exception which is not retried.
+    """
+    retrying = Retry(
+        retries=retries,
+        exceptions=exceptions,
+        predicate=is_retryable,
+        initial=1,
+        maximum=30,
+    )
+    try:
+        return retrying(throttle.call)(fn)
+    except RetryError as e:
+        raise e.exceptions[-1] from e
+
+
+def md5_file(file, size=None):
+    """Return the hex MD5 digest of the contents of a file.
+
+    Parameters
+    ----------
+    file : str or file-like
+        The path of the file, or a binary file object which is read from its
+        current position.
+    size : int, optional
+        The number of bytes to hash.  The rest of the file if not set.
+
+    Returns
+    -------
+    str
+        The hex digest.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return md5_file(f, size=size)
+
+    md5 = hashlib.md5()
+    while size is None or size > 0:
+        chunk_size = _HASH_CHUNK_SIZE if size is None else min(size, _HASH_CHUNK_SIZE)
+        data = file.read(chunk_size)
+        if not data:
+            break
+        md5.update(data)
+        if size is not None:
+            size -= len(data)
+    return md5.hexdigest()
@@ -32,13 +32,11 @@ def clear_client_state():
     """Clear all cached client state."""
     from descarteslabs.auth import Auth
     from ..common.http.service import DefaultClientMixin
-    from ..catalog.helpers import (
-        BANDS_BY_PRODUCT_CACHE as catalog_bands_by_product_cache,
-    )
+    from ..catalog.metadata_cache import metadata_cache
 
     Auth.set_default_auth(None)
     DefaultClientMixin.clear_all_default_clients()
-    catalog_bands_by_product_cache.clear()
+    metadata_cache.clear()
 
 
 __all__ = ["clear_client_state"]
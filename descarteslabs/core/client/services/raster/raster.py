@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import json
 import os
 import random
@@ -47,6 +48,46 @@ def as_json_string(str_or_dict):
         return str_or_dict
 
 
+class NdarrayRequest(object):
+    """The serialized parameters of a :py:meth:`Raster.ndarray` request.
+
+    The parameters, including any cutline, are serialized once, so that many
+    requests which only differ in their image ids can be sent without
+    serializing the parameters again.  Create one with
+    :py:meth:`Raster.ndarray_request`.
+    """
+
+    __slots__ = ("_params", "_suffix")
+
+    def __init__(self, params):
+        params = {k: v for k, v in params.items() if k != "ids"}
+        self._params = params
+        # everything following the ids in the request body
+        self._suffix = "," + json.dumps(params, allow_nan=False)[1:] if params else "}"
+
+    @property
+    def params(self):
+        """dict: A copy of the request parameters, without the image ids."""
+        return dict(self._params)
+
+    def body(self, inputs):
+        """The request body for the given image ids.
+
+        Parameters
+        ----------
+        inputs : str or list(str)
+            The image ids.
+
+        Returns
+        -------
+        bytes
+            The JSON encoded request body.
+        """
+        if type(inputs) is str:
+            inputs = [inputs]
+        return ('{"ids": ' + json.dumps(list(inputs)) + self._suffix).encode("utf-8")
+
+
 def read_blosc_buffer(data):
     header = data.read(16)
     if len(header) != 16:
@@ -274,6 +315,7 @@ class Raster(Service, DefaultClientMixin):
         headers=None,
         progress=None,
         nodata=None,
+        outfile=None,
         _retry=_retry,
         **pass_through_params,
     ):
@@ -328,8 +370,13 @@ class Raster(Service, DefaultClientMixin):
         :param bool progress: Display a progress bar.
         :param None or number: A nodata value to use in the file where pixels are masked.
             Only used for non-JPEG geotiff files.
+        :param outfile: A writable, seekable binary file object to which the image is
+            written, starting at its current position, instead of a file named by
+            ``outfile_basename``.  If the request is retried, the file is truncated
+            back to that position first.
 
         :return: A tuple of (`filename`, ``metadata`` dictionary).
+            If ``outfile`` is given, it is returned in place of the filename.
             The dictionary contains details about the raster operation that happened.
             These details can be useful for debugging but shouldn't otherwise be relied on
             (there are no guarantees that certain keys will be present).
@@ -367,7 +414,12 @@ class Raster(Service, DefaultClientMixin):
             raise ValueError("output_format must be one of GTiff, JPEG, PNG")
         ext = file_ext[output_format]
 
-        outfile = outfile_basename + ext
+        # where the image starts in a given file object, None when writing a file
+        start = None
+        if outfile is None:
+            outfile = outfile_basename + ext
+        else:
+            start = outfile.tell()
 
         def retry_req(headers):
             r = self.session.post(
@@ -391,21 +443,29 @@ class Raster(Service, DefaultClientMixin):
                         outfile, chunk_iter, metadata, blosc_meta, "JPEG", None
                     )
                 elif output_format == "PNG":
-                    tif_out = outfile_basename + ".tif"
+                    if start is None:
+                        tif_out = outfile_basename + ".tif"
+                    else:
+                        tif_out = io.BytesIO()
                     try:
                         make_geotiff(
                             tif_out, chunk_iter, metadata, blosc_meta, "PNG", None
                         )
                         try:
+                            if start is not None:
+                                tif_out.seek(0)
                             im = Image.open(tif_out)
-                            im.save(outfile)
+                            im.save(outfile, format="PNG")
                         except Exception:
                             raise RuntimeError("Cannot save PNG image")
                     finally:
-                        if os.path.isfile(tif_out):
+                        if start is None and os.path.isfile(tif_out):
                             os.remove(tif_out)
             except Exception:
-                if os.path.isfile(outfile):
+                if start is not None:
+                    outfile.seek(start)
+                    outfile.truncate()
+                elif os.path.isfile(outfile):
                     os.remove(outfile)
                 raise
 
@@ -434,6 +494,7 @@ class Raster(Service, DefaultClientMixin):
         headers=None,
         progress=None,
         masked=True,
+        request=None,
         _retry=_retry,
         **pass_through_params,
     ):
@@ -485,6 +546,11 @@ class Raster(Service, DefaultClientMixin):
             reflectance algorithm to the output.
         :param bool masked: Whether to return a masked array or a regular Numpy array.
         :param bool progress: Display a progress bar.
+        :param NdarrayRequest request: The parameters of the request as returned by
+            :meth:`ndarray_request`. If given, the request is sent with these
+            pre-serialized parameters and `inputs`, and the other request parameters
+            are ignored. This avoids serializing the same parameters, and
+            in particular a large cutline, for each of many requests.
 
         :return: A tuple of ``(np_array, metadata)``. The first element (``np_array``) is
             the rastered image as a NumPy array. The second element (``metadata``) is a
@@ -493,29 +559,29 @@ class Raster(Service, DefaultClientMixin):
             are no guarantees that certain keys will be present).
         """
 
-        params = self._construct_npz_params(
-            inputs=inputs,
-            bands=bands,
-            scales=scales,
-            data_type=data_type,
-            srs=srs,
-            resolution=resolution,
-            dimensions=dimensions,
-            cutline=cutline,
-            bounds=bounds,
-            bounds_srs=bounds_srs,
-            align_pixels=align_pixels,
-            resampler=resampler,
-            dltile=dltile,
-            processing_level=processing_level,
-            output_window=output_window,
-            pass_through_params=pass_through_params,
-        )
+        if request is None:
+            request = self.ndarray_request(
+                bands=bands,
+                scales=scales,
+                data_type=data_type,
+                srs=srs,
+                resolution=resolution,
+                dimensions=dimensions,
+                cutline=cutline,
+                bounds=bounds,
+                bounds_srs=bounds_srs,
+                align_pixels=align_pixels,
+                resampler=resampler,
+                dltile=dltile,
+                processing_level=processing_level,
+                output_window=output_window,
+                **pass_through_params,
+            )
+        body = request.body(inputs)
 
         def retry_req(headers):
-            r = self.session.post(
-                "/npz", headers=headers or {}, json=params, stream=True
-            )
+            # the session sends json by default
+            r = self.session.post("/npz", headers=headers or {}, data=body, stream=True)
             metadata = json.loads(r.raw.readline().decode("utf-8").strip())
             array_meta = json.loads(r.raw.readline().decode("utf-8").strip())
             array = read_tiled_blosc_array(array_meta, r.raw, progress=progress)
@@ -534,6 +600,52 @@ class Raster(Service, DefaultClientMixin):
         else:
             return array, metadata
 
+    def ndarray_request(
+        self,
+        bands,
+        scales=None,
+        data_type=None,
+        srs=None,
+        resolution=None,
+        dimensions=None,
+        cutline=None,
+        bounds=None,
+        bounds_srs=None,
+        align_pixels=False,
+        resampler=None,
+        dltile=None,
+        processing_level=None,
+        output_window=None,
+        **pass_through_params,
+    ):
+        """Serialize the parameters of :meth:`ndarray` requests for any images.
+
+        Takes the same parameters as :meth:`ndarray`, except for `inputs` and the
+        parameters which only affect how the response is returned.
+
+        :return: An :class:`NdarrayRequest` to pass as the `request` parameter of
+            :meth:`ndarray`.
+        """
+        params = self._construct_npz_params(
+            inputs=[],
+            bands=bands,
+            scales=scales,
+            data_type=data_type,
+            srs=srs,
+            resolution=resolution,
+            dimensions=dimensions,
+            cutline=cutline,
+            bounds=bounds,
+            bounds_srs=bounds_srs,
+            align_pixels=align_pixels,
+            resampler=resampler,
+            dltile=dltile,
+            processing_level=processing_level,
+            output_window=output_window,
+            pass_through_params=pass_through_params,
+        )
+        return NdarrayRequest(params)
+
     def _serial_ndarray(self, id_groups, *args, **kwargs):
         for i, id_group in enumerate(id_groups):
             arr, meta = self.ndarray(id_group, *args, **kwargs)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import base64
+import io
 import json
 import re
 import time
@@ -128,6 +129,69 @@ class RasterTest(unittest.TestCase):
         assert expected_metadata == meta
         np.testing.assert_array_equal(expected_array.transpose((1, 2, 0)), array)
 
+    @responses.activate
+    @patch.object(raster_module, "make_geotiff")
+    def test_raster_to_file(self, make_geotiff_mock):
+        content = self.create_blosc_response({"foo": "bar"}, np.zeros((1, 2, 2)))
+        self.mock_response(responses.POST, json=None, body=content, stream=True)
+
+        def make_geotiff(outfile, chunk_iter, metadata, blosc_meta, compress, nodata):
+            outfile.write(b"geotiff")
+
+        make_geotiff_mock.side_effect = make_geotiff
+
+        f = io.BytesIO()
+        f.write(b"header")
+        outfile, metadata = self.raster.raster(["fakeid"], bands=["red"], outfile=f)
+        assert outfile is f
+        assert f.getvalue() == b"headergeotiff"
+        assert metadata == {"foo": "bar", "id": "fakeid"}
+
+        def make_geotiff_fails(outfile, *args):
+            outfile.write(b"partial")
+            raise ValueError("failed")
+
+        make_geotiff_mock.side_effect = make_geotiff_fails
+
+        f = io.BytesIO()
+        f.write(b"header")
+        with pytest.raises(ValueError):
+            self.raster.raster(["fakeid"], bands=["red"], outfile=f)
+        # the partial image is removed
+        assert f.getvalue() == b"header"
+
+    @responses.activate
+    def test_ndarray_request(self):
+        expected_metadata = {"foo": "bar"}
+        expected_array = np.zeros((1, 2, 2))
+        content = self.create_blosc_response(expected_metadata, expected_array)
+        self.mock_response(responses.POST, json=None, body=content, stream=True)
+        self.mock_response(responses.POST, json=None, body=content, stream=True)
+
+        request = self.raster.ndarray_request(
+            bands=["red"], resolution=60, cutline=a_geometry, mask_alpha=True
+        )
+        with patch.object(raster_module, "as_json_string") as as_json:
+            array, meta = self.raster.ndarray(["fakeid"], ["red"], request=request)
+            self.raster.ndarray("fakeid2", bands=["ignored"], request=request)
+        as_json.assert_not_called()
+
+        assert expected_metadata == meta
+        np.testing.assert_array_equal(expected_array.transpose((1, 2, 0)), array)
+
+        body = json.loads(responses.calls[0].request.body)
+        assert body["ids"] == ["fakeid"]
+        assert body["bands"] == ["red"]
+        assert body["resolution"] == 60
+        assert json.loads(body["shape"]) == json.loads(json.dumps(a_geometry))
+        assert body["mask_alpha"] is True
+        assert "ids" not in request.params
+        # only the ids differ between requests
+        body2 = json.loads(responses.calls[1].request.body)
+        assert body2.pop("ids") == ["fakeid2"]
+        body.pop("ids")
+        assert body == body2
+
     @responses.activate
     @patch.object(raster_module, "DEFAULT_MAX_RETRIES", 1)
     def test_ndarray_multi_blosc_failure(self):
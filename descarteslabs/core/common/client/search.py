@@ -19,6 +19,11 @@ from typing import TYPE_CHECKING, Generic, Iterator, List, TypeVar, Union
 
 from ..collection import Collection
 from ..property_filtering.filtering import AndExpression, Expression, LogicalExpression
+from ..property_filtering.planner import (
+    count_concurrently,
+    iter_concurrently,
+    split_any_of,
+)
 from .attributes import Attribute
 from .sort import Sort
 
@@ -34,6 +39,11 @@ class Search(Generic[T]):
 
     The search can be narrowed by using the methods on the search object.
 
+    A filter with a large :meth:`~descarteslabs.common.client.attributes.Attribute.in_`
+    term, such as ``Job.id.in_(ids)`` for many ids, is transparently split into
+    several searches with at most ``_MAX_FILTER_VALUES`` values each, which are
+    executed concurrently and whose results are merged.
+
     Example
     -------
     >>> search = Search(Model).filter(Model.name == "test")
@@ -41,6 +51,12 @@ class Search(Generic[T]):
     >>> search.collect() # doctest: +SKIP
     """
 
+    # The maximum number of values of an in_() filter in a single request,
+    # bounded by the length of the query string
+    _MAX_FILTER_VALUES = 128
+    # The maximum number of requests for a split filter executed concurrently
+    _MAX_CONCURRENT_QUERIES = 8
+
     def __init__(self, document: T, client: "ApiService", url: str = None, **params):
         self._document = document
         self._client = client
@@ -89,6 +105,16 @@ class Search(Generic[T]):
         >>> search = Function.search().filter(Function.status == "success")
         >>> list(search) # doctest: +SKIP
         """
+        searches = self._split()
+        if len(searches) > 1:
+            yield from iter_concurrently(
+                searches,
+                self._MAX_CONCURRENT_QUERIES,
+                sorts=[(sort.name, sort.ascending) for sort in self._sort],
+                limit=self._limit,
+            )
+            return
+
         accepts_client = (
             "client" in inspect.signature(self._document.__init__).parameters
         )
@@ -122,6 +148,10 @@ class Search(Generic[T]):
     def count(self: AnySearch) -> int:
         """Fetch the number of documents that match the search.
 
+        A large ``in_()`` filter is split into several searches as when iterating,
+        whose counts are added, so that a document matching several of the
+        values of a multi-valued attribute is counted more than once.
+
         Returns
         -------
         int
@@ -141,6 +171,10 @@ class Search(Generic[T]):
         >>> search = Function.search().filter(Function.status == "building")
         >>> count = search.count() # doctest: +SKIP
         """
+        searches = self._split()
+        if len(searches) > 1:
+            return count_concurrently(searches, self._MAX_CONCURRENT_QUERIES)
+
         instance = self.limit(0)
         response = self._client.session.get(self._url, params=instance._serialize())
         return response.json()["meta"]["total"]
@@ -267,6 +301,22 @@ class Search(Generic[T]):
 
         return instance
 
+    def _split(self: AnySearch) -> List[AnySearch]:
+        # The searches to execute for a large in_() filter, see split_any_of()
+        if self._filters is None:
+            return [self]
+
+        filters = split_any_of(self._filters, self._MAX_FILTER_VALUES)
+        if len(filters) == 1:
+            return [self]
+
+        searches = []
+        for filter in filters:
+            instance = copy.deepcopy(self)
+            instance._filters = filter
+            searches.append(instance)
+        return searches
+
     def _serialize(self, json_encode: bool = True) -> dict:
         params = self._params.copy()
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import unittest
 from unittest import mock
 
@@ -63,3 +64,30 @@ class TestSearch(unittest.TestCase):
         with self.assertRaises(ValueError) as ctx:
             search.sort(DocumentTest.name)
         assert "Cannot sort on property: name" in str(ctx.exception)
+
+    def test_split_in(self):
+        def iter_pages(url, params):
+            filters = json.loads(params["filter"])
+            names = [f["val"] for f in filters[0].get("or", filters)]
+            return [{"name": name, "order": ord(name)} for name in names]
+
+        mock_client = mock.Mock()
+        mock_client.iter_pages.side_effect = iter_pages
+        search = Search(DocumentTest, mock_client, "/test_url").filter(
+            DocumentTest.name.in_(["c", "a", "e", "b", "d"])
+        )
+
+        with mock.patch.object(Search, "_MAX_FILTER_VALUES", 2):
+            assert [d.name for d in search] == ["c", "a", "e", "b", "d"]
+            assert mock_client.iter_pages.call_count == 3
+
+            results = search.sort(-DocumentTest.order).limit(4)
+            assert [d.name for d in results] == ["e", "d", "c", "b"]
+            assert all(
+                call.kwargs["params"]["limit"] == 4
+                for call in mock_client.iter_pages.call_args_list[3:]
+            )
+
+        mock_client.iter_pages.reset_mock()
+        assert len(list(search)) == 5
+        assert mock_client.iter_pages.call_count == 1
@@ -17,11 +17,17 @@ A list-based sequence with helper methods, which serves as the base class for `S
 """
 
 import collections
+import concurrent.futures
+import functools
 import itertools
+import numbers
+from datetime import datetime
 from typing import Generic, TypeVar
 
+import numpy as np
+
 from ...client.deprecation import deprecate
-from ...common.property_filtering.filtering import Expression
+from ...common.property_filtering.filtering import Expression, to_datetime64
 
 T = TypeVar("T")
 
@@ -31,8 +37,19 @@ class Collection(Generic[T]):
     """
     List-based sequence with convenience methods for mapping and filtering,
     and NumPy-style fancy indexing
+
+    See :meth:`columnar` for holding attributes of the items in NumPy arrays, so
+    that :meth:`filter`, :meth:`sorted` and :meth:`groupby` on those attributes
+    are vectorized.
     """
 
+    # The names of the attributes held as columns, see columnar()
+    _column_names = None
+    # The columns, built lazily from the items when _column_names is set
+    _columns = None
+    # The default columns for columnar(), set by subclasses
+    _default_columns = ()
+
     def __init__(self, iterable=None, item_type=None):
         if iterable is None:
             self._list = []
@@ -57,11 +74,10 @@ class Collection(Generic[T]):
         """
 
         if isinstance(idx, list) or type(idx).__name__ == "ndarray":
-            subset = [self._list[i] for i in idx]
-            return self._cast_and_copy_attrs_to(subset)
+            return self._take(idx)
         else:
             if isinstance(idx, slice):
-                return self._cast_and_copy_attrs_to(self._list[idx])
+                return self._take(idx)
             else:
                 return self._list[idx]
 
@@ -91,10 +107,12 @@ class Collection(Generic[T]):
                         f"item is not of required type {item_type.__name__}"
                     )
                 self._list[i] = x
+            self._columns = None
         else:
             if item_type is not None and not isinstance(x, item_type):
                 raise ValueError(f"item is not of required type {item_type.__name__}")
             self._list[idx] = item
+            self._columns = None
 
     def __iter__(self):
         return iter(self._list)
@@ -118,10 +136,116 @@ class Collection(Generic[T]):
         # used to copy over any attrs a subclass may have set
         other = self.__class__(other)
         for k, v in self.__dict__.items():
-            if k != "_list":
+            if k not in ("_list", "_columns"):
                 setattr(other, k, v)
         return other
 
+    def _take(self, idx):
+        # A copy with the items (and columns) selected by a slice or indices
+        if isinstance(idx, slice):
+            subset = self._list[idx]
+        else:
+            # indexing a list with python ints is much faster than numpy ints
+            items = self._list
+            subset = [items[i] for i in np.asarray(idx, dtype=np.intp).tolist()]
+        other = self._cast_and_copy_attrs_to(subset)
+        if self._columns is not None:
+            if not isinstance(idx, slice):
+                idx = np.asarray(idx, dtype=np.intp)
+            other._columns = {name: c[idx] for name, c in self._columns.items()}
+        return other
+
+    def columnar(self, *names):
+        """Returns a copy of this collection with item attributes held in columns.
+
+        The values of the named attributes of all items are held in NumPy
+        arrays, so that :meth:`filter` with an
+        :py:class:`~descarteslabs.common.property_filtering.filtering.Expression`,
+        and :meth:`sorted`, :meth:`sort` and :meth:`groupby` with attribute names,
+        are evaluated as array operations rather than item by item.  This makes
+        a big difference for large collections.  Operations involving other
+        attributes, or callables, work as for any other collection.
+
+        Numeric attributes are held as float arrays with ``NaN`` for missing
+        values, datetimes as UTC ``datetime64`` arrays with ``NaT`` for missing
+        values, and any other attributes as object arrays.  Missing values are
+        sorted last, or first in a reversed sort.  Names may be
+        dot-chained as for :meth:`sorted`, where any mappings (such as
+        ``extra_properties``) along the chain are indexed by key.
+
+        The columns are a snapshot of the items: they are kept in step when items
+        are added to or replaced in the collection, and carried over to the
+        collections returned by indexing, :meth:`filter`, :meth:`sorted` and
+        :meth:`groupby`, but changing an attribute of an item does not update
+        them.  Call :meth:`columnar` again after changing items.
+
+        Parameters
+        ----------
+        names : str
+            The names of the attributes to hold as columns.  Defaults to the
+            attributes most commonly filtered on for the type of collection.
+
+        Returns
+        -------
+        Collection
+            A collection of the same type and with the same items.
+
+        Example
+        -------
+        >>> from descarteslabs.catalog import properties as p
+        >>> images = product.images().collect().columnar() # doctest: +SKIP
+        >>> clear = images.filter(p.cloud_fraction < 0.2).sort("acquired") # doctest: +SKIP
+        """
+        names = names or self._default_columns
+        if not names:
+            raise TypeError("No column names given to columnar")
+
+        other = self._cast_and_copy_attrs_to(self._list)
+        other._column_names = tuple(names)
+        return other
+
+    @property
+    def columns(self):
+        """dict(str, numpy.ndarray) or None: The columns of a columnar collection.
+
+        See :meth:`columnar`.  The arrays must not be modified.
+        """
+        if self._column_names is None:
+            return None
+        if self._columns is None:
+            self._columns = {
+                name: _to_column(list(map(self._str_to_getter(name), self._list)))
+                for name in self._column_names
+            }
+        return dict(self._columns)
+
+    def _column_keys(self, predicates):
+        # The columns for the given sort/group predicates, or None if any
+        # predicate is not a column
+        columns = self.columns
+        if columns is None or not all(
+            isinstance(p, str) and p in columns for p in predicates
+        ):
+            return None
+        return [columns[p] for p in predicates]
+
+    def _argsort(self, keys, reverse=False):
+        # A stable sort of the items by the given columns. A reversed sort keeps
+        # items with the same keys in their original order, like sorted() does.
+        if reverse:
+            keys = [key[::-1] for key in keys]
+        try:
+            if len(keys) == 1:
+                order = np.argsort(keys[0], kind="stable")
+            else:
+                order = np.lexsort(keys[::-1])
+        except TypeError:
+            # e.g. missing values in an object column
+            return None
+        if reverse:
+            order = len(order) - 1 - order[::-1]
+        return order
+
     @property
     def each(self):
         """
@@ -171,23 +295,60 @@ class Collection(Generic[T]):
         """
         return Eacher(iter(self._list))
 
-    def map(self, f):
+    def map(self, f, workers=None, executor="thread", ordered=True, chunksize=None):
         """Returns a :class:`~descarteslabs.common.collection.Collection` of ``f`` applied to each item.
 
+        By default ``f`` is applied to one item after the other. With `workers`,
+        ``f`` is applied to several items concurrently, in a pool of threads (for
+        I/O such as loading image data) or processes (for CPU bound work).
+
         Parameters
         ----------
         f : callable
             Apply function ``f`` to each element of the collection and return the result
-            as a collection.
+            as a collection.  For a process pool, ``f`` must be picklable, so it cannot
+            be a lambda or a nested function.
+        workers : int, optional
+            The number of threads or processes to apply ``f`` in.  If not set, ``f``
+            is applied in the calling thread.
+        executor : str or concurrent.futures.Executor, optional
+            ``"thread"`` (the default) or ``"process"`` for a pool of `workers`
+            threads or processes created for this call, or an existing executor.
+        ordered : bool, optional
+            Whether the results are in the order of the items (the default), or in
+            the order in which they complete.
+        chunksize : int, optional
+            The number of items sent to a worker at once.  Items are pickled a
+            chunk at a time when sent to a process, so that any state shared by
+            the items of a chunk, such as the client of catalog objects, is only
+            pickled once per chunk.  Defaults to 1 for threads, and for processes
+            to a size which gives each process about four chunks.
 
         Returns
         -------
         Collection
             A collection with the results of the function ``f`` applied to each element
             of the original collection.
-        """
 
-        res = (f(x) for x in self._list)
+        Raises
+        ------
+        ValueError
+            If `executor` or `chunksize` is invalid.
+        Exception
+            Any exception raised by ``f``.
+
+        Example
+        -------
+        >>> images = product.images().intersects(aoi).collect() # doctest: +SKIP
+        >>> arrays = images.map(lambda i: i.ndarray("red"), workers=8) # doctest: +SKIP
+        """  # noqa: E501
+
+        if workers is None:
+            res = [f(x) for x in self._list]
+        else:
+            res = list(
+                _parallel_map(f, self._list, workers, executor, ordered, chunksize)
+            )
         item_type = getattr(self, "_item_type", None)
         if item_type is None or all(map(lambda i: isinstance(i, item_type), res)):
             return self._cast_and_copy_attrs_to(res)
@@ -223,6 +384,16 @@ class Collection(Generic[T]):
         """
 
         if isinstance(predicate, Expression):
+            columns = self.columns
+            if columns is not None:
+                try:
+                    mask = predicate.compile()(columns)
+                except (KeyError, TypeError, ValueError):
+                    # not all properties are columns, or not comparable
+                    pass
+                else:
+                    return self._take(np.flatnonzero(mask))
+
             res = (x for x in self._list if predicate.evaluate(x))
         else:
             res = (x for x in self._list if predicate(x))
@@ -268,6 +439,13 @@ class Collection(Generic[T]):
 
         if len(predicates) == 0:
             raise TypeError("No predicate(s) given to sorted")
+
+        keys = self._column_keys(predicates)
+        if keys is not None:
+            order = self._argsort(keys, reverse=reverse.get("reverse", False))
+            if order is not None:
+                return self._take(order)
+
         predicates = [
             self._str_to_predicate(p) if isinstance(p, str) else p for p in predicates
         ]
@@ -355,6 +533,13 @@ class Collection(Generic[T]):
 
         if len(predicates) == 0:
             raise TypeError("No predicate(s) given to groupby")
+
+        keys = self._column_keys(predicates)
+        order = None if keys is None else self._argsort(keys)
+        if order is not None:
+            yield from self._groupby_columns(predicates, keys, order)
+            return
+
         predicates = [
             self._str_to_predicate(p) if isinstance(p, str) else p for p in predicates
         ]
@@ -369,6 +554,28 @@ class Collection(Generic[T]):
         for group, items in itertools.groupby(ordered, predicate):
             yield group, self._cast_and_copy_attrs_to(items)
 
+    def _groupby_columns(self, predicates, keys, order):
+        if len(order) == 0:
+            return
+
+        # the group boundaries are where any of the sorted keys changes
+        changed = np.zeros(len(order) - 1, dtype=bool)
+        for key in keys:
+            key = key[order]
+            changed |= key[1:] != key[:-1]
+        starts = np.concatenate(([0], np.flatnonzero(changed) + 1, [len(order)]))
+
+        getters = [self._str_to_getter(p) for p in predicates]
+        for start, stop in zip(starts[:-1], starts[1:]):
+            # the group is the attribute value of the first item, as it would be
+            # without columns
+            first = self._list[order[start]]
+            if len(getters) == 1:
+                group = getters[0](first)
+            else:
+                group = tuple(g(first) for g in getters)
+            yield group, self._take(order[start:stop])
+
     def append(self, x):
         """Append x to the end of this :class:`~descarteslabs.common.collection.Collection`.
 
@@ -385,6 +592,7 @@ class Collection(Generic[T]):
             raise ValueError(f"item is not of required type {item_type.__name__}")
 
         self._list.append(x)
+        self._columns = None
 
     def extend(self, x):
         """Extend this :class:`~descarteslabs.common.collection.Collection` by appending elements from the iterable.
@@ -404,6 +612,7 @@ class Collection(Generic[T]):
             raise ValueError(f"item is not of required type {item_type.__name__}")
 
         self._list.extend(x)
+        self._columns = None
 
     @staticmethod
     def _str_to_predicate(string):
@@ -417,6 +626,112 @@ class Collection(Generic[T]):
 
         return predicate
 
+    @staticmethod
+    def _str_to_getter(string):
+        # Like _str_to_predicate, but indexing mappings by key and returning
+        # None for missing attributes
+        attrs = string.split(".")
+
+        def getter(x):
+            result = x
+            for attr in attrs:
+                if result is None:
+                    return None
+                if isinstance(result, collections.abc.Mapping):
+                    result = result.get(attr)
+                else:
+                    result = getattr(result, attr, None)
+            return result
+
+        return getter
+
+
+_EXECUTORS = {
+    "thread": concurrent.futures.ThreadPoolExecutor,
+    "process": concurrent.futures.ProcessPoolExecutor,
+}
+
+
+def _call(f, args, kwargs, x):
+    # Module level, so that it can be pickled for a process pool
+    return f(x, *args, **kwargs)
+
+
+def _apply_chunk(f, chunk):
+    return [f(x) for x in chunk]
+
+
+def _parallel_map(f, items, workers, executor="thread", ordered=True, chunksize=None):
+    """Apply f to the items in a pool of threads or processes.
+
+    Returns a generator of the results; the arguments are validated right away.
+    """
+    if isinstance(executor, str):
+        if executor not in _EXECUTORS:
+            raise ValueError(
+                "executor must be one of {}, or an Executor".format(
+                    ", ".join(repr(name) for name in _EXECUTORS)
+                )
+            )
+    elif not isinstance(executor, concurrent.futures.Executor):
+        raise ValueError(
+            "Expected an Executor, not {}".format(executor.__class__.__name__)
+        )
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be at least one")
+
+    return _iter_parallel(f, items, workers, executor, ordered, chunksize)
+
+
+def _iter_parallel(f, items, workers, executor, ordered, chunksize):
+    items = list(items)
+
+    if chunksize is None:
+        if executor == "thread":
+            chunksize = 1
+        else:
+            chunksize = max(1, -(-len(items) // (workers * 4)))
+
+    if isinstance(executor, str):
+        pool = _EXECUTORS[executor](max_workers=workers)
+    else:
+        pool = executor
+
+    try:
+        futures = [
+            pool.submit(_apply_chunk, f, items[start : start + chunksize])
+            for start in range(0, len(items), chunksize)
+        ]
+        if not ordered:
+            futures = concurrent.futures.as_completed(futures)
+        for future in futures:
+            yield from future.result()
+    finally:
+        if pool is not executor:
+            # don't wait for chunks that will never be consumed
+            pool.shutdown(cancel_futures=True)
+
+
+def _to_column(values):
+    # Convert a list of attribute values to the most suitable numpy array
+    present = [v for v in values if v is not None]
+
+    if present and all(isinstance(v, datetime) for v in present):
+        return np.array([to_datetime64(v) for v in values], dtype="datetime64[us]")
+
+    if present and all(
+        isinstance(v, numbers.Real) and not isinstance(v, bool) for v in present
+    ):
+        if len(present) == len(values):
+            return np.array(values)
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+    # assign item by item, so that sequence values are not broadcast
+    column = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        column[i] = v
+    return column
+
 
 class Eacher(object):
     "Applies operations chained onto it to each item in an iterator"
@@ -449,10 +764,28 @@ class Eacher(object):
 
         return collection(iter(self))
 
-    def pipe(self, callable, *args, **kwargs):
-        "self.pipe(f, *args, **kwargs) <--> f(x, *args, **kwargs) for x in self"
+    def pipe(
+        self,
+        callable,
+        *args,
+        workers=None,
+        executor="thread",
+        ordered=True,
+        chunksize=None,
+        **kwargs,
+    ):
+        """self.pipe(f, *args, **kwargs) <--> f(x, *args, **kwargs) for x in self
+
+        With `workers`, ``f`` is applied concurrently in a pool of threads or
+        processes; see :meth:`Collection.map` for the `workers`, `executor`,
+        `ordered` and `chunksize` arguments, which are not passed on to ``f``.
+        """
+
+        if workers is None:
+            return Eacher(callable(x, *args, **kwargs) for x in self)
 
-        return Eacher(callable(x, *args, **kwargs) for x in self)
+        f = functools.partial(_call, callable, args, kwargs)
+        return Eacher(_parallel_map(f, self, workers, executor, ordered, chunksize))
 
     def __repr__(self):
         max_length = 8
@@ -13,9 +13,18 @@
 # limitations under the License.
 
 import collections
+import concurrent.futures
+import contextlib
 import pytest
+import threading
+import time
 import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
 
+import numpy as np
+
+from ...property_filtering import Expression, Properties
 from .. import Collection
 
 
@@ -162,3 +171,157 @@ class TestCollection(unittest.TestCase):
             (1, 7),
             (1, 9),
         )
+
+    def test_columnar(self):
+        Item = collections.namedtuple("Item", "id acquired cloud_fraction extra")
+        items = [
+            Item(
+                "c",
+                datetime(2020, 1, 3, tzinfo=timezone.utc),
+                0.5,
+                {"group": "a"},
+            ),
+            Item("a", datetime(2020, 1, 1, tzinfo=timezone.utc), None, {}),
+            Item("b", datetime(2020, 1, 2), 0.1, {"group": "b"}),
+            Item("d", None, 0.1, {"group": "a"}),
+        ]
+        c = SubCollection(items, foo="bar")
+
+        with pytest.raises(TypeError):
+            c.columnar()
+        assert c.columns is None
+
+        cc = c.columnar("id", "acquired", "cloud_fraction", "extra.group")
+        assert isinstance(cc, SubCollection)
+        assert cc.foo == "bar"
+        assert cc == c
+
+        columns = cc.columns
+        assert columns["acquired"].dtype == np.dtype("datetime64[us]")
+        assert np.isnat(columns["acquired"][3])
+        assert columns["cloud_fraction"].dtype == np.float64
+        assert np.isnan(columns["cloud_fraction"][1])
+        assert columns["id"].dtype == object
+        assert list(columns["extra.group"]) == ["a", None, "b", "a"]
+
+        p = Properties()
+        with contextlib.ExitStack() as stack:
+            # filters on columns never evaluate an item
+            for expression in set(Expression._registry.values()):
+                stack.enter_context(
+                    patch.object(expression, "evaluate", side_effect=AssertionError)
+                )
+
+            filtered = cc.filter(p.cloud_fraction < 0.2)
+            assert [i.id for i in filtered] == ["b", "d"]
+            assert filtered.foo == "bar"
+            assert list(filtered.columns["id"]) == ["b", "d"]
+
+            filtered = cc.filter((p.acquired >= "2020-01-02") | p.cloud_fraction.isnull)
+            assert [i.id for i in filtered] == ["c", "a", "b"]
+            assert [i.id for i in cc.filter(p.id.any_of(["a", "d"]))] == ["a", "d"]
+            assert [i.id for i in cc.filter(p.id != "a")] == ["c", "b", "d"]
+            assert [i.id for i in cc.filter(p.acquired == None)] == ["d"]  # noqa: E711
+
+        # properties which are not columns are evaluated item by item
+        assert [i.id for i in cc.filter(p.extra == {})] == ["a"]
+
+        with patch.object(Collection, "_str_to_predicate", side_effect=AssertionError):
+            assert [i.id for i in cc.sort("acquired")] == ["a", "b", "c", "d"]
+            # missing values are last, or first when reversed
+            assert [i.id for i in cc.sort("cloud_fraction", ascending=False)] == [
+                "a",
+                "c",
+                "b",
+                "d",
+            ]
+            assert [i.id for i in cc.sorted("cloud_fraction", "id")] == [
+                "b",
+                "d",
+                "c",
+                "a",
+            ]
+
+            groups = [(g, [i.id for i in items]) for g, items in cc.groupby("id")]
+            assert groups == [("a", ["a"]), ("b", ["b"]), ("c", ["c"]), ("d", ["d"])]
+            groups = list(cc[[0, 2, 3]].groupby("cloud_fraction"))
+            assert [g for g, _ in groups] == [0.1, 0.5]
+            assert [i.id for i in groups[0][1]] == ["b", "d"]
+            assert list(groups[0][1].columns["id"]) == ["b", "d"]
+
+        # missing values in an object column cannot be sorted by numpy
+        assert [i.id for i in cc[[0, 2, 3]].sort("extra.group")] == ["c", "d", "b"]
+
+        # columns follow changes to the collection
+        cc.append(Item("e", None, 0.0, {}))
+        assert list(cc.columns["id"]) == ["c", "a", "b", "d", "e"]
+        assert [i.id for i in cc.filter(p.cloud_fraction < 0.1)] == ["e"]
+        assert list(cc[1:3].columns["id"]) == ["a", "b"]
+        assert list(cc.map(lambda i: i._replace(id="x")).columns["id"]) == ["x"] * 5
+
+    def test_map(self):
+        c = SubCollection(range(10), foo="bar")
+        c._item_type = int
+
+        mapped = c.map(lambda x: x + 1)
+        assert isinstance(mapped, SubCollection)
+        assert mapped == list(range(1, 11))
+        assert mapped.foo == "bar"
+
+        mapped = c.map(str)
+        assert type(mapped) is Collection
+        assert mapped == [str(x) for x in range(10)]
+
+    def test_map_parallel(self):
+        c = SubCollection(range(20), foo="bar")
+        threads = set()
+
+        def f(x):
+            threads.add(threading.get_ident())
+            time.sleep(0.001 * (x % 3))
+            return x * 2
+
+        mapped = c.map(f, workers=4)
+        assert isinstance(mapped, SubCollection)
+        assert mapped.foo == "bar"
+        assert mapped == [x * 2 for x in range(20)]
+        assert threading.get_ident() not in threads
+
+        mapped = c.map(f, workers=4, ordered=False, chunksize=3)
+        assert sorted(mapped) == [x * 2 for x in range(20)]
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            assert c.map(f, workers=2, executor=executor) == [x * 2 for x in range(20)]
+
+        # a process pool pickles the function and items
+        assert c.map(abs, workers=2, executor="process") == list(range(20))
+
+        with pytest.raises(ValueError):
+            c.map(f, workers=2, executor="fiber")
+        with pytest.raises(ValueError):
+            c.map(f, workers=2, chunksize=0)
+
+        def fail(x):
+            if x == 5:
+                raise RuntimeError("boom")
+            return x
+
+        with pytest.raises(RuntimeError):
+            c.map(fail, workers=4)
+
+    def test_pipe_parallel(self):
+        c = Collection(["a", "bb", "ccc"])
+
+        def pad(s, width, fillchar=" "):
+            return s.rjust(width, fillchar)
+
+        assert c.each.pipe(pad, 3, fillchar="-", workers=2).combine() == [
+            "--a",
+            "-bb",
+            "ccc",
+        ]
+        assert c.each.upper().pipe(len, workers=2, executor="process").combine() == [
+            1,
+            2,
+            3,
+        ]
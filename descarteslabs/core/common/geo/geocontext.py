@@ -22,6 +22,7 @@ import mercantile
 import shapely.geometry
 
 from .. import shapely_support
+from ..shapely_support.optimize import optimize_cutline
 from ..dltile import Tile, Grid
 
 from .utils import (
@@ -457,6 +458,68 @@ class AOI(GeoContext):
         new._validate()
         return new
 
+    def optimize_cutline(self, tolerance=0.25, preserve_pixels=False):
+        """
+        Return a copy of the AOI with a geometry optimized for use as a cutline.
+
+        Large geometries, such as coastlines, are sent verbatim with every
+        raster request. The optimized geometry is simplified to a tolerance
+        that is a fraction of the output pixel size, and its coordinates are
+        quantized, which can make these requests much smaller.
+        The bounds, and therefore the shape of the output rasters, are not
+        changed.
+
+        To see by how much the geometry is reduced, use
+        :py:func:`~descarteslabs.core.common.shapely_support.optimize.optimize_cutline`.
+
+        Parameters
+        ----------
+        tolerance : float, default 0.25
+            The maximum distance, in pixels, by which the boundary of the
+            geometry may move. Only pixels along the boundary of the geometry
+            may be masked differently.
+        preserve_pixels : bool, default False
+            If True, only redundant vertices are removed from the geometry,
+            guaranteeing that no pixels change.
+
+        Returns
+        -------
+        new : `AOI`
+
+        Raises
+        ------
+        ValueError
+            If the AOI has no geometry, or neither a resolution nor a shape.
+
+        Note
+        ----
+            A resolution in a projected CRS is assumed to be in meters, and is
+            converted to degrees using the length of a degree of latitude,
+            which is conservative for longitudes.
+        """
+        if self._geometry is None:
+            raise ValueError("AOI must have a geometry to optimize")
+
+        if self._resolution is not None:
+            pixel_size = self._resolution
+            geographic = is_geographic_crs(self._crs)
+        elif self._shape is not None and self._bounds is not None:
+            pixel_size = min(
+                (self._bounds[2] - self._bounds[0]) / self._shape[1],
+                (self._bounds[3] - self._bounds[1]) / self._shape[0],
+            )
+            geographic = is_geographic_crs(self._bounds_crs)
+        else:
+            raise ValueError("AOI must have one of resolution or shape specified")
+
+        if not geographic:
+            pixel_size /= 111111
+
+        payload = optimize_cutline(
+            self._geometry, tolerance * pixel_size, preserve_pixels=preserve_pixels
+        )
+        return self.assign(geometry=payload.geometry)
+
     def _validate(self):
         # validate shape
         if self._shape is not None:
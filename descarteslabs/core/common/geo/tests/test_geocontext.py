@@ -17,6 +17,7 @@ import unittest
 import copy
 import warnings
 
+import shapely
 import shapely.geometry
 
 try:
@@ -166,6 +167,34 @@ class TestAOI(unittest.TestCase):
         ctx3 = ctx2.assign(geometry=None)
         assert ctx3.geometry is None
 
+    def test_optimize_cutline(self):
+        geom = shapely.geometry.Point(-95.123456789, 41.987654321).buffer(
+            0.5, quad_segs=256
+        )
+        ctx = geocontext.AOI(geometry=geom, resolution=100, crs="EPSG:32615")
+        optimized = ctx.optimize_cutline()
+        assert optimized.bounds == ctx.bounds
+        assert optimized.resolution == ctx.resolution
+        assert len(optimized.geometry.exterior.coords) < len(geom.exterior.coords)
+        # within a quarter of a pixel
+        assert (
+            shapely.hausdorff_distance(optimized.geometry.boundary, geom.boundary)
+            <= 0.25 * 100 / 111111
+        )
+
+        exact = ctx.optimize_cutline(preserve_pixels=True)
+        assert exact.geometry.equals(geom)
+
+        shaped = geocontext.AOI(geometry=geom, shape=(100, 100), crs="EPSG:4326")
+        assert len(shaped.optimize_cutline().geometry.exterior.coords) < len(
+            geom.exterior.coords
+        )
+
+        with pytest.raises(ValueError):
+            geocontext.AOI(bounds=(0, 0, 1, 1), resolution=1).optimize_cutline()
+        with pytest.raises(ValueError):
+            geocontext.AOI(geometry=geom).optimize_cutline()
+
     def test_assign_update_bounds(self):
         geom = shapely.geometry.Point(-90, 30).buffer(1).envelope
         ctx = geocontext.AOI(geometry=geom, resolution=40)
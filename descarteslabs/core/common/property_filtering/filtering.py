@@ -16,11 +16,121 @@
 import functools
 import inspect
 import json
+import operator
 import re
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Tuple, Type, TypeVar, Union
 
+import numpy as np
+
 AnyExpression = TypeVar("AnyExpression", bound="Expression")
 
+_RANGE_OPERATORS = {
+    "gte": operator.ge,
+    "gt": operator.gt,
+    "lte": operator.le,
+    "lt": operator.lt,
+}
+
+
+def to_datetime64(value):
+    """Convert a datetime or ISO formatted string to a UTC ``numpy.datetime64``."""
+    if value is None:
+        return np.datetime64("NaT", "us")
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+
+class _Columns(object):
+    # The columns of a table as numpy arrays, converted on first use
+
+    def __init__(self, table):
+        self._table = table
+        self._columns = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            pass
+
+        column = self._table[name]
+        dtype = getattr(column, "dtype", None)
+        if getattr(dtype, "tz", None) is not None:
+            # timezone aware pandas datetimes, compared in UTC
+            column = column.dt.tz_convert("UTC").dt.tz_localize(None)
+        if hasattr(column, "to_numpy"):
+            column = column.to_numpy()
+        else:
+            column = np.asarray(column)
+
+        self._columns[name] = column
+        return column
+
+
+def _isnull(column):
+    # Which values of a column are null, i.e. None, NaN or NaT
+    if column.dtype.kind == "f":
+        return np.isnan(column)
+    if column.dtype.kind == "M":
+        return np.isnat(column)
+    if column.dtype.kind == "O":
+        # NaN is the only value not equal to itself
+        return np.equal(column, None) | np.not_equal(column, column)
+    return np.zeros(len(column), dtype=bool)
+
+
+def _coerce(column, value):
+    # Convert a filter value to the type of the column it is compared to
+    if column.dtype.kind == "M":
+        return to_datetime64(value)
+    return value
+
+
+def _apply(column, op, value):
+    # Apply a comparison to the non-null values of a column
+    value = _coerce(column, value)
+    if column.dtype.kind != "O":
+        return np.asarray(op(column, value), dtype=bool)
+
+    mask = np.zeros(len(column), dtype=bool)
+    notnull = ~_isnull(column)
+    mask[notnull] = op(column[notnull], value)
+    return mask
+
+
+def _isin(column, values):
+    # Whether the values of a column are any of the given values, in a single
+    # hashed lookup rather than one comparison of the column per value
+    import pandas as pd
+
+    mask = np.zeros(len(column), dtype=bool)
+    if any(value is None for value in values):
+        mask |= _isnull(column)
+
+    # NaN is never equal to a value, as with an eq comparison
+    values = [
+        _coerce(column, value)
+        for value in values
+        if value is not None and value == value
+    ]
+    if values:
+        notnull = ~_isnull(column)
+        mask[notnull] |= pd.Series(column[notnull]).isin(values).to_numpy()
+    return mask
+
+
+def _match(column, pattern):
+    # Match the string values of a column against a compiled regular expression
+    return np.fromiter(
+        (isinstance(v, str) and pattern.match(v) is not None for v in column),
+        dtype=bool,
+        count=len(column),
+    )
+
 
 class Expression(object):
     """An expression is the result of a filtering operation.
@@ -125,6 +235,56 @@ class Expression(object):
     def jsonapi_serialize(self, model=None):
         raise NotImplementedError
 
+    def compile(self):
+        """Compile the expression into a vectorized predicate.
+
+        Rather than evaluating the expression for one object at a time, the
+        returned function evaluates it for all rows of a table at once, using
+        numpy array operations.
+
+        The table can be a :py:class:`pandas.DataFrame` (including a
+        :py:class:`geopandas.GeoDataFrame`), or a mapping of property names to
+        equal length numpy arrays (or sequences), such as the
+        :py:attr:`~descarteslabs.common.collection.Collection.columns` of a
+        columnar :py:class:`~descarteslabs.common.collection.Collection`.
+
+        Missing values (``None``, ``NaN`` or ``NaT``) only match
+        :py:attr:`Property.isnull` and ``!=`` comparisons.  Values compared to a
+        datetime column can be datetimes or ISO formatted strings, and are
+        interpreted as UTC when they have no timezone.
+
+        Returns
+        -------
+        callable
+            A function taking a table and returning a boolean numpy array with a
+            value for each row of the table.  It raises a `KeyError` if the
+            table is missing a property used in the expression.
+
+        Example
+        -------
+        >>> import pandas as pd
+        >>> from descarteslabs.common.property_filtering import Properties
+        >>> p = Properties()
+        >>> predicate = ((p.cloud_fraction < 0.2) & (p.product_id == "a")).compile()
+        >>> df = pd.DataFrame({"cloud_fraction": [0.1, 0.5], "product_id": ["a", "a"]})
+        >>> predicate(df)
+        array([ True, False])
+        >>> df[predicate(df)]  # doctest: +SKIP
+        """
+
+        def predicate(table):
+            return self._mask(_Columns(table))
+
+        return predicate
+
+    def _mask(self, columns):
+        """Evaluate the expression over a mapping of names to numpy arrays.
+
+        Returns a boolean array.  Raises a `KeyError` if a property is missing
+        from the columns.
+        """
+        raise NotImplementedError
+
     def is_same(self, other: Any) -> bool:
         """Determine if two expressions are the same. This is different
         from testing for equivalence (eg `a == b` and `b == a` are equivalent,
@@ -320,6 +480,12 @@ class EqExpression(OpExpression):
     def evaluate(self, obj):
         return getattr(obj, self.name) == self.value
 
+    def _mask(self, columns):
+        column = columns[self.name]
+        if self.value is None:
+            return _isnull(column)
+        return _apply(column, operator.eq, self.value)
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -347,6 +513,13 @@ class NeExpression(OpExpression):
     def evaluate(self, obj):
         return getattr(obj, self.name) != self.value
 
+    def _mask(self, columns):
+        column = columns[self.name]
+        if self.value is None:
+            return ~_isnull(column)
+        # null values are never equal to a value
+        return ~_apply(column, operator.eq, self.value)
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -400,6 +573,17 @@ class RangeExpression(OpExpression):
 
         return result
 
+    def _mask(self, columns):
+        column = columns[self.name]
+        mask = np.ones(len(column), dtype=bool)
+
+        for op, val in self.parts.items():
+            if op not in _RANGE_OPERATORS:
+                raise ValueError("Unknown operation")
+            mask &= _apply(column, _RANGE_OPERATORS[op], val)
+
+        return mask
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -435,6 +619,9 @@ class IsNullExpression(OpExpression):
     def evaluate(self, obj):
         return getattr(obj, self.name) is None
 
+    def _mask(self, columns):
+        return _isnull(columns[self.name])
+
     @classmethod
     def _parse_filter(cls, data: Any) -> Tuple[str, Any]:
         if not isinstance(data, str):
@@ -465,6 +652,9 @@ class IsNotNullExpression(OpExpression):
     def evaluate(self, obj):
         return getattr(obj, self.name) is not None
 
+    def _mask(self, columns):
+        return ~_isnull(columns[self.name])
+
     @classmethod
     def _parse_filter(cls, data: Any) -> Tuple[str, Any]:
         if not isinstance(data, str):
@@ -494,6 +684,9 @@ class PrefixExpression(OpExpression):
     def evaluate(self, obj):
         return getattr(obj, self.name).startswith(self.value)
 
+    def _mask(self, columns):
+        return _match(columns[self.name], re.compile(re.escape(self.value)))
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -529,6 +722,10 @@ class LikeExpression(OpExpression):
         expr = re.escape(self.value).replace("_", ".").replace("%", ".*")
         return re.match(f"^{expr}$", getattr(obj, self.name)) is not None
 
+    def _mask(self, columns):
+        expr = re.escape(self.value).replace("_", ".").replace("%", ".*")
+        return _match(columns[self.name], re.compile(f"^{expr}$"))
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -564,6 +761,10 @@ class ILikeExpression(OpExpression):
         expr = re.escape(self.value).replace("_", ".").replace("%", ".*")
         return re.match(f"^{expr}$", getattr(obj, self.name), re.IGNORECASE) is not None
 
+    def _mask(self, columns):
+        expr = re.escape(self.value).replace("_", ".").replace("%", ".*")
+        return _match(columns[self.name], re.compile(f"^{expr}$", re.IGNORECASE))
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -605,6 +806,13 @@ class AndExpression(LogicalExpression):
 
         return True
 
+    def _mask(self, columns):
+        mask = self.parts[0]._mask(columns)
+        for part in self.parts[1:]:
+            mask = mask & part._mask(columns)
+
+        return mask
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -649,6 +857,17 @@ class OrExpression(LogicalExpression):
 
         return False
 
+    def _mask(self, columns):
+        parts = membership_parts(self)
+        if parts is not None and len(parts) > 1:
+            return _isin(columns[parts[0].name], [part.value for part in parts])
+
+        mask = self.parts[0]._mask(columns)
+        for part in self.parts[1:]:
+            mask = mask | part._mask(columns)
+
+        return mask
+
     def is_same(self, other: Any) -> bool:
         if not super().is_same(other):
             return False
@@ -685,6 +904,32 @@ def check_can_filter(fn):
     return wrapper
 
 
+def membership_parts(expression):
+    """Return the comparisons of a set-membership expression.
+
+    A set-membership expression is an ``or`` of ``==`` comparisons of a single
+    property, as created by :py:meth:`Property.any_of`.
+
+    Parameters
+    ----------
+    expression : Expression
+        Any expression.
+
+    Returns
+    -------
+    list(EqExpression) or None
+        The comparisons, or ``None`` if the expression is not a set-membership
+        expression.
+    """
+    if type(expression) is not OrExpression or not expression.parts:
+        return None
+    if not all(type(part) is EqExpression for part in expression.parts):
+        return None
+    if len({part.name for part in expression.parts}) != 1:
+        return None
+    return expression.parts
+
+
 class Property(object):
     """A filter property that can be used in an expression.
 
@@ -0,0 +1,241 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client side planning of searches with large set-membership filters.
+
+A filter such as ``p.id.any_of(ids)`` with many values results in a very large
+request and a slow query.  Such a filter is split into several filters, each
+with a bounded number of values, which are searched concurrently and whose
+results are merged.
+"""
+
+import concurrent.futures
+import itertools
+import queue
+import threading
+
+from .filtering import AndExpression, OrExpression, membership_parts
+
+# The end of the results of a search, see _produce()
+_DONE = object()
+
+# The maximum number of results of a search which are buffered ahead of the
+# consumer, beyond which the search waits
+_MAX_BUFFERED_RESULTS = 1000
+
+
+def split_any_of(expression, max_values):
+    """Split the largest set-membership term of a filter into smaller terms.
+
+    A set-membership term is an ``or`` of ``==`` comparisons of a single
+    property, as created by
+    :py:meth:`Property.any_of <descarteslabs.common.property_filtering.filtering.Property.any_of>`.
+    Only a term that is the whole filter, or that is part of the top-level
+    ``and`` of the filter, is split.
+
+    Parameters
+    ----------
+    expression : Expression or None
+        The filter.
+    max_values : int
+        The maximum number of values in a set-membership term.
+
+    Returns
+    -------
+    list(Expression)
+        The filters, each with at most `max_values` values for the split term,
+        whose combined results are the results of the given filter.  This is a
+        list of just the given filter if there is no term with more than
+        `max_values` values.
+    """
+    if max_values < 1:
+        raise ValueError("max_values must be at least one")
+
+    if type(expression) is AndExpression:
+        terms = list(expression.parts)
+    else:
+        terms = [expression]
+
+    index = None
+    values = None
+    for i, term in enumerate(terms):
+        parts = membership_parts(term)
+        if parts is not None and (values is None or len(parts) > len(values)):
+            index, values = i, parts
+
+    if values is None or len(values) <= max_values:
+        return [expression]
+
+    # drop duplicate values, which would otherwise return duplicate results
+    unique = []
+    seen = set()
+    for part in values:
+        try:
+            key = part.value
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            pass
+        unique.append(part)
+
+    expressions = []
+    for start in range(0, len(unique), max_values):
+        chunk = unique[start : start + max_values]
+        term = OrExpression(chunk) if len(chunk) > 1 else chunk[0]
+        if len(terms) == 1:
+            expressions.append(term)
+        else:
+            # a new expression, since combining expressions modifies them
+            expressions.append(
+                AndExpression([term if i == index else t for i, t in enumerate(terms)])
+            )
+
+    return expressions
+
+
+def _sort_key(name):
+    # Sort missing values together, without comparing them to other values
+    def key(obj):
+        value = getattr(obj, name, None)
+        return (value is None, value)
+
+    return key
+
+
+def _put(results, item, stop):
+    # Put an item in a bounded queue, waiting for room unless stopped
+    while not stop.is_set():
+        try:
+            results.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _produce(search, results, stop):
+    # Put the results of a search in a queue, followed by _DONE
+    try:
+        for result in search:
+            if not _put(results, result, stop):
+                break
+    finally:
+        _put(results, _DONE, stop)
+
+
+def _stream(executor, searches):
+    # The results of searches run concurrently, in the order of the searches.
+    # Each search buffers a bounded number of results ahead of the consumer.
+    # The searches which have not started are cancelled, and those running stop
+    # at their next result, when the generator is closed.
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=_MAX_BUFFERED_RESULTS) for _ in searches]
+    futures = [
+        executor.submit(_produce, search, results, stop)
+        for search, results in zip(searches, queues)
+    ]
+    try:
+        for future, results in zip(futures, queues):
+            while True:
+                result = results.get()
+                if result is _DONE:
+                    break
+                yield result
+            # raise any failure of the search
+            future.result()
+    finally:
+        stop.set()
+        for future in futures:
+            future.cancel()
+
+
+def iter_concurrently(searches, max_workers, sorts=(), limit=None):
+    """Iterate over the merged results of several searches run concurrently.
+
+    Results are deduplicated by their ``id``.  Without `sorts`, the results are
+    returned in the order of the searches as they arrive, and the searches stop
+    once `limit` results have been returned.  With `sorts`, all results are
+    retrieved and sorted before being returned.
+
+    Parameters
+    ----------
+    searches : list(iterable)
+        The searches, for example one for each of the filters returned by
+        :py:func:`split_any_of`.
+    max_workers : int
+        The maximum number of searches run concurrently.
+    sorts : list(tuple(str, bool)), optional
+        The names of the attributes to sort by, and whether each sort is
+        ascending.
+    limit : int, optional
+        The maximum number of results.
+
+    Returns
+    -------
+    generator
+        The results.
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if sorts:
+            results = list(itertools.chain.from_iterable(executor.map(list, searches)))
+            # sort by the least significant key first, relying on a stable sort
+            for name, ascending in reversed(sorts):
+                results.sort(key=_sort_key(name), reverse=not ascending)
+        else:
+            results = _stream(executor, searches)
+
+        try:
+            seen = set()
+            count = 0
+            for result in results:
+                id_ = getattr(result, "id", None)
+                if id_ is not None:
+                    if id_ in seen:
+                        continue
+                    seen.add(id_)
+
+                yield result
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+        finally:
+            if not sorts:
+                results.close()
+
+
+def count_concurrently(searches, max_workers):
+    """Return the total count of several searches run concurrently.
+
+    Parameters
+    ----------
+    searches : list(object)
+        The searches, each with a ``count()`` method, for example one for each of
+        the filters returned by :py:func:`split_any_of`.
+    max_workers : int
+        The maximum number of searches run concurrently.
+
+    Returns
+    -------
+    int
+        The sum of the counts of the searches.  A document matched by more than
+        one search, such as one with several of the values of a split
+        multi-valued property, is counted once for each.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(lambda search: search.count(), searches))
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+import collections
+from datetime import datetime, timezone
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from ....catalog import MaskBand, Product
@@ -494,3 +497,78 @@ def test_parse_nested():
     assert isinstance(sub_or.parts[1], EqExpression)
     assert sub_or.parts[1].name == "field3"
     assert sub_or.parts[1].value == "value3"
+
+
+def test_compile():
+    p = Properties()
+    df = pd.DataFrame(
+        {
+            "cloud_fraction": [0.1, 0.5, None, 0.15],
+            "name": ["Foo_1", None, "bar_2", "foo_3"],
+            "acquired": pd.to_datetime(
+                ["2020-01-01", "2020-02-01", None, "2020-03-01"], utc=True
+            ),
+        }
+    )
+
+    def mask(expression, table=df):
+        result = expression.compile()(table)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == bool
+        return result.tolist()
+
+    assert mask(p.cloud_fraction < 0.2) == [True, False, False, True]
+    assert mask(0.12 < p.cloud_fraction <= 0.5) == [False, True, False, True]
+    assert mask(p.cloud_fraction == 0.5) == [False, True, False, False]
+    assert mask(p.cloud_fraction != 0.5) == [True, False, True, True]
+    assert mask(p.cloud_fraction.isnull) == [False, False, True, False]
+    assert mask(p.name.isnotnull) == [True, False, True, True]
+    assert mask(p.name.any_of(["Foo_1", "bar_2"])) == [True, False, True, False]
+    assert mask(p.name.any_of(["bar_2", None])) == [False, True, True, False]
+    # values of another type never match, as with ==
+    assert mask(p.cloud_fraction.any_of([0.5, 0.15, "0.1"])) == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert mask(
+        p.acquired.any_of(["2020-03-01", datetime(2020, 1, 1, tzinfo=timezone.utc)])
+    ) == [True, False, False, True]
+    assert mask(p.name.prefix("foo")) == [False, False, False, True]
+    assert mask(p.name.like("%_3")) == [False, False, False, True]
+    assert mask(p.name.ilike("foo%")) == [True, False, False, True]
+    assert mask(p.acquired >= "2020-02-01") == [False, True, False, True]
+    assert mask(p.acquired < datetime(2020, 2, 1, tzinfo=timezone.utc)) == [
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert mask(
+        (p.cloud_fraction < 0.2) & (p.acquired > "2020-01-15") | p.name.isnull
+    ) == [False, True, False, True]
+
+    columns = {"cloud_fraction": np.array([0.1, np.nan]), "name": ["a", None]}
+    assert mask(p.cloud_fraction.isnull | (p.name == "a"), columns) == [True, True]
+
+    with pytest.raises(KeyError):
+        mask(p.missing == 1)
+
+
+def test_compile_matches_evaluate():
+    Item = collections.namedtuple("Item", "a b")
+    items = [Item(1, "x"), Item(2, "y"), Item(3, "x"), Item(4, "z")]
+    columns = {"a": np.array([i.a for i in items]), "b": [i.b for i in items]}
+
+    p = Properties()
+    for expression in [
+        p.a > 2,
+        (p.a >= 2) & (p.b == "x"),
+        (p.a == 1) | (p.b != "x"),
+        p.b.any_of(["x", "z"]),
+        p.b.like("_"),
+    ]:
+        assert expression.compile()(columns).tolist() == [
+            bool(expression.evaluate(i)) for i in items
+        ]
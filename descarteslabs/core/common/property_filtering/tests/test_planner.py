@@ -0,0 +1,136 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import time
+from unittest.mock import patch
+
+import pytest
+
+from .. import Properties
+from ..filtering import AndExpression, EqExpression, OrExpression
+from .. import planner
+from ..planner import count_concurrently, iter_concurrently, split_any_of
+
+p = Properties()
+
+
+def test_split_any_of():
+    expression = p.id.any_of(range(5))
+    assert split_any_of(expression, 5) == [expression]
+
+    filters = split_any_of(expression, 2)
+    assert [f.serialize() for f in filters] == [
+        p.id.any_of([0, 1]).serialize(),
+        p.id.any_of([2, 3]).serialize(),
+        {"eq": {"id": 4}},
+    ]
+    assert isinstance(filters[2], EqExpression)
+
+
+def test_split_any_of_and():
+    expression = (
+        (p.status.any_of(["a", "b", "c"])) & p.id.any_of([1, 2, 1, 3]) & (p.size > 1)
+    )
+    filters = split_any_of(expression, 2)
+
+    assert len(filters) == 2
+    for f, ids in zip(filters, [[1, 2], [3]]):
+        assert isinstance(f, AndExpression)
+        assert len(f.parts) == 3
+        assert f.parts[0] is expression.parts[0]
+        assert f.parts[2] is expression.parts[2]
+    assert isinstance(filters[0].parts[1], OrExpression)
+    assert [part.value for part in filters[0].parts[1].parts] == [1, 2]
+    assert filters[1].parts[1].value == 3
+    # the original expression is unchanged
+    assert len(expression.parts[1].parts) == 4
+
+
+def test_split_any_of_unsplittable():
+    expression = (p.id == 1) | (p.name == 2) | (p.id == 3)
+    assert split_any_of(expression, 1) == [expression]
+    assert split_any_of(None, 1) == [None]
+
+    with pytest.raises(ValueError):
+        split_any_of(expression, 0)
+
+
+def test_iter_concurrently():
+    Item = collections.namedtuple("Item", "id rank")
+    searches = [
+        [Item("a", 3), Item("b", None)],
+        [Item("c", 1), Item("a", 3)],
+        [Item("d", 2)],
+    ]
+
+    assert [i.id for i in iter_concurrently(searches, 2)] == ["a", "b", "c", "d"]
+    assert [i.id for i in iter_concurrently(searches, 2, limit=3)] == ["a", "b", "c"]
+    assert [i.id for i in iter_concurrently(searches, 2, sorts=[("rank", True)])] == [
+        "c",
+        "d",
+        "a",
+        "b",
+    ]
+    assert [
+        i.id for i in iter_concurrently(searches, 2, sorts=[("rank", False)], limit=2)
+    ] == ["b", "a"]
+
+
+def test_iter_concurrently_limit():
+    consumed = []
+
+    def search(name, n):
+        for i in range(n):
+            consumed.append(name)
+            yield "{}{}".format(name, i)
+
+    searches = [search("a", 2), search("b", 1000000), search("c", 1000000)]
+    results = iter_concurrently(searches, 2, limit=5)
+    assert list(results) == ["a0", "a1", "b0", "b1", "b2"]
+    # the searches stop once the limit is reached
+    assert len(consumed) < 1000000
+
+
+def test_iter_concurrently_backpressure():
+    consumed = collections.Counter()
+
+    def search(name, n):
+        for i in range(n):
+            consumed[name] += 1
+            yield "{}{}".format(name, i)
+
+    with patch.object(planner, "_MAX_BUFFERED_RESULTS", 10):
+        results = iter_concurrently([search("a", 1000), search("b", 1000)], 2)
+        assert next(results) == "a0"
+        time.sleep(0.5)
+        # the searches wait for the consumer once their buffers are full
+        assert consumed["a"] <= 12
+        assert consumed["b"] <= 11
+        assert len(list(results)) == 1999
+
+
+def test_iter_concurrently_error():
+    def failing():
+        yield "a"
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        list(iter_concurrently([["b"], failing(), ["c"]], 2))
+
+
+def test_count_concurrently():
+    Search = collections.namedtuple("Search", "count")
+    searches = [Search(lambda: 2), Search(lambda: 0), Search(lambda: 5)]
+    assert count_concurrently(searches, 2) == 7
@@ -0,0 +1,186 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reduce the size of geometries sent in requests.
+
+Large geometries, such as coastlines, are sent verbatim as GeoJSON, both as the
+cutline when rastering and as the geometry when searching.  These functions
+simplify such geometries and quantize their coordinates, trading a bounded
+change of the geometry for a much smaller request.
+"""
+
+import json
+import math
+
+import shapely
+import shapely.geometry
+
+from . import geometry_like_to_shapely
+
+
+def _to_json(geometry):
+    return json.dumps(shapely.geometry.mapping(geometry), separators=(",", ":"))
+
+
+def _grid_size(tolerance):
+    # The largest power of ten at most a tenth of the tolerance, so that
+    # quantized coordinates move by at most a twentieth of the tolerance and
+    # have a short decimal representation
+    return 10 ** math.floor(math.log10(tolerance / 10))
+
+
+class GeometryPayload(object):
+    """A geometry optimized for a request, with the resulting reduction.
+
+    Attributes
+    ----------
+    geometry : shapely.geometry.base.BaseGeometry
+        The optimized geometry.
+    json : str
+        The optimized geometry as compact GeoJSON.
+    original_size : int
+        The size in bytes of the original geometry as compact GeoJSON.
+    """
+
+    def __init__(self, geometry, original_size):
+        self.geometry = geometry
+        self.json = _to_json(geometry)
+        self.original_size = original_size
+
+    @property
+    def size(self):
+        """int: The size in bytes of :py:attr:`json`."""
+        return len(self.json)
+
+    @property
+    def reduction(self):
+        """float: The fraction of the original size saved, between 0 and 1."""
+        if not self.original_size:
+            return 0.0
+        return 1 - self.size / self.original_size
+
+    def __repr__(self):
+        return "GeometryPayload(size={}, original_size={}, reduction={:.1%})".format(
+            self.size, self.original_size, self.reduction
+        )
+
+
+def _smallest(optimized, original):
+    # Never make the payload larger than the original geometry
+    payload = GeometryPayload(optimized, len(_to_json(original)))
+    if payload.size > payload.original_size:
+        payload = GeometryPayload(original, payload.original_size)
+    return payload
+
+
+def optimize_cutline(geometry, tolerance, preserve_pixels=False):
+    """Reduce the size of a geometry used to clip rasters.
+
+    The geometry is simplified so that its boundary moves by at most
+    `tolerance`, and its coordinates are quantized to a grid of at most a tenth
+    of `tolerance`.  For a `tolerance` that is a fraction of the output
+    resolution, only pixels along the boundary of the geometry may change.
+
+    Parameters
+    ----------
+    geometry : shapely.geometry.base.BaseGeometry, geojson-like
+        The geometry, in WGS84 coordinates.
+    tolerance : float
+        The maximum distance, in degrees, by which the boundary of the geometry
+        may move.
+    preserve_pixels : bool, optional
+        If True, the geometry is not changed at all, so that the raster is
+        guaranteed to be identical.  Only redundant vertices are removed and
+        the coordinates are not quantized.  Defaults to False.
+
+    Returns
+    -------
+    GeometryPayload
+        The optimized geometry.
+
+    Raises
+    ------
+    ValueError
+        If `tolerance` is not positive.
+    """
+    if not tolerance > 0:
+        raise ValueError("tolerance must be greater than zero")
+
+    shape = geometry_like_to_shapely(geometry)
+
+    if preserve_pixels:
+        # only removes repeated and collinear vertices
+        optimized = shapely.simplify(shape, 0)
+        if not optimized.equals(shape):
+            optimized = shape
+    else:
+        optimized = shapely.simplify(shape, tolerance, preserve_topology=True)
+        optimized = shapely.set_precision(optimized, _grid_size(tolerance))
+        if optimized.is_empty:
+            optimized = shape
+
+    return _smallest(optimized, shape)
+
+
+def optimize_intersects(geometry, tolerance=None):
+    """Reduce the size of a geometry used to search by intersection.
+
+    The geometry is replaced by a simplified outer envelope that contains the
+    whole geometry, within about three times `tolerance` of it, with quantized
+    coordinates.  A search with the envelope finds every result a search with
+    the geometry finds, and may find some results within that distance of the
+    geometry.
+
+    Parameters
+    ----------
+    geometry : shapely.geometry.base.BaseGeometry, geojson-like
+        The geometry, in WGS84 coordinates.
+    tolerance : float, optional
+        The tolerance of the simplification, in degrees.  Defaults to a
+        thousandth of the larger side of the bounding box of the geometry.
+
+    Returns
+    -------
+    GeometryPayload
+        The optimized geometry, or the original geometry if it could not be
+        reduced.
+
+    Raises
+    ------
+    ValueError
+        If `tolerance` is not positive.
+    """
+    shape = geometry_like_to_shapely(geometry)
+
+    if tolerance is None:
+        minx, miny, maxx, maxy = shape.bounds
+        tolerance = max(maxx - minx, maxy - miny) / 1000
+        if not tolerance > 0:
+            return _smallest(shape, shape)
+    elif not tolerance > 0:
+        raise ValueError("tolerance must be greater than zero")
+
+    grid_size = _grid_size(tolerance)
+
+    # simplifying moves the boundary by up to the tolerance, and quantizing by
+    # up to half the grid size, so grow the geometry by more than both first
+    envelope = shapely.buffer(shape, 2 * tolerance + grid_size, quad_segs=2)
+    envelope = shapely.simplify(envelope, tolerance, preserve_topology=True)
+    envelope = shapely.set_precision(envelope, grid_size)
+
+    if envelope.is_empty or not envelope.covers(shape):
+        envelope = shape
+
+    return _smallest(envelope, shape)
@@ -0,0 +1,90 @@
+# © 2025 EarthDaily Analytics Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+import pytest
+import shapely
+import shapely.geometry
+
+from ..optimize import optimize_cutline, optimize_intersects
+
+
+class OptimizeTest(unittest.TestCase):
+    def setUp(self):
+        # a detailed "coastline"
+        self.geometry = shapely.geometry.Point(-95.123456789, 41.987654321).buffer(
+            0.5, quad_segs=256
+        )
+
+    def test_optimize_cutline(self):
+        tolerance = 0.001
+        payload = optimize_cutline(self.geometry.__geo_interface__, tolerance)
+
+        assert payload.size < payload.original_size / 4
+        assert 0.75 < payload.reduction < 1
+        assert json.loads(payload.json) == json.loads(
+            json.dumps(shapely.geometry.mapping(payload.geometry))
+        )
+        assert payload.geometry.is_valid
+        # the boundary moves by no more than the tolerance
+        assert (
+            shapely.hausdorff_distance(
+                payload.geometry.boundary, self.geometry.boundary
+            )
+            <= tolerance
+        )
+        # the coordinates are quantized
+        assert all(
+            round(x, 4) == x and round(y, 4) == y
+            for x, y in payload.geometry.exterior.coords
+        )
+
+        with pytest.raises(ValueError):
+            optimize_cutline(self.geometry, 0)
+
+    def test_optimize_cutline_preserve_pixels(self):
+        box = shapely.geometry.Polygon(
+            [(0.1, 0.1), (0.5, 0.1), (1.1, 0.1), (1.1, 1.1), (0.1, 1.1), (0.1, 0.1)]
+        )
+        payload = optimize_cutline(box, 0.5, preserve_pixels=True)
+        assert payload.geometry.equals(box)
+        assert len(payload.geometry.exterior.coords) == 5
+        assert payload.reduction > 0
+
+        payload = optimize_cutline(self.geometry, 0.001, preserve_pixels=True)
+        assert payload.geometry.equals(self.geometry)
+        assert payload.reduction == 0
+
+    def test_optimize_intersects(self):
+        payload = optimize_intersects(self.geometry)
+
+        assert payload.size < payload.original_size / 4
+        assert payload.geometry.covers(self.geometry)
+        assert shapely.hausdorff_distance(payload.geometry, self.geometry) < 0.01
+
+        points = shapely.geometry.MultiPoint(
+            list(self.geometry.exterior.coords)
+        ).buffer(0.0001)
+        assert optimize_intersects(points, tolerance=0.01).geometry.covers(points)
+
+        # a geometry that cannot be reduced is not changed
+        box = shapely.geometry.box(0, 0, 1, 1)
+        payload = optimize_intersects(box)
+        assert payload.geometry.equals(box)
+        assert payload.reduction >= 0
+
+        with pytest.raises(ValueError):
+            optimize_intersects(self.geometry, tolerance=-1)
@@ -61,8 +61,6 @@ from .exceptions import BoundGlobalError
 from .job import Job, JobSearch, JobStatus
 from .result import Serializable
 
-MAX_FUNCTION_IDS_PER_REQUEST = 128
-
 
 def batched(iterable, n):
     """Batch an iterable into lists of size n"""
@@ -1404,7 +1402,6 @@ class Function(Document):
             job_ids.add(job.id)
 
         current_interval = interval
-        chunk_size = MAX_FUNCTION_IDS_PER_REQUEST
         start_time = time.time()
         while job_ids:
             self.refresh()
@@ -1414,19 +1411,12 @@ class Function(Document):
                 )
 
             hits = set()
-            query_ids = {job_id for job_id in job_ids}
-            # refresh the job state, but only a chunk at a time
-            while query_ids:
-                chunk_ids = set(
-                    itertools.islice(query_ids, min(chunk_size, len(query_ids)))
-                )
-                query_ids -= chunk_ids
-
-                for job in Job.search(client=self._client).filter(
-                    Job.id.in_(list(chunk_ids)) & Job.status.in_(JobStatus.terminal())
-                ):
-                    hits.add(job.id)
-                    yield job
+            # refresh the job state, the search splits the ids into chunks
+            for job in Job.search(client=self._client).filter(
+                Job.id.in_(list(job_ids)) & Job.status.in_(JobStatus.terminal())
+            ):
+                hits.add(job.id)
+                yield job
 
             job_ids -= hits
 
@@ -39,6 +39,9 @@ def do_setup():
         "matplotlib>=3.1.2",
         "ipyleaflet>=0.17.2",
     ]
+    fsspec_requires = [
+        "fsspec>=2023.1.0",
+    ]
     tests_requires = [
         "pytest==6.0.0",
         "responses==0.12.1",
@@ -75,7 +78,10 @@ def do_setup():
         entry_points={
             "console_scripts": [
                 "descarteslabs = descarteslabs.core.client.scripts.__main__:main"
-            ]
+            ],
+            "fsspec.specs": [
+                "dlblob = descarteslabs.core.catalog.blob_fs:BlobFileSystem"
+            ],
         },
         python_requires="~=3.10",
         install_requires=[
@@ -105,7 +111,8 @@ def do_setup():
         ],
         extras_require={
             "visualization": viz_requires,
-            "complete": viz_requires,
+            "fsspec": fsspec_requires,
+            "complete": viz_requires + fsspec_requires,
             "tests": tests_requires,
         },
         data_files=[("docs/descarteslabs", ["README.md"])],